@@ -7,6 +7,11 @@ noise reduction, and real-time audio processing features.
 
 import os
 import sys
+import array
+import ctypes
+import math
+import mmap
+import struct
 import subprocess
 import tempfile
 import time
@@ -14,16 +19,345 @@ import logging
 import threading
 import shutil
 import platform
+import re
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
-import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Optional, Callable, Dict, Any, List, Sequence, Tuple
+import collections
 import json
 import signal
 
+import wave
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy import signal as scipy_signal
+    SCIPY_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = NUMPY_AVAILABLE
+except (ImportError, OSError):
+    # OSError is raised by sounddevice when the PortAudio library is missing
+    SOUNDDEVICE_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in so jitted kernels still run as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Compiled lazily on first call (and cached on disk), so importing this module
+# never waits on numba
+@njit(cache=True, fastmath=True)
+def _vad_segment(x, win, hop, sil_thr, min_speech, max_silence):
+    """
+    Run the silence-stop state machine over a whole int16 buffer in one pass.
+    
+    Window sizes and durations are in samples. Returns (speech_start, end, stopped)
+    where speech_start is -1 if no speech was found and end is the sample index
+    at which recording should stop (or len(x) if it should not).
+    """
+    n = x.shape[0]
+    speech_start = -1
+    silence_start = -1
+    pos = 0
+    while pos + win <= n:
+        acc = 0
+        for i in range(pos, pos + win):
+            v = np.int64(x[i])
+            acc += v * v
+        rms = np.sqrt(acc / win) / 32768.0
+        end = pos + win
+        
+        if rms > sil_thr:
+            # Speech detected, reset silence timer
+            silence_start = -1
+            if speech_start < 0:
+                speech_start = pos
+        else:
+            if silence_start < 0:
+                silence_start = pos
+            if (speech_start >= 0 and end > min_speech and
+                    end - silence_start > max_silence):
+                return speech_start, end, True
+        pos += hop
+    
+    return speech_start, n, False
+
+
+def _to_float_samples(x: "np.ndarray") -> "np.ndarray":
+    """Return samples as floats in [-1, 1], scaling integer PCM buffers."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.integer):
+        return x.astype(np.float32) / float(np.iinfo(x.dtype).max + 1)
+    return x
+
+
+def _transcription_kernel(x: "np.ndarray", sample_rate: int, target_sr: int = 16000,
+                          normalize: bool = True) -> "np.ndarray":
+    """
+    In-memory equivalent of the SoX resample + band-limit + normalize chain.
+    
+    Mixes to mono, resamples with a polyphase filter, applies an 80 Hz
+    high-pass (plus an 8 kHz low-pass when that is below Nyquist) and peak
+    normalizes. The filters are 2-pole Butterworths like SoX's highpass and
+    lowpass. There is no compand or noisered stage, which is why file
+    processing always goes through SoX. Returns float32 samples at `target_sr`.
+    """
+    if x.ndim > 1:
+        x = x.mean(axis=1)
+    if sample_rate != target_sr:
+        g = math.gcd(int(target_sr), int(sample_rate))
+        x = scipy_signal.resample_poly(x, target_sr // g, sample_rate // g)
+    
+    sos = scipy_signal.butter(2, 80, btype='highpass', fs=target_sr, output='sos')
+    if 8000 < target_sr / 2:
+        sos = np.vstack([sos, scipy_signal.butter(2, 8000, btype='lowpass', fs=target_sr, output='sos')])
+    y = scipy_signal.sosfilt(sos, x)
+    
+    if normalize and y.size:
+        y = y / max(1e-9, float(np.max(np.abs(y))))
+    return y.astype(np.float32)
+
+
+# WAVE format tags mapped to SoX-style sample encoding names
+_WAV_ENCODINGS = {
+    1: "Signed Integer PCM",
+    3: "Floating Point PCM",
+    0xFFFE: "Signed Integer PCM"  # WAVE_FORMAT_EXTENSIBLE, assumed PCM
+}
+
+
+def _read_wav_header(audio_file: str) -> Optional[Dict[str, Any]]:
+    """
+    Read format information from a RIFF/WAVE header without decoding audio.
+    
+    The file is memory-mapped and only the chunk headers are touched. Returns
+    a dict with the same keys as SoX --info, or None if the file is not a
+    WAV file this parser understands.
+    """
+    with open(audio_file, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size < 12:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if m[0:4] != b'RIFF' or m[8:12] != b'WAVE':
+                return None
+            
+            fmt = None
+            data_size = None
+            pos = 12
+            while pos + 8 <= file_size:
+                chunk_id = m[pos:pos + 4]
+                chunk_size = struct.unpack_from('<I', m, pos + 4)[0]
+                body = pos + 8
+                if chunk_id == b'fmt ':
+                    fmt = struct.unpack_from('<HHIIHH', m, body)
+                elif chunk_id == b'data':
+                    data_size = min(chunk_size, file_size - body)
+                    break
+                pos = body + chunk_size + (chunk_size & 1)  # Chunks are word-aligned
+    
+    if fmt is None or data_size is None:
+        return None
+    
+    audio_format, channels, sample_rate, byte_rate, _, bits = fmt
+    encoding = _WAV_ENCODINGS.get(audio_format)
+    if encoding is None:
+        return None
+    if bits == 8 and encoding == "Signed Integer PCM":
+        encoding = "Unsigned Integer PCM"
+    
+    return {
+        'input_file': f"'{audio_file}'",
+        'channels': channels,
+        'sample_rate': sample_rate,
+        'precision': bits,
+        'duration': data_size / byte_rate if byte_rate else 0.0,
+        'sample_encoding': f"{bits}-bit {encoding}",
+        'file_size': file_size
+    }
+
+
+def _read_wav(audio_file: str) -> Tuple["np.ndarray", int]:
+    """Read a PCM WAV file into float32 samples in [-1, 1] (shape: frames x channels)."""
+    with wave.open(str(audio_file), 'rb') as wav_file:
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        sample_rate = wav_file.getframerate()
+        raw = wav_file.readframes(wav_file.getnframes())
+    
+    if sample_width == 1:
+        x = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif sample_width == 2:
+        x = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768.0
+    elif sample_width == 4:
+        x = np.frombuffer(raw, dtype='<i4').astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width} bytes")
+    
+    return x.reshape(-1, channels), sample_rate
+
+
+# SoX noisered amounts for each noise reduction level
+NOISE_REDUCTION_LEVELS = {
+    "light": "0.15",
+    "medium": "0.25",
+    "heavy": "0.35"
+}
+
+# "Key : value" lines in SoX --info / stat output
+_FIELD_RE = re.compile(r'^\s*([A-Za-z][A-Za-z ()]*?)\s*:\s*(.+?)\s*$', re.M)
+_FIELD_RE_BYTES = re.compile(br'^\s*([A-Za-z][A-Za-z ()]*?)\s*:\s*(.+?)\s*$', re.M)
+_DURATION_RE = re.compile(r'(\d+):(\d+):([\d.]+)')
+_INT_RE = re.compile(r'\d+')
+
+# SoX stat field names (parsed from raw stderr bytes) mapped to our stats keys
+_STAT_FIELDS = {
+    b'length_(seconds)': 'length',
+    b'rms_amplitude': 'rms_amplitude',
+    b'maximum_amplitude': 'max_amplitude',
+    b'mean_amplitude': 'mean_amplitude'
+}
+
+
+# `sox --i` flags for batched queries: info key -> (flag, coercer)
+_SOXI_FIELDS = {
+    'sample_rate': ("-r", int),
+    'channels': ("-c", int),
+    'precision': ("-p", int),
+    'duration': ("-D", float),
+    'sample_encoding': ("-e", str)
+}
+
+
+def _parse_fields(output):
+    """
+    Split SoX "Key : value" output into a dict keyed by normalized field name.
+    
+    Accepts str or bytes; keys and values keep the type of the input so that
+    raw subprocess output can be parsed without decoding it first.
+    """
+    if isinstance(output, bytes):
+        regex, sep = _FIELD_RE_BYTES, b'_'
+    else:
+        regex, sep = _FIELD_RE, '_'
+    return {sep.join(m.group(1).lower().split()): m.group(2) for m in regex.finditer(output)}
+
+
+def _leading_int(value: str) -> int:
+    """Parse the leading integer of values such as "16000" or "16-bit"."""
+    match = _INT_RE.match(value)
+    if not match:
+        raise ValueError(value)
+    return int(match.group())
+
+
+def _duration_seconds(value: str) -> float:
+    """Parse a SoX duration such as "00:00:05.23 = 83680 samples" into seconds."""
+    match = _DURATION_RE.match(value)
+    if not match:
+        raise ValueError(value)
+    hours, minutes, seconds = match.groups()
+    return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
+
+
+# Coercers for numeric fields in SoX --info output
+_INFO_COERCERS = {
+    'sample_rate': _leading_int,
+    'channels': _leading_int,
+    'precision': _leading_int,
+    'duration': _duration_seconds
+}
+
+
+# 50 ms of 8kHz 16-bit mono PCM read per level update from the SoX monitor stream
+_MONITOR_BLOCK_BYTES = 800
+
+# Invariant SoX argument tails, built once rather than per command
+_MONITOR_OUTPUT_ARGS = ("-t", "raw", "-r", "8000", "-c", "1", "-e", "signed", "-b", "16", "-")
+_NORMALIZE_ARGS = ("gain", "-n")
+
+# Effect chain of optimize_for_transcription; noisered follows the gain stage
+_TRANSCRIPTION_EFFECT_ARGS = (
+    "highpass", "80",   # Remove very low frequencies
+    "lowpass", "8000",  # Remove frequencies above speech range
+    "compand", "0.1,0.3", "-60,-60,-30,-15,-20,-10,-5,-5,0,-3", "6",  # Gentle compression
+    *_NORMALIZE_ARGS
+)
+_TRANSCRIPTION_NOISERED_ARGS = ("noisered", "0.2")
+
+# Effect chain of apply_noise_reduction, ahead of its noisered and optional gain stages
+_NOISE_REDUCTION_EFFECT_ARGS = (
+    "highpass", "200",  # Remove low-frequency noise
+    "lowpass", "8000",  # Remove high-frequency noise
+    "compand", "0.02,0.20", "5:-60,-40,-10", "-5", "-90", "0.1",  # Dynamic range compression
+)
+
+
+# macOS QoS class for latency-sensitive work (from <sys/qos.h>)
+_QOS_CLASS_USER_INTERACTIVE = 0x21
+
+
+def _raise_thread_priority():
+    """Best-effort request for user-interactive scheduling of the calling thread on macOS."""
+    if platform.system() != "Darwin":
+        return
+    try:
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib")
+        libsystem.pthread_set_qos_class_self_np(_QOS_CLASS_USER_INTERACTIVE, 0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _int16_rms(buf: "np.ndarray") -> float:
+    """Normalized RMS of an int16 buffer using an integer sum of squares."""
+    if buf.size == 0:
+        return 0.0
+    acc = int(np.sum(np.square(buf, dtype=np.int32), dtype=np.int64))
+    return math.sqrt(acc / buf.size) / 32768.0
+
+
+def _pcm16_rms(data: bytes) -> float:
+    """Compute the normalized RMS level of little-endian 16-bit PCM bytes."""
+    data = data[:len(data) - (len(data) % 2)]
+    if not data:
+        return 0.0
+    if NUMPY_AVAILABLE:
+        return _int16_rms(np.frombuffer(data, dtype='<i2'))
+    samples = array.array('h', data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return math.sqrt(sum(v * v for v in samples) / len(samples)) / 32768.0
+
 
 class AudioDevice:
     """Represents an audio input device."""
     
+    __slots__ = ("device_id", "name", "description", "is_default")
+    
     def __init__(self, device_id: str, name: str, description: str = "", is_default: bool = False):
         self.device_id = device_id
         self.name = name
@@ -31,26 +365,42 @@ class AudioDevice:
         self.is_default = is_default
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "device_id": self.device_id,
-            "name": self.name,
-            "description": self.description,
-            "is_default": self.is_default
-        }
+        return {field: getattr(self, field) for field in self.__slots__}
     
     def __str__(self) -> str:
         return f"{self.name} ({self.device_id})" + (" [Default]" if self.is_default else "")
 
 
+def _iter_sources(item: Dict[str, Any]):
+    """Yield the input source dicts of a system_profiler audio item (list or single dict)."""
+    sources = item.get('coreaudio_input_source')
+    if isinstance(sources, dict):
+        yield sources
+    elif isinstance(sources, list):
+        yield from sources
+
+
+def _to_device(parent_name: str, source: Dict[str, Any]) -> AudioDevice:
+    """Build an AudioDevice from a system_profiler input source."""
+    return AudioDevice(
+        device_id=source.get('coreaudio_device_id', 'unknown'),
+        name=source.get('_name', 'Unknown Device'),
+        description=f"{parent_name} - {source.get('_name', '')}"
+    )
+
+
 class AudioLevelMonitor:
-    """Real-time audio level monitoring using SoX."""
+    """Real-time audio level monitoring using a PortAudio stream (SoX fallback)."""
     
     def __init__(self, sox_path: str):
         self.sox_path = sox_path
+        self._sox_prefix = (sox_path,)
         self.is_monitoring = False
         self.monitor_process = None
-        self.level_queue = queue.Queue(maxsize=100)
+        self.stream = None
+        self.level_queue = collections.deque(maxlen=1)  # Only the latest level matters
         self.monitor_thread = None
+        self._stop_evt = threading.Event()
         self.logger = logging.getLogger(__name__ + ".AudioLevelMonitor")
     
     def start_monitoring(self, device_id: Optional[str] = None) -> bool:
@@ -58,19 +408,24 @@ class AudioLevelMonitor:
         if self.is_monitoring:
             return True
         
+        if SOUNDDEVICE_AVAILABLE and self._start_stream(device_id):
+            return True
+        
         try:
-            # Build SoX command for level monitoring
+            # Stream raw 8kHz 16-bit mono PCM from a single long-running SoX process
             input_source = device_id if device_id else "-d"
-            cmd = [
-                self.sox_path,
-                input_source,
-                "-t", "null", "-",
-                "trim", "0", "0.1",  # Sample 0.1 seconds
-                "stats"
-            ]
+            cmd = [*self._sox_prefix, input_source, *_MONITOR_OUTPUT_ARGS]
+            
+            self.monitor_process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
             
             self.is_monitoring = True
-            self.monitor_thread = threading.Thread(target=self._monitor_levels, args=(cmd,))
+            self._stop_evt.clear()
+            self.monitor_thread = threading.Thread(target=self._monitor_levels, daemon=True)
             self.monitor_thread.start()
             
             self.logger.info("Audio level monitoring started")
@@ -81,69 +436,94 @@ class AudioLevelMonitor:
             self.is_monitoring = False
             return False
     
-    def _monitor_levels(self, cmd: List[str]):
-        """Monitor audio levels in a separate thread."""
-        while self.is_monitoring:
+    def _start_stream(self, device_id: Optional[str] = None) -> bool:
+        """Open a long-lived input stream that computes levels in the audio callback."""
+        try:
+            device = None if device_id in (None, "default") else device_id
+            self.stream = sd.InputStream(
+                samplerate=16000,
+                channels=1,
+                blocksize=1600,  # 0.1 seconds per callback
+                dtype='int16',
+                device=device,
+                latency='low',
+                callback=self._stream_callback
+            )
+            self.stream.start()
+            self.is_monitoring = True
+            
+            self.logger.info("Audio level monitoring started (sounddevice)")
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"sounddevice monitoring unavailable, falling back to SoX: {e}")
+            self.stream = None
+            return False
+    
+    def _stream_callback(self, indata, frames, time_info, status):
+        """Compute the RMS level of each captured block (runs on the PortAudio thread)."""
+        self.level_queue.append(_int16_rms(indata.reshape(-1)))
+    
+    def _monitor_levels(self):
+        """Read PCM blocks from the SoX stream and compute levels (SoX fallback path)."""
+        _raise_thread_priority()
+        stdout = self.monitor_process.stdout
+        while not self._stop_evt.is_set():
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=1
-                )
-                
-                # Parse RMS level from SoX stats output
-                rms_level = self._parse_rms_level(result.stderr)
-                if rms_level is not None:
-                    try:
-                        self.level_queue.put_nowait(rms_level)
-                    except queue.Full:
-                        # Remove old value and add new one
-                        try:
-                            self.level_queue.get_nowait()
-                            self.level_queue.put_nowait(rms_level)
-                        except queue.Empty:
-                            pass
+                # Blocking read of 50 ms of audio (8000 Hz * 2 bytes * 0.05 s)
+                data = stdout.read(_MONITOR_BLOCK_BYTES)
+                if not data:
+                    break
                 
-                time.sleep(0.05)  # 20 FPS monitoring
+                self.level_queue.append(_pcm16_rms(data))
                 
-            except subprocess.TimeoutExpired:
-                continue
             except Exception as e:
-                if self.is_monitoring:
+                if not self._stop_evt.is_set():
                     self.logger.warning(f"Audio level monitoring error: {e}")
                 break
     
-    def _parse_rms_level(self, stats_output: str) -> Optional[float]:
-        """Parse RMS level from SoX stats output."""
-        try:
-            for line in stats_output.split('\n'):
-                if 'RMS amplitude:' in line:
-                    rms_str = line.split(':')[1].strip()
-                    return float(rms_str)
-        except Exception:
-            pass
-        return None
-    
     def get_current_level(self) -> Optional[float]:
         """Get the current audio level."""
         try:
-            return self.level_queue.get_nowait()
-        except queue.Empty:
+            return self.level_queue[-1]
+        except IndexError:
             return None
     
     def stop_monitoring(self):
         """Stop audio level monitoring."""
         self.is_monitoring = False
+        self._stop_evt.set()
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing audio stream: {e}")
+            self.stream = None
+        if self.monitor_process is not None:
+            try:
+                self.monitor_process.terminate()
+                self.monitor_process.wait(timeout=2)
+            except Exception as e:
+                self.logger.warning(f"Error stopping SoX level monitor: {e}")
+            self.monitor_process = None
         if self.monitor_thread and self.monitor_thread.is_alive():
+            # Terminating SoX closes its stdout, so the reader wakes immediately
             self.monitor_thread.join(timeout=2)
 
 
 class VoiceActivityDetector:
     """Voice activity detection for auto-start/stop recording."""
     
-    def __init__(self, sox_path: str):
-        self.sox_path = sox_path
+    def __init__(self, sox_path: Optional[str] = None, find_sox: Optional[Callable[[], str]] = None):
+        """
+        Args:
+            sox_path: Path to the SoX executable.
+            find_sox: Resolves the SoX path on first use when `sox_path` is None,
+                so WAV files analyzed in-process never require SoX.
+        """
+        self._sox_path = sox_path
+        self._find_sox = find_sox
         self.logger = logging.getLogger(__name__ + ".VoiceActivityDetector")
         
         # VAD parameters
@@ -157,52 +537,89 @@ class VoiceActivityDetector:
         self.speech_start_time = None
         self.silence_start_time = None
     
+    @property
+    def sox_path(self) -> str:
+        """Path to the SoX executable, resolved on first use."""
+        if self._sox_path is None:
+            if self._find_sox is None:
+                raise RuntimeError("SoX not found. Install with: brew install sox")
+            self._sox_path = self._find_sox()
+        return self._sox_path
+    
     def analyze_audio_segment(self, audio_file: str) -> Dict[str, Any]:
         """Analyze an audio segment for voice activity."""
         try:
+            if NUMPY_AVAILABLE and str(audio_file).lower().endswith('.wav'):
+                # Analyze PCM WAV files in-process; formats the wave module
+                # can't decode (24-bit, float) fall through to SoX
+                try:
+                    x, sample_rate = _read_wav(audio_file)
+                except (ValueError, wave.Error) as e:
+                    self.logger.debug(f"In-process WAV read failed, using SoX: {e}")
+                else:
+                    return self.analyze_samples(x, sample_rate)
+            
             # Get audio statistics using SoX
             cmd = [self.sox_path, audio_file, "-n", "stats"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = subprocess.run(cmd, capture_output=True, timeout=5)
             
             # Parse statistics
-            stats = self._parse_audio_stats(result.stderr)
-            
-            # Determine if speech is present
-            rms_level = stats.get('rms_amplitude', 0.0)
-            max_level = stats.get('max_amplitude', 0.0)
-            
-            has_speech = (
-                rms_level > self.speech_threshold or 
-                max_level > self.silence_threshold * 3
-            )
-            
-            return {
-                'has_speech': has_speech,
-                'rms_level': rms_level,
-                'max_level': max_level,
-                'duration': stats.get('length', 0.0),
-                'stats': stats
-            }
+            return self._classify(self._parse_audio_stats(result.stderr))
             
         except Exception as e:
             self.logger.error(f"Voice activity analysis failed: {e}")
             return {'has_speech': False, 'error': str(e)}
     
-    def _parse_audio_stats(self, stats_output: str) -> Dict[str, float]:
-        """Parse audio statistics from SoX output."""
-        stats = {}
+    def analyze_samples(self, x: "np.ndarray", sample_rate: int) -> Dict[str, Any]:
+        """Analyze in-memory samples (1-D or frames x channels) for voice activity."""
         try:
-            for line in stats_output.split('\n'):
-                if 'Length (seconds):' in line:
-                    stats['length'] = float(line.split(':')[1].strip())
-                elif 'RMS amplitude:' in line:
-                    stats['rms_amplitude'] = float(line.split(':')[1].strip())
-                elif 'Maximum amplitude:' in line:
-                    stats['max_amplitude'] = float(line.split(':')[1].strip())
-                elif 'Mean amplitude:' in line:
-                    stats['mean_amplitude'] = float(line.split(':')[1].strip())
+            return self._classify(self._sample_stats(_to_float_samples(x), sample_rate))
         except Exception as e:
-            self.logger.warning(f"Failed to parse some audio stats: {e}")
+            self.logger.error(f"Voice activity analysis failed: {e}")
+            return {'has_speech': False, 'error': str(e)}
+    
+    def _classify(self, stats: Dict[str, float]) -> Dict[str, Any]:
+        """Build the VAD result dict from audio statistics."""
+        # Determine if speech is present
+        rms_level = stats.get('rms_amplitude', 0.0)
+        max_level = stats.get('max_amplitude', 0.0)
+        
+        has_speech = (
+            rms_level > self.speech_threshold or 
+            max_level > self.silence_threshold * 3
+        )
+        
+        return {
+            'has_speech': has_speech,
+            'rms_level': rms_level,
+            'max_level': max_level,
+            'duration': stats.get('length', 0.0),
+            'stats': stats
+        }
+    
+    def _sample_stats(self, x: "np.ndarray", sample_rate: int) -> Dict[str, float]:
+        """Compute the same statistics as `sox stats` directly from float samples."""
+        if x.size == 0:
+            return {'length': 0.0, 'rms_amplitude': 0.0, 'max_amplitude': 0.0, 'mean_amplitude': 0.0}
+        
+        return {
+            'length': x.shape[0] / sample_rate,
+            'rms_amplitude': float(np.sqrt(np.mean(x * x))),
+            'max_amplitude': float(np.max(np.abs(x))),
+            'mean_amplitude': float(np.mean(x))
+        }
+    
+    def _parse_audio_stats(self, stats_output: bytes) -> Dict[str, float]:
+        """Parse audio statistics from raw SoX stderr output."""
+        stats = {}
+        for field, value in _parse_fields(stats_output).items():
+            key = _STAT_FIELDS.get(field)
+            if key is None:
+                continue
+            try:
+                stats[key] = float(value)
+            except ValueError as e:
+                self.logger.warning(f"Failed to parse audio stat {field.decode('ascii')}: {e}")
         
         return stats
     
@@ -212,29 +629,54 @@ class VoiceActivityDetector:
     
     def should_stop_recording(self, current_level: float, recording_duration: float) -> bool:
         """Determine if recording should stop based on silence detection."""
-        current_time = time.time()
+        now = time.monotonic()
+        is_silent = current_level <= self.silence_threshold
         
-        if current_level > self.silence_threshold:
-            # Speech detected, reset silence timer
-            self.silence_start_time = None
-            if not self.is_speech_detected:
-                self.is_speech_detected = True
-                self.speech_start_time = current_time
-        else:
-            # Silence detected
+        if not is_silent and not self.is_speech_detected:
+            self.is_speech_detected = True
+            self.speech_start_time = now
+        
+        # Speech resets the silence timer; silence starts it if not running
+        if is_silent:
             if self.silence_start_time is None:
-                self.silence_start_time = current_time
-            
-            # Check if we've had enough silence to stop
-            silence_duration = current_time - self.silence_start_time
-            
-            # Only stop if we've had some speech and then enough silence
-            if (self.is_speech_detected and 
+                self.silence_start_time = now
+        else:
+            self.silence_start_time = None
+        
+        # Only stop if we've had some speech and then enough silence
+        return (is_silent and
+                self.is_speech_detected and
                 recording_duration > self.min_speech_duration and
-                silence_duration > self.max_silence_duration):
-                return True
+                now - self.silence_start_time > self.max_silence_duration)
+    
+    def should_stop_buffer(self, samples: "np.ndarray", sample_rate: int = 16000) -> bool:
+        """
+        Determine if recording should stop from a whole buffer of samples.
+        
+        The buffer is classified in one compiled pass (see `_vad_segment`) with
+        the same silence rules as should_stop_recording.
+        
+        Args:
+            samples: Audio samples (int16 PCM, or floats in [-1, 1]).
+            sample_rate: Sample rate of `samples` in Hz.
+            
+        Returns:
+            bool: True if the buffer contains speech followed by enough silence.
+        """
+        x = samples.reshape(-1)
+        if x.dtype != np.int16:
+            x = np.clip(x * 32768.0, -32768, 32767).astype(np.int16)
+        x = np.ascontiguousarray(x)
         
-        return False
+        win = max(1, int(sample_rate * 0.05))  # 50 ms windows
+        speech_start, _, stopped = _vad_segment(
+            x, win, win,
+            float(self.silence_threshold),
+            int(self.min_speech_duration * sample_rate),
+            int(self.max_silence_duration * sample_rate)
+        )
+        self.is_speech_detected = speech_start >= 0
+        return bool(stopped)
 
 
 class AudioProcessor:
@@ -254,20 +696,38 @@ class AudioProcessor:
         # Platform detection
         self.is_macos = platform.system() == "Darwin"
         
-        # Initialize SoX
-        self.sox_path = self._find_sox()
-        
-        # Audio processing components
-        self.level_monitor = AudioLevelMonitor(self.sox_path)
-        self.vad = VoiceActivityDetector(self.sox_path)
+        # SoX and the processing components are resolved lazily on first use
+        # (see the cached properties below)
         
         # Current settings
         self.current_device = None
         self.noise_reduction_enabled = True
         self.auto_gain_enabled = True
         
+        # Device list cache: (timestamp, devices, device_ids)
+        self._device_cache: Optional[Tuple[float, List[AudioDevice], set]] = None
+        self._device_cache_ttl = 30.0  # seconds
+        
         self.logger.info("AudioProcessor initialized successfully")
     
+    @cached_property
+    def sox_path(self) -> str:
+        """Path to the SoX executable (raises RuntimeError if SoX is not installed)."""
+        return self._find_sox()
+    
+    @cached_property
+    def _sox_prefix(self) -> Tuple[str, ...]:
+        return (self.sox_path,)
+    
+    @cached_property
+    def level_monitor(self) -> AudioLevelMonitor:
+        return AudioLevelMonitor(self.sox_path)
+    
+    @cached_property
+    def vad(self) -> VoiceActivityDetector:
+        # SoX is only resolved if the detector falls back to it
+        return VoiceActivityDetector(find_sox=lambda: self.sox_path)
+    
     def _find_sox(self) -> str:
         """Find SoX executable."""
         sox_path = shutil.which("sox")
@@ -293,9 +753,31 @@ class AudioProcessor:
         """
         List available audio input devices.
         
+        Results are cached for a short time since enumerating devices is slow;
+        call refresh_devices() to force a rescan.
+        
         Returns:
             List of AudioDevice objects representing available input devices.
         """
+        _, devices, _ = self._get_device_cache()
+        return list(devices)
+    
+    def refresh_devices(self) -> List[AudioDevice]:
+        """Discard the cached device list and rescan audio input devices."""
+        self._device_cache = None
+        return self.list_audio_devices()
+    
+    def _get_device_cache(self) -> Tuple[float, List[AudioDevice], set]:
+        """Return the cached device list, re-enumerating it if the cache has expired."""
+        cache = self._device_cache
+        if cache is None or time.monotonic() - cache[0] >= self._device_cache_ttl:
+            devices = self._enumerate_devices()
+            cache = (time.monotonic(), devices, {d.device_id for d in devices})
+            self._device_cache = cache
+        return cache
+    
+    def _enumerate_devices(self) -> List[AudioDevice]:
+        """Query the system for audio input devices."""
         devices = []
         
         try:
@@ -335,28 +817,14 @@ class AudioProcessor:
         """Parse macOS system_profiler output for audio devices."""
         devices = []
         try:
-            data = json.loads(json_output)
+            data = _json_loads(json_output)
             audio_data = data.get('SPAudioDataType', [])
             
-            for item in audio_data:
-                # Look for input devices
-                if 'coreaudio_input_source' in item:
-                    sources = item['coreaudio_input_source']
-                    if isinstance(sources, list):
-                        for source in sources:
-                            device = AudioDevice(
-                                device_id=source.get('coreaudio_device_id', 'unknown'),
-                                name=source.get('_name', 'Unknown Device'),
-                                description=f"{item.get('_name', 'Unknown')} - {source.get('_name', '')}"
-                            )
-                            devices.append(device)
-                    elif isinstance(sources, dict):
-                        device = AudioDevice(
-                            device_id=sources.get('coreaudio_device_id', 'unknown'),
-                            name=sources.get('_name', 'Unknown Device'),
-                            description=f"{item.get('_name', 'Unknown')} - {sources.get('_name', '')}"
-                        )
-                        devices.append(device)
+            devices = [
+                _to_device(item.get('_name', 'Unknown'), source)
+                for item in audio_data
+                for source in _iter_sources(item)
+            ]
         
         except Exception as e:
             self.logger.warning(f"Failed to parse macOS device data: {e}")
@@ -375,8 +843,8 @@ class AudioProcessor:
         """
         try:
             # Validate device exists
-            devices = self.list_audio_devices()
-            device_exists = any(d.device_id == device_id for d in devices)
+            _, _, device_ids = self._get_device_cache()
+            device_exists = device_id in device_ids
             
             if not device_exists and device_id != "default":
                 self.logger.error(f"Device not found: {device_id}")
@@ -410,57 +878,69 @@ class AudioProcessor:
         """Stop real-time audio level monitoring."""
         self.level_monitor.stop_monitoring()
     
-    def apply_noise_reduction(self, input_file: str, output_file: str, level: str = "medium") -> bool:
+    def process(self, input_file: str, output_file: str, effects: Sequence[str], *,
+                target_sr: Optional[int] = 16000, timeout: float = 60) -> bool:
         """
-        Apply noise reduction to an audio file using SoX.
+        Run an audio file through a SoX effect chain in a single pass.
+        
+        Format conversion and every effect are composed into one command, so a
+        caller that needs several cleanup steps reads and writes the audio once,
+        with no intermediate files. The effects are passed through unchanged;
+        each caller keeps its own filter, compression and noise settings, so
+        apply_noise_reduction and optimize_for_transcription stay separate
+        chains rather than one fused pass.
         
         Args:
             input_file: Path to input audio file.
             output_file: Path to output audio file.
-            level: Noise reduction level ("light", "medium", "heavy").
+            effects: SoX effect arguments, in the order they are applied.
+            target_sr: Output sample rate (16-bit mono), or None to keep the input format.
+            timeout: Seconds to allow SoX to run.
             
         Returns:
-            bool: True if noise reduction was applied successfully.
+            bool: True if processing was successful.
         """
         try:
-            # Noise reduction parameters based on level
-            nr_params = {
-                "light": ["noisered", "0.15"],
-                "medium": ["noisered", "0.25"],
-                "heavy": ["noisered", "0.35"]
-            }
-            
-            if level not in nr_params:
-                level = "medium"
-            
-            # Build SoX command with noise reduction
-            cmd = [
-                self.sox_path,
-                input_file,
-                output_file,
-                "highpass", "200",  # Remove low-frequency noise
-                "lowpass", "8000",  # Remove high-frequency noise
-                "compand", "0.02,0.20", "5:-60,-40,-10", "-5", "-90", "0.1",  # Dynamic range compression
-                *nr_params[level]
-            ]
+            cmd = [*self._sox_prefix, input_file]
+            if target_sr:
+                cmd.extend([
+                    "-r", str(target_sr),  # Target sample rate
+                    "-c", "1",             # Mono
+                    "-b", "16"             # 16-bit
+                ])
+            cmd.append(output_file)
+            cmd.extend(effects)
             
-            # Apply auto-gain if enabled
-            if self.auto_gain_enabled:
-                cmd.extend(["gain", "-n"])  # Normalize gain
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
             
             if result.returncode == 0:
-                self.logger.info(f"Noise reduction applied: {level} level")
+                self.logger.info("Audio processed")
                 return True
             else:
-                self.logger.error(f"Noise reduction failed: {result.stderr}")
+                self.logger.error(f"Audio processing failed: {result.stderr}")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error applying noise reduction: {e}")
+            self.logger.error(f"Error processing audio: {e}")
             return False
     
+    def apply_noise_reduction(self, input_file: str, output_file: str, level: str = "medium") -> bool:
+        """
+        Apply noise reduction to an audio file using SoX.
+        
+        Args:
+            input_file: Path to input audio file.
+            output_file: Path to output audio file.
+            level: Noise reduction level ("light", "medium", "heavy").
+            
+        Returns:
+            bool: True if noise reduction was applied successfully.
+        """
+        amount = NOISE_REDUCTION_LEVELS.get(level, NOISE_REDUCTION_LEVELS["medium"])
+        effects = (*_NOISE_REDUCTION_EFFECT_ARGS, "noisered", amount,
+                   *(_NORMALIZE_ARGS if self.auto_gain_enabled else ()))
+        return self.process(input_file, output_file, effects, target_sr=None, timeout=30)
+    
     def voice_activity_detection(self, audio_file: str) -> Dict[str, Any]:
         """
         Perform voice activity detection on an audio file.
@@ -473,6 +953,78 @@ class AudioProcessor:
         """
         return self.vad.analyze_audio_segment(audio_file)
     
+    def analyze_segments(self, files: List[str]) -> List[Dict[str, Any]]:
+        """
+        Perform voice activity detection on several audio files concurrently.
+        
+        Each analysis either waits on a SoX subprocess or runs NumPy kernels,
+        both of which release the GIL, so a thread pool overlaps them well.
+        
+        Args:
+            files: Paths to audio files to analyze.
+            
+        Returns:
+            List of VAD result dicts, in the same order as `files`.
+        """
+        if len(files) <= 1:
+            return [self.vad.analyze_audio_segment(f) for f in files]
+        
+        max_workers = min(8, os.cpu_count() or 1, len(files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.vad.analyze_audio_segment, files))
+    
+    def voice_activity_detection_buf(self, x: "np.ndarray", sample_rate: int) -> Dict[str, Any]:
+        """
+        Perform voice activity detection on in-memory samples.
+        
+        Args:
+            x: Audio samples (1-D or frames x channels; float or integer PCM).
+            sample_rate: Sample rate of `x` in Hz.
+            
+        Returns:
+            Dict containing VAD results and statistics.
+        """
+        return self.vad.analyze_samples(x, sample_rate)
+    
+    def optimize_for_transcription_buf(self, x: "np.ndarray", sample_rate: int) -> Tuple["np.ndarray", int]:
+        """
+        Optimize in-memory samples for transcription without touching disk.
+        
+        Applies the in-process resample/band-limit/normalize chain. SoX
+        compression and noise reduction are not available on this path, so
+        the result differs from optimize_for_transcription.
+        
+        Args:
+            x: Audio samples (1-D or frames x channels; float or integer PCM).
+            sample_rate: Sample rate of `x` in Hz.
+            
+        Returns:
+            Tuple of (float32 mono samples at 16kHz, 16000).
+        """
+        if not SCIPY_AVAILABLE:
+            raise RuntimeError("In-memory optimization requires NumPy and SciPy")
+        return _transcription_kernel(_to_float_samples(x), sample_rate, 16000), 16000
+    
+    def get_audio_info_buf(self, x: "np.ndarray", sample_rate: int) -> Dict[str, Any]:
+        """
+        Get information about in-memory samples, using the same keys as get_audio_info.
+        
+        Args:
+            x: Audio samples (1-D or frames x channels).
+            sample_rate: Sample rate of `x` in Hz.
+            
+        Returns:
+            Dict containing audio information.
+        """
+        x = np.asarray(x)
+        return {
+            'channels': 1 if x.ndim == 1 else x.shape[1],
+            'sample_rate': sample_rate,
+            'precision': x.dtype.itemsize * 8,
+            'duration': x.shape[0] / sample_rate if sample_rate else 0.0,
+            'samples': x.shape[0]
+        }
+    
     def optimize_for_transcription(self, input_file: str, output_file: str) -> bool:
         """
         Optimize audio file for transcription (Whisper-ready format).
@@ -484,37 +1036,10 @@ class AudioProcessor:
         Returns:
             bool: True if optimization was successful.
         """
-        try:
-            # Convert to 16kHz mono WAV with noise reduction and normalization
-            cmd = [
-                self.sox_path,
-                input_file,
-                "-r", "16000",  # 16kHz sample rate
-                "-c", "1",      # Mono
-                "-b", "16",     # 16-bit
-                output_file,
-                "highpass", "80",   # Remove very low frequencies
-                "lowpass", "8000",  # Remove frequencies above speech range
-                "compand", "0.1,0.3", "-60,-60,-30,-15,-20,-10,-5,-5,0,-3", "6",  # Gentle compression
-                "gain", "-n"    # Normalize
-            ]
-            
-            # Add noise reduction if enabled
-            if self.noise_reduction_enabled:
-                cmd.extend(["noisered", "0.2"])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                self.logger.info("Audio optimized for transcription")
-                return True
-            else:
-                self.logger.error(f"Audio optimization failed: {result.stderr}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Error optimizing audio: {e}")
-            return False
+        effects = _TRANSCRIPTION_EFFECT_ARGS
+        if self.noise_reduction_enabled:
+            effects += _TRANSCRIPTION_NOISERED_ARGS
+        return self.process(input_file, output_file, effects)
     
     def get_audio_info(self, audio_file: str) -> Dict[str, Any]:
         """
@@ -527,7 +1052,16 @@ class AudioProcessor:
             Dict containing audio file information.
         """
         try:
-            cmd = [self.sox_path, "--info", audio_file]
+            # WAV headers can be read directly; only other formats need SoX
+            try:
+                info = _read_wav_header(audio_file)
+            except (OSError, ValueError, struct.error) as e:
+                self.logger.debug(f"Could not read WAV header, using SoX: {e}")
+                info = None
+            if info is not None:
+                return info
+            
+            cmd = [*self._sox_prefix, "--info", audio_file]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
@@ -547,45 +1081,81 @@ class AudioProcessor:
             self.logger.error(f"Error getting audio info: {e}")
             return {}
     
+    def get_audio_infos(self, audio_files: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get information about several audio files with as few subprocesses as possible.
+        
+        WAV files are read from their headers; the remaining files are queried
+        with one `sox --i` call per field across all files instead of one
+        `sox --info` call per file.
+        
+        Args:
+            audio_files: Paths to audio files.
+            
+        Returns:
+            List of info dicts, in the same order as `audio_files`.
+        """
+        infos: List[Optional[Dict[str, Any]]] = []
+        for audio_file in audio_files:
+            try:
+                infos.append(_read_wav_header(audio_file))
+            except (OSError, ValueError, struct.error):
+                infos.append(None)
+        
+        pending = [i for i, info in enumerate(infos) if info is None]
+        if pending:
+            paths = [audio_files[i] for i in pending]
+            batched = self._query_sox_fields(paths)
+            for i, path, info in zip(pending, paths, batched or [None] * len(paths)):
+                infos[i] = info if info is not None else self.get_audio_info(path)
+        
+        return infos
+    
+    def _query_sox_fields(self, paths: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Run one `sox --i` query per field over all paths; None if any query fails."""
+        columns = {}
+        try:
+            for key, (flag, coerce) in _SOXI_FIELDS.items():
+                result = subprocess.run([*self._sox_prefix, "--i", flag, *paths],
+                                        capture_output=True, text=True, timeout=30)
+                values = result.stdout.splitlines()
+                if result.returncode != 0 or len(values) != len(paths):
+                    return None
+                columns[key] = [coerce(v.strip()) for v in values]
+        except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+            self.logger.warning(f"Batched audio info query failed: {e}")
+            return None
+        
+        infos = []
+        for i, path in enumerate(paths):
+            info = {key: values[i] for key, values in columns.items()}
+            info['input_file'] = f"'{path}'"
+            try:
+                info['file_size'] = os.stat(path).st_size
+            except OSError:
+                pass
+            infos.append(info)
+        return infos
+    
     def _parse_audio_info(self, info_output: str) -> Dict[str, Any]:
         """Parse SoX audio info output."""
         info = {}
-        try:
-            for line in info_output.split('\n'):
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip().lower().replace(' ', '_')
-                    value = value.strip()
-                    
-                    # Convert numeric values
-                    if key in ['sample_rate', 'channels', 'precision']:
-                        try:
-                            info[key] = int(value.split()[0])
-                        except:
-                            info[key] = value
-                    elif key == 'duration':
-                        try:
-                            # Parse duration in format "00:00:05.23"
-                            parts = value.split(':')
-                            if len(parts) == 3:
-                                hours, minutes, seconds = parts
-                                total_seconds = float(hours) * 3600 + float(minutes) * 60 + float(seconds)
-                                info[key] = total_seconds
-                            else:
-                                info[key] = value
-                        except:
-                            info[key] = value
-                    else:
-                        info[key] = value
-        except Exception as e:
-            self.logger.warning(f"Failed to parse some audio info: {e}")
+        for key, value in _parse_fields(info_output).items():
+            coerce = _INFO_COERCERS.get(key)
+            if coerce is None:
+                info[key] = value
+                continue
+            try:
+                info[key] = coerce(value)
+            except ValueError:
+                info[key] = value
         
         return info
     
     def cleanup(self):
         """Clean up resources."""
-        self.stop_level_monitoring()
+        if 'level_monitor' in self.__dict__:
+            self.stop_level_monitoring()
         self.logger.info("AudioProcessor cleanup completed")
 
 
@@ -8,38 +8,93 @@ in the optimal format for Whisper transcription (16kHz mono WAV).
 import os
 import sys
 import subprocess
+import selectors
 import tempfile
 import time
 import logging
 import signal
 import shutil
+import struct
+import re
 import platform
 from pathlib import Path
 from typing import Optional, Dict, Any
+from enum import Enum
 import threading
+import itertools
+import wave
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError is raised by sounddevice when the PortAudio library is missing
+    SOUNDDEVICE_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+# Size of a canonical PCM WAV header (RIFF + fmt + data chunk headers)
+WAV_HEADER_SIZE = 44
+
+# SoX stderr keywords that point at a microphone permission problem
+_PERM_RE = re.compile(rb'permission|denied|access|authorization', re.I)
+
+# Where the verified SoX location is remembered between runs
+SOX_CACHE_FILE = Path.home() / ".cache" / "dicto" / "sox_path"
+
+
+# Static log text, kept out of the hot paths (emoji as escapes so the source
+# encoding can't mangle them)
+_SOX_FOUND = "\u2705 SoX found:"
+_MIC_OK = "\u2705 Microphone access test successful"
+_MIC_DENIED = "\u274C Microphone permission denied"
+_MIC_TIMEOUT = "\u274C Microphone test timed out - likely permission issue"
+_REC_START = "\U0001F534 Recording started to:"
+_REC_FOUND = "\u23F9\uFE0F Found completed recording:"
+_REC_DONE = "\U0001F3B5 Recording completed successfully"
+_REC_STOP = "\u23F9\uFE0F Recording stopped. File:"
+_CLEANED = "\U0001F5D1\uFE0F Cleaned up"
+_MACOS_MIC_HINT = (
+    " Please grant microphone permission to your terminal/application in "
+    "System Preferences > Security & Privacy > Privacy > Microphone"
+)
+
+class _Backend(Enum):
+    """Audio capture backend used by AudioRecorder."""
+    SOUNDDEVICE = "sounddevice"  # In-process PortAudio capture
+    SOX = "sox"                  # SoX child process
 
 
 class AudioRecorder:
     """
-    SoX-based audio recorder optimized for Whisper transcription.
+    Audio recorder optimized for Whisper transcription.
     
     Records audio at 16kHz mono WAV format which is optimal for Whisper.
+    Captures in-process through PortAudio (sounddevice) when available and
+    falls back to a SoX child process otherwise.
     Provides non-blocking recording with proper cleanup and error handling.
     """
     
-    def __init__(self, temp_dir: Optional[str] = None):
+    # Resolved SoX location, shared by all instances in this process
+    _cached_sox_path: Optional[str] = None
+    _cached_sox_version: Optional[str] = None
+    # Per-process sequence for recording filenames
+    _seq = itertools.count()
+    
+    def __init__(self, temp_dir: Optional[str] = None, prewarm: bool = False):
         """
         Initialize the AudioRecorder.
         
         Args:
             temp_dir: Directory for temporary audio files. If None, uses system temp.
+            prewarm: Keep the input stream open between recordings (sounddevice
+                backend) so only the first recording pays the device-open latency.
+                The stream is opened by that first recording, not here, so creating
+                a recorder never turns on the microphone.
         
         Raises:
-            RuntimeError: If SoX is not available or setup fails.
+            RuntimeError: If no capture backend is available or setup fails.
         """
-        # Set up logging
-        self.logger = logging.getLogger(__name__)
-        
         # Set up temp directory
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.gettempdir()) / "dicto_audio"
         self.temp_dir.mkdir(exist_ok=True)
@@ -48,15 +103,42 @@ class AudioRecorder:
         self.is_recording = False
         self.recording_process = None
         self.current_file = None
-        self.recording_thread = None
+        
+        # Byte rate of current_file, cached by _recording_byte_rate()
+        self._byte_rate = 16000 * 2
+        self._byte_rate_file = None
+        
+        # In-process capture state (sounddevice backend)
+        self.stream = None
+        self._buffer = bytearray()  # Raw 16-bit PCM, valid up to _frames_captured
+        self._frames_captured = 0
+        self._max_frames = None
+        self._armed = False  # Whether the stream callback is capturing to the buffer
+        self._capture_lock = threading.Lock()
+        self._keep_stream_open = False
+        
+        # Microphone probe result: None until probed, then True/False
+        self._mic_access_ok: Optional[bool] = None
+        self._mic_probe_thread = None
         
         # Platform detection
         self.is_macos = platform.system() == "Darwin"
         
-        # Validate SoX installation
-        self.check_dependencies()
+        # Select capture backend; SoX is only required when sounddevice is unavailable
+        if SOUNDDEVICE_AVAILABLE:
+            self.backend = _Backend.SOUNDDEVICE
+            self.sox_path = None
+            self._keep_stream_open = prewarm
+        else:
+            self.backend = _Backend.SOX
+            self.check_dependencies()
+            
+            # Probe the microphone in the background so the first
+            # start_recording() doesn't have to wait for it
+            self._mic_probe_thread = threading.Thread(target=self.test_microphone_access, daemon=True)
+            self._mic_probe_thread.start()
         
-        self.logger.info("AudioRecorder initialized successfully")
+        log.info("AudioRecorder initialized successfully")
     
     def check_dependencies(self) -> bool:
         """
@@ -68,7 +150,13 @@ class AudioRecorder:
         Raises:
             RuntimeError: If SoX is not available.
         """
-        self.logger.info("Checking SoX installation...")
+        log.info("Checking SoX installation...")
+        
+        # Reuse a SoX location verified earlier in this process or a previous run
+        if self._load_cached_sox():
+            self.sox_path = AudioRecorder._cached_sox_path
+            log.info("%s %s", _SOX_FOUND, AudioRecorder._cached_sox_version)
+            return True
         
         # Check if SoX is in PATH
         sox_path = shutil.which("sox")
@@ -91,7 +179,7 @@ class AudioRecorder:
                     "  brew install sox\n"
                     "or download from: http://sox.sourceforge.net/"
                 )
-                self.logger.error(error_msg)
+                log.error(error_msg)
                 raise RuntimeError(error_msg)
         
         # Test SoX with version command
@@ -100,8 +188,9 @@ class AudioRecorder:
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
                 version_info = result.stdout.strip()
-                self.logger.info(f"✅ SoX found: {version_info}")
+                log.info("%s %s", _SOX_FOUND, version_info)
                 self.sox_path = sox_path
+                self._store_cached_sox(sox_path, version_info)
                 return True
             else:
                 raise RuntimeError(f"SoX test failed: {result.stderr}")
@@ -111,6 +200,41 @@ class AudioRecorder:
         except Exception as e:
             raise RuntimeError(f"Failed to test SoX: {e}")
     
+    @classmethod
+    def _load_cached_sox(cls) -> bool:
+        """
+        Populate the class-level SoX cache, from the on-disk cache if necessary.
+        
+        Returns:
+            bool: True if a cached SoX path exists and is still executable.
+        """
+        if cls._cached_sox_path is None:
+            try:
+                lines = SOX_CACHE_FILE.read_text().splitlines()
+            except OSError:
+                return False
+            if not lines:
+                return False
+            cls._cached_sox_path = lines[0]
+            cls._cached_sox_version = lines[1] if len(lines) > 1 else ""
+        
+        if os.path.exists(cls._cached_sox_path) and os.access(cls._cached_sox_path, os.X_OK):
+            return True
+        
+        cls._cached_sox_path = cls._cached_sox_version = None
+        return False
+    
+    @classmethod
+    def _store_cached_sox(cls, sox_path: str, version_info: str):
+        """Remember a verified SoX location for this process and future runs."""
+        cls._cached_sox_path = sox_path
+        cls._cached_sox_version = version_info
+        try:
+            SOX_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            SOX_CACHE_FILE.write_text(f"{sox_path}\n{version_info}\n")
+        except OSError:
+            pass  # The cache is an optimization only
+    
     def test_microphone_access(self) -> bool:
         """
         Test if microphone access is available by attempting a short recording.
@@ -118,76 +242,108 @@ class AudioRecorder:
         Returns:
             bool: True if microphone access works, False otherwise.
         """
-        self.logger.info("Testing microphone access...")
+        log.info("Testing microphone access...")
         
-        # Generate test filename
-        test_file = self.temp_dir / "mic_test.wav"
+        if self.backend is _Backend.SOUNDDEVICE:
+            return self._test_stream_access()
         
         try:
-            # Try a very short recording (0.1 seconds)
+            # Try a very short recording (0.1 seconds) to the null file: exercises
+            # the input device without touching disk
             cmd = [
                 self.sox_path,
                 "-d",  # Use default input device
                 "-r", "16000",  # 16kHz sample rate
                 "-c", "1",      # Mono
                 "-b", "16",     # 16-bit depth
-                str(test_file),
+                "-n",           # Null output
                 "trim", "0", "0.1"  # Record for 0.1 seconds
             ]
             
             # Start the process with a timeout
             process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True
+                bufsize=65536
             )
             
             # Wait for completion with timeout
             try:
-                stdout, stderr = process.communicate(timeout=5)
+                _, stderr = process.communicate(timeout=5)
                 
                 if process.returncode == 0:
-                    # Check if file was created and has some content
-                    if test_file.exists() and test_file.stat().st_size > 0:
-                        self.logger.info("✅ Microphone access test successful")
-                        test_file.unlink()  # Clean up test file
-                        return True
-                    else:
-                        self.logger.warning("Microphone test: No audio data recorded")
-                        return False
+                    log.info(_MIC_OK)
+                    self._mic_access_ok = True
+                    return True
+                
+                # Check for common permission errors
+                if _PERM_RE.search(stderr):
+                    log.error(_MIC_DENIED)
+                    if self.is_macos:
+                        log.error("On macOS, you need to grant microphone permission to your terminal/application.")
+                        log.error("Go to System Preferences > Security & Privacy > Privacy > Microphone")
                 else:
-                    # Check for common permission errors
-                    error_output = stderr.lower()
-                    if any(keyword in error_output for keyword in ['permission', 'denied', 'access', 'authorization']):
-                        self.logger.error("❌ Microphone permission denied")
-                        if self.is_macos:
-                            self.logger.error("On macOS, you need to grant microphone permission to your terminal/application.")
-                            self.logger.error("Go to System Preferences > Security & Privacy > Privacy > Microphone")
-                    else:
-                        self.logger.error(f"Microphone test failed: {stderr}")
-                    return False
+                    log.error("Microphone test failed: %s", stderr.decode('utf-8', 'replace'))
+                self._mic_access_ok = False
+                return False
                     
             except subprocess.TimeoutExpired:
                 # Process hung - likely permission issue
                 process.kill()
                 process.wait()
-                self.logger.error("❌ Microphone test timed out - likely permission issue")
+                log.error(_MIC_TIMEOUT)
                 if self.is_macos:
-                    self.logger.error("On macOS, grant microphone permission to your terminal/application")
-                    self.logger.error("Go to System Preferences > Security & Privacy > Privacy > Microphone")
+                    log.error("On macOS, grant microphone permission to your terminal/application")
+                    log.error("Go to System Preferences > Security & Privacy > Privacy > Microphone")
+                self._mic_access_ok = False
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Microphone test error: {e}")
+            log.error("Microphone test error: %s", e)
+            self._mic_access_ok = False
             return False
-        finally:
-            # Clean up test file if it exists
-            if test_file.exists():
-                try:
-                    test_file.unlink()
-                except:
-                    pass
+    
+    def _test_stream_access(self, timeout: float = 5) -> bool:
+        """Check the default input device through PortAudio by waiting for one block of samples."""
+        if self.stream is not None and self.stream.active:
+            # A running stream is already delivering samples
+            self._mic_access_ok = True
+            return True
+        
+        try:
+            sd.check_input_settings(samplerate=16000, channels=1, dtype='int16')
+            
+            got_block = threading.Event()
+            with sd.InputStream(samplerate=16000, channels=1, dtype='int16', blocksize=1600,
+                                callback=lambda indata, frames, time_info, status: got_block.set()):
+                received = got_block.wait(timeout)
+        except (sd.PortAudioError, ValueError) as e:
+            log.error("%s: %s", _MIC_DENIED, e)
+            if self.is_macos:
+                log.error("On macOS, you need to grant microphone permission to your terminal/application.")
+                log.error("Go to System Preferences > Security & Privacy > Privacy > Microphone")
+            self._mic_access_ok = False
+            return False
+        
+        if not received:
+            log.error(_MIC_TIMEOUT)
+            self._mic_access_ok = False
+            return False
+        
+        log.info(_MIC_OK)
+        self._mic_access_ok = True
+        return True
+    
+    def recheck_microphone(self) -> bool:
+        """
+        Re-probe microphone access, discarding any cached result.
+        
+        Returns:
+            bool: True if microphone access works, False otherwise.
+        """
+        self._mic_access_ok = None
+        return self.test_microphone_access()
     
     def start_recording(self, duration: Optional[float] = None) -> str:
         """
@@ -205,16 +361,20 @@ class AudioRecorder:
         if self.is_recording:
             raise RuntimeError("Recording already in progress")
         
-        # Test microphone access first
-        if not self.test_microphone_access():
+        if self.backend is _Backend.SOUNDDEVICE:
+            return self._start_stream_recording(duration)
+        
+        # Wait for the background probe, then only re-test if it hasn't succeeded
+        if self._mic_probe_thread and self._mic_probe_thread.is_alive():
+            self._mic_probe_thread.join()
+        if not self._mic_access_ok and not self.test_microphone_access():
             error_msg = "Microphone access test failed. Cannot start recording."
             if self.is_macos:
-                error_msg += " Please grant microphone permission to your terminal/application in System Preferences > Security & Privacy > Privacy > Microphone"
+                error_msg += _MACOS_MIC_HINT
             raise RuntimeError(error_msg)
         
         # Generate unique filename
-        timestamp = int(time.time() * 1000)  # milliseconds for uniqueness
-        self.current_file = self.temp_dir / f"recording_{timestamp}.wav"
+        self.current_file = self._next_recording_path()
         
         # Build SoX command for recording
         # Record at 16kHz mono WAV (optimal for Whisper)
@@ -232,7 +392,7 @@ class AudioRecorder:
         if duration:
             cmd.extend(["trim", "0", str(duration)])
         
-        self.logger.info(f"Starting SoX recording: {' '.join(cmd)}")
+        log.info("Starting SoX recording: %s", ' '.join(cmd))
         
         try:
             # Start SoX recording process
@@ -240,59 +400,169 @@ class AudioRecorder:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                bufsize=65536
             )
             
-            # Quick check that process started successfully
-            time.sleep(0.1)  # Give it a moment to start
-            if self.recording_process.poll() is not None:
-                # Process already exited - likely an error
-                stdout, stderr = self.recording_process.communicate()
-                error_msg = f"SoX recording failed to start: {stderr}"
-                self.logger.error(error_msg)
-                raise RuntimeError(error_msg)
+            # SoX writes little to stderr; drain it without blocking when recording stops
+            stderr_fd = self.recording_process.stderr.fileno()
+            os.set_blocking(stderr_fd, False)
             
-            self.is_recording = True
+            # Quick check that process started successfully: a healthy SoX stays quiet,
+            # a failing one writes its error and closes stderr right away
+            with selectors.DefaultSelector() as sel:
+                sel.register(stderr_fd, selectors.EVENT_READ)
+                ready = sel.select(timeout=0.01)
+            if ready:
+                stderr_data = os.read(stderr_fd, 4096)
+                # Output usually precedes an exit; a closed stderr means one is imminent
+                try:
+                    self.recording_process.wait(timeout=0.05 if stderr_data else 0.5)
+                except subprocess.TimeoutExpired:
+                    pass
+                if self.recording_process.poll() is not None:
+                    stderr_data += self._drain_stderr()
+                    error_msg = f"SoX recording failed to start: {stderr_data.decode('utf-8', 'replace')}"
+                    log.error(error_msg)
+                    raise RuntimeError(error_msg)
+                if stderr_data:
+                    log.warning("SoX: %s", stderr_data.decode('utf-8', 'replace').strip())
             
-            # Start monitoring thread
-            self.recording_thread = threading.Thread(target=self._monitor_recording)
-            self.recording_thread.start()
+            self.is_recording = True
             
-            self.logger.info(f"🔴 Recording started to: {self.current_file}")
+            log.info("%s %s", _REC_START, self.current_file)
             return str(self.current_file)
             
         except Exception as e:
             self.is_recording = False
             self.recording_process = None
             error_msg = f"Failed to start SoX recording: {e}"
-            self.logger.error(error_msg)
+            log.error(error_msg)
             raise RuntimeError(error_msg)
     
-    def _monitor_recording(self):
-        """Monitor the recording process in a separate thread."""
-        if self.recording_process:
+    def _next_recording_path(self) -> Path:
+        """Return a unique path for the next recording (pid + per-process counter)."""
+        return self.temp_dir / f"recording_{os.getpid()}_{next(AudioRecorder._seq)}.wav"
+    
+    def _open_stream(self):
+        """Open and start the PortAudio input stream."""
+        self.stream = sd.InputStream(
+            samplerate=16000,
+            channels=1,
+            dtype='int16',
+            blocksize=1600,  # 0.1 seconds per callback
+            callback=self._audio_callback
+        )
+        self.stream.start()
+    
+    def _start_stream_recording(self, duration: Optional[float] = None) -> str:
+        """Start in-process recording through a PortAudio input stream."""
+        self.current_file = self._next_recording_path()
+        
+        with self._capture_lock:
+            self._frames_captured = 0
+            self._max_frames = int(duration * 16000) if duration else None
+            # Size the buffer once up front when the length is known, so the callback
+            # never reallocates; otherwise it doubles on demand. The buffer is reused
+            # across recordings and only replaced when it is too small.
+            needed = self._max_frames * 2 if self._max_frames is not None else 16000 * 2
+            if len(self._buffer) < needed:
+                self._buffer = bytearray(needed)
+        
+        if self.stream is None or not self.stream.active:
             try:
-                # Wait for process to complete with timeout for safety
-                try:
-                    stdout, stderr = self.recording_process.communicate(timeout=3600)  # 1 hour max
-                except subprocess.TimeoutExpired:
-                    # Recording ran too long, terminate it
-                    self.logger.warning("Recording timed out after 1 hour, terminating")
-                    self.recording_process.kill()
-                    stdout, stderr = self.recording_process.communicate()
-                
-                # Check result
-                if self.recording_process.returncode == 0:
-                    self.logger.info("🎵 Recording completed successfully")
-                elif self.is_recording:
-                    self.logger.error(f"SoX recording error: {stderr}")
-                
-            except Exception as e:
-                self.logger.error(f"Recording monitor error: {e}")
+                self._open_stream()
+            except sd.PortAudioError as e:
+                self.stream = None
+                error_msg = f"Failed to open microphone: {e}"
+                if self.is_macos:
+                    error_msg += _MACOS_MIC_HINT
+                log.error(error_msg)
+                raise RuntimeError(error_msg)
+        
+        self._armed = True
+        self.is_recording = True
+        log.info("%s %s", _REC_START, self.current_file)
+        return str(self.current_file)
+    
+    def _audio_callback(self, indata, frames, time_info, status):
+        """Collect captured samples while armed (runs on the PortAudio thread)."""
+        if not self._armed:
+            return
+        
+        with self._capture_lock:
+            if self._max_frames is not None:
+                remaining = self._max_frames - self._frames_captured
+                if remaining < frames:
+                    indata = indata[:remaining]
+            
+            start = self._frames_captured * 2
+            end = start + len(indata) * 2
+            if end > len(self._buffer):
+                self._buffer.extend(bytes(max(len(self._buffer), end - len(self._buffer))))
+            self._buffer[start:end] = memoryview(indata).cast('B')
+            self._frames_captured += len(indata)
+            
+            if self._max_frames is not None and self._frames_captured >= self._max_frames:
+                # Duration reached: stop capturing but keep the stream warm
+                self._armed = False
+    
+    def _stop_stream_recording(self):
+        """Disarm capture and write the captured samples as a WAV file."""
+        self._armed = False
+        if not self._keep_stream_open:
+            self._close_stream()
+        
+        with self._capture_lock:
+            # Header is patched with the real data size on close
+            with memoryview(self._buffer) as view, wave.open(str(self.current_file), 'wb') as wav_file:
+                wav_file.setparams((1, 2, 16000, 0, 'NONE', 'not compressed'))
+                wav_file.writeframesraw(view[:self._frames_captured * 2])
+    
+    def _close_stream(self):
+        """Stop and close the input stream if it is open."""
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
             finally:
-                # Don't automatically set is_recording = False here
-                # Let stop_recording() handle the state properly
-                pass
+                self.stream = None
+    
+    def close(self):
+        """Release the pre-warmed input stream, stopping any active recording."""
+        if self.is_recording:
+            self.stop_recording()
+        self._keep_stream_open = False
+        self._close_stream()
+    
+    def _terminate(self, process: subprocess.Popen, sigint_ms: int = 200, sigterm_ms: int = 200):
+        """
+        Stop a process, escalating SIGINT -> SIGTERM -> SIGKILL.
+        
+        Polls every 10ms so a well-behaved SoX (which finalizes the WAV header
+        on SIGINT) is reaped as soon as it exits.
+        
+        Args:
+            process: Process to stop.
+            sigint_ms: How long to wait after SIGINT before sending SIGTERM.
+            sigterm_ms: How long to wait after SIGTERM before sending SIGKILL.
+        """
+        for sig, wait_ms in ((signal.SIGINT, sigint_ms), (signal.SIGTERM, sigterm_ms)):
+            process.send_signal(sig)
+            for _ in range(max(1, wait_ms // 10)):
+                if process.poll() is not None:
+                    return
+                time.sleep(0.01)
+        
+        log.warning("SoX did not stop after SIGINT/SIGTERM, killing it")
+        process.kill()
+        process.wait()
+    
+    def _drain_stderr(self) -> bytes:
+        """Read whatever SoX has written to stderr without blocking."""
+        try:
+            return self.recording_process.stderr.read() or b""
+        except (BlockingIOError, ValueError, OSError):
+            return b""
     
     def stop_recording(self) -> Optional[str]:
         """
@@ -306,64 +576,62 @@ class AudioRecorder:
         """
         if not self.is_recording:
             # Check if we have a current file from a completed recording
-            if self.current_file and self.current_file.exists():
-                file_size = self.current_file.stat().st_size
+            if self.current_file:
+                try:
+                    file_size = self.current_file.stat().st_size
+                except FileNotFoundError:
+                    file_size = 0
                 if file_size > 1000:  # At least 1KB of audio data
-                    self.logger.info(f"⏹️ Found completed recording: {self.current_file} ({file_size} bytes)")
+                    log.info("%s %s (%d bytes)", _REC_FOUND, self.current_file, file_size)
                     return str(self.current_file)
             
-            self.logger.warning("No recording in progress")
+            log.warning("No recording in progress")
             return None
         
-        self.logger.info("Stopping recording...")
+        log.info("Stopping recording...")
         
         try:
-            if self.recording_process:
+            if self.backend is _Backend.SOUNDDEVICE:
+                self._stop_stream_recording()
+            elif self.recording_process:
                 if self.recording_process.poll() is None:
                     # Process is still running, stop it gracefully
-                    self.recording_process.send_signal(signal.SIGINT)
-                    
-                    # Wait for process to terminate (with timeout)
-                    try:
-                        self.recording_process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        # Force terminate if it doesn't stop gracefully
-                        self.recording_process.terminate()
-                        try:
-                            self.recording_process.wait(timeout=2)
-                        except subprocess.TimeoutExpired:
-                            self.recording_process.kill()
+                    self._terminate(self.recording_process)
                 else:
                     # Process already finished
-                    self.logger.info("Recording process already completed")
+                    log.info("Recording process already completed")
+                
+                stderr = self._drain_stderr()
+                if self.recording_process.returncode == 0:
+                    log.info(_REC_DONE)
+                elif stderr:
+                    log.error("SoX recording error: %s", stderr.decode('utf-8', 'replace'))
             
             self.is_recording = False
             
-            # Wait for monitoring thread to finish
-            if self.recording_thread and self.recording_thread.is_alive():
-                self.recording_thread.join(timeout=3)
-            
             # Check if file was created and has content
-            if self.current_file and self.current_file.exists():
-                file_size = self.current_file.stat().st_size
+            try:
+                file_size = self.current_file.stat().st_size if self.current_file else None
+            except FileNotFoundError:
+                file_size = None
+            if file_size is not None:
                 if file_size > 1000:  # At least 1KB of audio data
-                    self.logger.info(f"⏹️ Recording stopped. File: {self.current_file} ({file_size} bytes)")
+                    log.info("%s %s (%d bytes)", _REC_STOP, self.current_file, file_size)
                     return str(self.current_file)
                 else:
-                    self.logger.warning(f"Recording file too small: {file_size} bytes")
+                    log.warning("Recording file too small: %d bytes", file_size)
                     self._cleanup_file(self.current_file)
                     return None
             else:
-                self.logger.warning("No recording file found")
+                log.warning("No recording file found")
                 return None
                 
         except Exception as e:
             error_msg = f"Error stopping recording: {e}"
-            self.logger.error(error_msg)
+            log.error(error_msg)
             raise RuntimeError(error_msg)
         finally:
             self.recording_process = None
-            self.recording_thread = None
     
     def is_recording_active(self) -> bool:
         """
@@ -384,22 +652,35 @@ class AudioRecorder:
         if not self.is_recording or not self.current_file:
             return 0.0
         
+        if self.backend is _Backend.SOUNDDEVICE:
+            return self._frames_captured / 16000
+        
         try:
-            if self.current_file.exists():
-                # Use SoX to get duration
-                cmd = [self.sox_path, str(self.current_file), "-n", "stat"]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                
-                # Parse duration from stderr (SoX outputs stats to stderr)
-                for line in result.stderr.split('\n'):
-                    if 'Length (seconds):' in line:
-                        duration_str = line.split(':')[1].strip()
-                        return float(duration_str)
+            file_size = self.current_file.stat().st_size
+            return max(0.0, (file_size - WAV_HEADER_SIZE) / self._recording_byte_rate())
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            self.logger.warning(f"Failed to get recording duration: {e}")
+            log.warning("Failed to get recording duration: %s", e)
         
         return 0.0
     
+    def _recording_byte_rate(self) -> int:
+        """Byte rate of the current recording, read once from its WAV header."""
+        if self._byte_rate_file != self.current_file:
+            self._byte_rate = 16000 * 2  # 16kHz mono 16-bit, as requested from SoX
+            try:
+                with open(self.current_file, 'rb') as f:
+                    header = f.read(WAV_HEADER_SIZE)
+            except OSError:
+                return self._byte_rate
+            if len(header) < WAV_HEADER_SIZE:
+                return self._byte_rate  # Header not written yet; check again next time
+            if header[0:4] == b'RIFF' and header[12:16] == b'fmt ':
+                self._byte_rate = struct.unpack('<I', header[28:32])[0] or self._byte_rate
+            self._byte_rate_file = self.current_file
+        return self._byte_rate
+    
     def cleanup_file(self, file_path: str) -> bool:
         """
         Clean up a temporary audio file.
@@ -423,12 +704,13 @@ class AudioRecorder:
             bool: True if cleanup was successful, False otherwise.
         """
         try:
-            if file_path.exists():
-                file_path.unlink()
-                self.logger.info(f"🗑️ Cleaned up: {file_path}")
-                return True
+            file_path.unlink()
+            log.info("%s: %s", _CLEANED, file_path)
+            return True
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            self.logger.warning(f"Failed to clean up {file_path}: {e}")
+            log.warning("Failed to clean up %s: %s", file_path, e)
         return False
     
     def cleanup_old_files(self, max_age_hours: float = 24) -> int:
@@ -446,16 +728,22 @@ class AudioRecorder:
         max_age_seconds = max_age_hours * 3600
         
         try:
-            for file_path in self.temp_dir.glob("recording_*.wav"):
-                file_age = current_time - file_path.stat().st_mtime
-                if file_age > max_age_seconds:
-                    if self._cleanup_file(file_path):
-                        cleaned_count += 1
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.startswith("recording_") and entry.name.endswith(".wav")):
+                        continue
+                    file_age = current_time - entry.stat().st_mtime
+                    if file_age > max_age_seconds:
+                        try:
+                            os.unlink(entry.path)
+                            cleaned_count += 1
+                        except OSError as e:
+                            log.warning("Failed to clean up %s: %s", entry.path, e)
         except Exception as e:
-            self.logger.warning(f"Error during cleanup: {e}")
+            log.warning("Error during cleanup: %s", e)
         
         if cleaned_count > 0:
-            self.logger.info(f"🗑️ Cleaned up {cleaned_count} old audio files")
+            log.info("%s %d old audio files", _CLEANED, cleaned_count)
         
         return cleaned_count
     
@@ -476,8 +764,7 @@ class AudioRecorder:
     
     def __del__(self):
         """Cleanup when object is destroyed."""
-        if self.is_recording:
-            try:
-                self.stop_recording()
-            except Exception:
-                pass 
\ No newline at end of file
+        try:
+            self.close()
+        except Exception:
+            pass 
\ No newline at end of file
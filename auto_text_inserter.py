@@ -3,34 +3,190 @@
 Auto Text Inserter - Automatically insert text into focused input areas
 This module provides functionality to automatically type/paste text into 
 the currently focused text field or input area on macOS.
+
+Simulated typing sends one key event per character, so in "auto" mode it is
+only used as a fallback for short text; longer text always goes through the
+clipboard (retried once) with AppleScript as the last resort.
 """
 
 import os
+import re
 import sys
 import time
+import queue
 import logging
+import tempfile
+import functools
+import threading
 import subprocess
+import weakref
 from typing import Optional, Dict, Any
+from concurrent.futures import Future
+
+# PyObjC and pynput pull in many frameworks, so they are imported on first use
+# rather than at module import. Each loader runs once and fills in these globals.
+NSPasteboard = NSPasteboardTypeString = NSWorkspace = None
+CGEventCreateKeyboardEvent = CGEventPost = CGEventSetFlags = CGEventKeyboardSetUnicodeString = None
+kCGHIDEventTap = kCGEventFlagMaskCommand = None
+KeyboardController = MouseController = None
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_appkit() -> bool:
+    """Import the AppKit symbols used here; return whether they are available."""
+    global NSPasteboard, NSPasteboardTypeString, NSWorkspace
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString, NSWorkspace
+        return True
+    except ImportError:
+        print("Warning: macOS APIs not available. Install with: pip install pyobjc-framework-Cocoa pyobjc-framework-Quartz")
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_quartz() -> bool:
+    """Import the Quartz event symbols used here; return whether they are available."""
+    global CGEventCreateKeyboardEvent, CGEventPost, CGEventSetFlags, CGEventKeyboardSetUnicodeString
+    global kCGHIDEventTap, kCGEventFlagMaskCommand
+    try:
+        from Quartz import (
+            CGEventCreateKeyboardEvent, CGEventPost, kCGHIDEventTap,
+            CGEventSetFlags, kCGEventFlagMaskCommand, CGEventKeyboardSetUnicodeString
+        )
+        return True
+    except ImportError:
+        print("Warning: Quartz not available. Install with: pip install pyobjc-framework-Quartz")
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_pynput() -> bool:
+    """Import the pynput controllers; return whether they are available."""
+    global KeyboardController, MouseController
+    try:
+        from pynput.keyboard import Controller as KeyboardController
+        from pynput.mouse import Controller as MouseController
+        return True
+    except ImportError:
+        print("Warning: pynput not available. Install with: pip install pynput")
+        return False
+
+# Inserts already queued behind the one being started are merged into it, up to
+# this many characters
+_COALESCE_MAX_CHARS = 4000
+
+# Longest text sent as AppleScript keystrokes (one key event per character);
+# longer text is pasted instead
+_KEYSTROKE_MAX_CHARS = 200
+
+# Longest text "auto" mode will fall back to typing character by character
+_TYPING_MAX_CHARS = 8
+
+# Most UTF-16 code units a single keyboard event can carry
+_UNICODE_EVENT_MAX_UNITS = 20
+
+# Virtual key code of the "v" key (ANSI layout)
+_KEYCODE_V = 9
+
+# Seconds the focused app gets to read the pasteboard after CMD+V is posted
+# before the user's clipboard is put back. CGEventPost returns before the app
+# handles the event, so restoring sooner can paste the old clipboard instead.
+_CLIPBOARD_RESTORE_DELAY = 0.15
+
+# Escapes for text inside an AppleScript string literal, applied in one pass; line
+# breaks become escapes so scripts stay on one line
+_APPLESCRIPT_ESCAPE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+# Minimal environment for osascript; it needs nothing from ours
+_OSA_ENV = {'PATH': '/usr/bin'}
+
+# Written after each script sent to the osascript coprocess to mark the end of its output
+_OSA_SENTINEL = "__DICTO_END__"
+
+# osascript error lines look like "execution error: ... (-1743)" or "0:5: syntax error: ... (-2741)"
+_OSA_ERROR_RE = re.compile(r'error: .*\(-?\d+\)\s*$')
+
+# Interactive osascript may echo a ">>" prompt and prefix results with "=>"
+_OSA_RESULT_RE = re.compile(r'^(?:>>\s*)*(?:=>\s*)?(.*)$')
+
+
+def _stop_process(proc: subprocess.Popen):
+    """Close a coprocess's stdin and wait for it, killing it if it lingers."""
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _insert_worker(inserter_ref: "weakref.ref[AutoTextInserter]", work_queue: queue.Queue):
+    """
+    Perform queued inserts until None is queued or the inserter is gone.
+    
+    Inserts already waiting in the queue when one is started, with the same
+    method and clipboard setting, are merged into it; the worker never waits
+    for more to arrive, so a lone insert starts immediately. The inserter
+    is only held while an insert runs, so the thread never keeps it alive.
+    """
+    pending = []  # Item read while coalescing that belongs to the next insert
+    while True:
+        item = pending.pop() if pending else work_queue.get()
+        if item is None:
+            return
+        text, method, preserve_clipboard, future = item
+        texts, futures = [], []
+        if future.set_running_or_notify_cancel():
+            texts.append(text)
+            futures.append(future)
+        
+        # Coalesce followers that are already queued
+        length = len(text)
+        while length < _COALESCE_MAX_CHARS:
+            try:
+                nxt = work_queue.get_nowait()
+            except queue.Empty:
+                break
+            if nxt is None or nxt[1] != method or nxt[2] != preserve_clipboard:
+                pending.append(nxt)
+                break
+            if nxt[3].set_running_or_notify_cancel():
+                texts.append(nxt[0])
+                futures.append(nxt[3])
+                length += len(nxt[0])
+        
+        if not futures:
+            continue
+        inserter = inserter_ref()
+        if inserter is None:
+            for f in futures:
+                f.set_result(False)
+            return
+        try:
+            result = inserter._insert_now("".join(texts), method, preserve_clipboard)
+        except Exception as e:
+            for f in futures:
+                f.set_exception(e)
+        else:
+            for f in futures:
+                f.set_result(result)
+        finally:
+            del inserter
 
-try:
-    from AppKit import NSPasteboard, NSStringPboardType, NSWorkspace
-    from Quartz import (
-        CGEventCreateKeyboardEvent, CGEventPost, kCGHIDEventTap,
-        kCGEventKeyDown, kCGEventKeyUp, CGEventCreateFromGestureCall,
-        CGEventSetFlags, kCGEventFlagMaskCommand
-    )
-    MACOS_APIS_AVAILABLE = True
-except ImportError:
-    print("Warning: macOS APIs not available. Install with: pip install pyobjc-framework-Cocoa pyobjc-framework-Quartz")
-    MACOS_APIS_AVAILABLE = False
-
-try:
-    from pynput.keyboard import Key, Controller as KeyboardController
-    from pynput.mouse import Controller as MouseController
-    PYNPUT_AVAILABLE = True
-except ImportError:
-    print("Warning: pynput not available. Install with: pip install pynput")
-    PYNPUT_AVAILABLE = False
+
+@functools.lru_cache(maxsize=1)
+def _check_applescript() -> bool:
+    """Check if AppleScript is available (probed once per process)."""
+    try:
+        result = subprocess.run(['osascript', '-e', 'return 1'],
+                              stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL, env=_OSA_ENV, timeout=2)
+        return result.returncode == 0
+    except Exception:
+        return False
 
 
 class AutoTextInserter:
@@ -39,8 +195,9 @@ class AutoTextInserter:
     
     Uses multiple methods for maximum compatibility:
     1. Clipboard + CMD+V simulation (most reliable)
-    2. Direct typing simulation
-    3. AppleScript integration
+    2. Unicode keyboard event (short text, leaves the clipboard alone)
+    3. Direct typing simulation
+    4. AppleScript integration
     """
     
     def __init__(self):
@@ -48,9 +205,25 @@ class AutoTextInserter:
         self.logger = logging.getLogger(__name__)
         
         # Check available methods
-        self.clipboard_available = MACOS_APIS_AVAILABLE
-        self.typing_available = PYNPUT_AVAILABLE
-        self.applescript_available = self._check_applescript()
+        self.clipboard_available = _lazy_appkit()
+        self.typing_available = _lazy_pynput()
+        self.applescript_available = _check_applescript()
+        
+        # Persistent AppleScript interpreter, shared by all AppleScript calls
+        self._osa = None
+        self._osa_finalizer: Optional[weakref.finalize] = None
+        self._osa_lines: queue.Queue = queue.Queue()
+        self._osa_lock = threading.Lock()
+        if self.applescript_available:
+            self._start_osa()
+        
+        # Bind the pasteboard and its selectors once instead of per insert
+        if self.clipboard_available:
+            self._pasteboard = NSPasteboard.generalPasteboard()
+            self._clear = self._pasteboard.clearContents
+            self._set_string = self._pasteboard.setString_forType_
+            self._get_string = self._pasteboard.stringForType_
+            self._change_count = self._pasteboard.changeCount
         
         # Initialize controllers
         if self.typing_available:
@@ -60,96 +233,283 @@ class AutoTextInserter:
         # Store original clipboard content
         self.original_clipboard = None
         
+        # Timer that puts the original clipboard back once the paste has been read
+        self._restore_timer: Optional[threading.Timer] = None
+        self._restore_lock = threading.Lock()
+        
+        # Background worker that performs queued inserts in order (started on first use)
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_finalizer: Optional[weakref.finalize] = None
+        self._worker_lock = threading.Lock()
+        
         self.logger.info(f"AutoTextInserter initialized - Clipboard: {self.clipboard_available}, "
                         f"Typing: {self.typing_available}, AppleScript: {self.applescript_available}")
     
-    def _check_applescript(self) -> bool:
-        """Check if AppleScript is available."""
+    def _start_osa(self):
+        """Start the persistent `osascript -i` coprocess, if osascript exists."""
         try:
-            result = subprocess.run(['osascript', '-e', 'return 1'], 
-                                  capture_output=True, timeout=2)
-            return result.returncode == 0
-        except Exception:
-            return False
+            self._osa = subprocess.Popen(
+                ['osascript', '-i'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,  # Keep errors in order with results
+                text=True,
+                bufsize=1,
+                env=_OSA_ENV
+            )
+        except OSError as e:
+            self.logger.debug(f"osascript coprocess not started: {e}")
+            self._osa = None
+            return
+        
+        # Stops the coprocess when the inserter is collected or at exit
+        self._osa_finalizer = weakref.finalize(self, _stop_process, self._osa)
+        
+        reader = threading.Thread(target=self._read_osa, args=(self._osa.stdout, self._osa_lines), daemon=True)
+        reader.start()
+    
+    @staticmethod
+    def _read_osa(stream, lines: queue.Queue):
+        """Forward coprocess output lines to the queue; None marks EOF."""
+        try:
+            for line in stream:
+                lines.put(line)
+        finally:
+            lines.put(None)
+    
+    def _osa_eval(self, script: str, timeout: float = 5) -> Optional[str]:
+        """
+        Run a single-line AppleScript and return its result.
+        
+        Uses the persistent osascript coprocess, falling back to a one-shot
+        osascript if the coprocess isn't running.
+        
+        Args:
+            script: AppleScript source (one line)
+            timeout: Seconds to wait for the result
+            
+        Returns:
+            Optional[str]: The script's result as text, or None if it failed
+        """
+        with self._osa_lock:
+            if self._osa is None or self._osa.poll() is not None:
+                return self._osa_run_once(script, timeout)
+            
+            try:
+                self._osa.stdin.write(f'{script}\n"{_OSA_SENTINEL}"\n')
+                self._osa.stdin.flush()
+            except OSError as e:
+                self.logger.warning(f"osascript coprocess unavailable: {e}")
+                self._stop_osa()
+                return self._osa_run_once(script, timeout)
+            
+            deadline = time.monotonic() + timeout
+            result = ""
+            error = None
+            while True:
+                try:
+                    line = self._osa_lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    line = None
+                if line is None:
+                    # Timed out or exited mid-script: its state is unknown, don't reuse it
+                    self.logger.warning("osascript coprocess stopped responding")
+                    self._stop_osa()
+                    return None
+                if _OSA_SENTINEL in line:
+                    break
+                if _OSA_ERROR_RE.search(line):
+                    error = line.strip()
+                else:
+                    value = _OSA_RESULT_RE.match(line.strip()).group(1)
+                    if value:
+                        result = value
+            
+            if error:
+                self.logger.error(f"AppleScript failed: {error}")
+                return None
+            return result.strip('"')
+    
+    def _osa_run_once(self, script: str, timeout: float) -> Optional[str]:
+        """Run an AppleScript in a one-shot osascript process."""
+        try:
+            result = subprocess.run(['osascript', '-e', script],
+                                  capture_output=True, text=True, env=_OSA_ENV, timeout=timeout)
+        except Exception as e:
+            self.logger.debug(f"osascript failed: {e}")
+            return None
+        if result.returncode != 0:
+            self.logger.error(f"AppleScript failed: {result.stderr.strip()}")
+            return None
+        return result.stdout.strip()
+    
+    def _stop_osa(self):
+        """Terminate the osascript coprocess."""
+        osa, self._osa = self._osa, None
+        if osa is None:
+            return
+        # Runs _stop_process once and detaches it from the inserter
+        self._osa_finalizer()
+    
+    def close(self):
+        """Stop the insert worker and release the osascript coprocess."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._worker_finalizer()  # Queues None, which stops the worker
+            worker.join(timeout=5)
+        self._finish_pending_restore()
+        with self._osa_lock:
+            self._stop_osa()
     
-    def insert_text(self, text: str, method: str = "auto") -> bool:
+    def insert_text(self, text: str, method: str = "auto", preserve_clipboard: bool = True) -> bool:
         """
         Insert text into the currently focused text input area.
         
         Args:
             text: Text to insert
-            method: Method to use ("auto", "clipboard", "typing", "applescript")
+            method: Method to use ("auto", "clipboard", "unicode", "typing", "applescript")
+            preserve_clipboard: Restore the user's clipboard after a clipboard insert
             
         Returns:
             bool: True if text was inserted successfully
         """
+        return self.insert_text_async(text, method, preserve_clipboard).result()
+    
+    def insert_text_async(self, text: str, method: str = "auto", preserve_clipboard: bool = True) -> Future:
+        """
+        Queue text for insertion and return immediately.
+        
+        Inserts run one at a time, in order, on a background worker thread.
+        
+        Args:
+            text: Text to insert
+            method: Method to use ("auto", "clipboard", "unicode", "typing", "applescript")
+            preserve_clipboard: Restore the user's clipboard after a clipboard insert
+            
+        Returns:
+            Future: Resolves to True if text was inserted successfully
+        """
+        future: Future = Future()
         if not text:
             self.logger.warning("No text provided for insertion")
-            return False
+            future.set_result(False)
+            return future
         
+        with self._worker_lock:
+            if self._worker is None:
+                # The worker only holds a weak reference, and the finalizer stops
+                # it once the inserter is collected or at interpreter exit
+                self._worker = threading.Thread(target=_insert_worker, args=(weakref.ref(self), self._queue),
+                                                name="AutoTextInserter", daemon=True)
+                self._worker_finalizer = weakref.finalize(self, self._queue.put, None)
+                self._worker.start()
+            self._queue.put((text, method, preserve_clipboard, future))
+        return future
+    
+    def _insert_now(self, text: str, method: str, preserve_clipboard: bool) -> bool:
+        """Insert text on the calling thread using the given method."""
         self.logger.info(f"Inserting text using method: {method}")
         
         # Try methods in order of reliability
         if method == "auto":
-            return (self._insert_via_clipboard(text) or 
-                   self._insert_via_typing(text) or
+            # Short text fits in one keyboard event, leaving the clipboard untouched
+            if preserve_clipboard and self._insert_via_cgunicode(text):
+                return True
+            if self._insert_via_clipboard(text, preserve_clipboard):
+                return True
+            if len(text) > _TYPING_MAX_CHARS:
+                # Too long to type key by key; retry the paste with more settle time
+                return (self._insert_via_clipboard(text, preserve_clipboard, paste_delay=0.05) or
+                       self._insert_via_applescript(text))
+            return (self._insert_via_typing(text) or
                    self._insert_via_applescript(text))
         elif method == "clipboard":
-            return self._insert_via_clipboard(text)
+            return self._insert_via_clipboard(text, preserve_clipboard)
+        elif method == "unicode":
+            return self._insert_via_cgunicode(text)
         elif method == "typing":
             return self._insert_via_typing(text)
         elif method == "applescript":
+            if len(text) > _KEYSTROKE_MAX_CHARS and self.clipboard_available:
+                self.logger.warning(f"Text too long for AppleScript keystrokes ({len(text)} chars); using clipboard")
+                return self._insert_via_clipboard(text, preserve_clipboard)
             return self._insert_via_applescript(text)
         else:
             self.logger.error(f"Unknown insertion method: {method}")
             return False
     
-    def _insert_via_clipboard(self, text: str) -> bool:
-        """Insert text by copying to clipboard and simulating CMD+V."""
+    def _insert_via_clipboard(self, text: str, preserve_clipboard: bool = True,
+                              paste_delay: float = 0.0) -> bool:
+        """
+        Insert text by copying to clipboard and simulating CMD+V.
+        
+        Args:
+            text: Text to insert
+            preserve_clipboard: Restore the previous clipboard content afterwards
+            paste_delay: Seconds to wait between setting the clipboard and pasting
+        """
         if not self.clipboard_available:
             return False
         
+        # Change count right after our write; the clipboard is only restored if
+        # nothing else has written to it since
+        change_count = None
         try:
-            # Store original clipboard content
-            self._backup_clipboard()
+            # Store original clipboard content. If the previous paste's restore
+            # is still pending, the clipboard holds that paste's text and the
+            # user's content is already in original_clipboard; it is kept and
+            # restored after this paste instead, even if this insert doesn't
+            # preserve the clipboard itself.
+            if self._cancel_pending_restore():
+                pass
+            elif preserve_clipboard:
+                self._backup_clipboard()
+            else:
+                self.original_clipboard = None
             
-            # Set text to clipboard
-            pasteboard = NSPasteboard.generalPasteboard()
-            pasteboard.clearContents()
-            success = pasteboard.setString_forType_(text, NSStringPboardType)
+            # Set text to clipboard; the write and its change count update are
+            # synchronous, so the count can be read straight back
+            self._clear()
+            success = self._set_string(text, NSPasteboardTypeString)
             
             if not success:
                 self.logger.error("Failed to set clipboard content")
                 return False
+            change_count = self._change_count()
             
-            # Small delay to ensure clipboard is set
-            time.sleep(0.05)
+            if paste_delay:
+                time.sleep(paste_delay)
             
             # Simulate CMD+V
             if self._simulate_paste_shortcut():
                 self.logger.info("Text inserted via clipboard method")
                 
-                # Restore original clipboard after a short delay
-                time.sleep(0.1)
-                self._restore_clipboard()
+                # Restore once the focused app has had time to read the clipboard,
+                # off this thread so the insert returns right away
+                if self.original_clipboard:
+                    self._schedule_restore(change_count)
                 return True
             else:
-                self._restore_clipboard()
+                self._restore_clipboard(change_count)
                 return False
                 
         except Exception as e:
             self.logger.error(f"Error in clipboard insertion: {e}")
-            self._restore_clipboard()
+            self._restore_clipboard(change_count)
             return False
     
     def _simulate_paste_shortcut(self) -> bool:
         """Simulate CMD+V key combination."""
         try:
-            if self.typing_available:
-                # Use pynput to simulate CMD+V
-                with self.keyboard.pressed(Key.cmd):
-                    self.keyboard.press('v')
-                    self.keyboard.release('v')
+            if _lazy_quartz():
+                # Post CMD+V directly; both events carry the command flag so the
+                # modifier can't be lost between them
+                for key_down in (True, False):
+                    event = CGEventCreateKeyboardEvent(None, _KEYCODE_V, key_down)
+                    CGEventSetFlags(event, kCGEventFlagMaskCommand)
+                    CGEventPost(kCGHIDEventTap, event)
                 return True
             else:
                 # Fallback to subprocess
@@ -162,18 +522,33 @@ class AutoTextInserter:
     def _simulate_paste_via_subprocess(self) -> bool:
         """Simulate CMD+V using AppleScript as fallback."""
         try:
-            script = '''
-            tell application "System Events"
-                keystroke "v" using command down
-            end tell
-            '''
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, timeout=2)
-            return result.returncode == 0
+            script = 'tell application "System Events" to keystroke "v" using command down'
+            return self._osa_eval(script, timeout=2) is not None
         except Exception as e:
             self.logger.error(f"Error in subprocess paste simulation: {e}")
             return False
     
+    def _insert_via_cgunicode(self, text: str) -> bool:
+        """Insert short text as the unicode payload of a single keyboard event."""
+        if not _lazy_quartz():
+            return False
+        
+        length = len(text.encode('utf-16-le')) // 2
+        if length > _UNICODE_EVENT_MAX_UNITS:
+            return False
+        
+        try:
+            for key_down in (True, False):
+                event = CGEventCreateKeyboardEvent(None, 0, key_down)
+                CGEventKeyboardSetUnicodeString(event, length, text)
+                CGEventPost(kCGHIDEventTap, event)
+            self.logger.info("Text inserted via unicode event method")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error in unicode event insertion: {e}")
+            return False
+    
     def _insert_via_typing(self, text: str) -> bool:
         """Insert text by simulating direct typing."""
         if not self.typing_available:
@@ -194,47 +569,104 @@ class AutoTextInserter:
         if not self.applescript_available:
             return False
         
+        if len(text) > _KEYSTROKE_MAX_CHARS:
+            return self._paste_via_applescript(text)
+        
         try:
-            # Escape quotes and backslashes in the text
-            escaped_text = text.replace('\\', '\\\\').replace('"', '\\"')
+            escaped_text = text.translate(_APPLESCRIPT_ESCAPE)
             
-            script = f'''
-            tell application "System Events"
-                keystroke "{escaped_text}"
-            end tell
-            '''
+            script = f'tell application "System Events" to keystroke "{escaped_text}"'
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, timeout=5)
-            
-            if result.returncode == 0:
+            if self._osa_eval(script, timeout=5) is not None:
                 self.logger.info("Text inserted via AppleScript method")
                 return True
-            else:
-                self.logger.error(f"AppleScript failed: {result.stderr.decode()}")
-                return False
+            return False
                 
         except Exception as e:
             self.logger.error(f"Error in AppleScript insertion: {e}")
             return False
     
+    def _paste_via_applescript(self, text: str) -> bool:
+        """Insert long text with AppleScript by loading it into the clipboard and pasting once."""
+        fd, path = tempfile.mkstemp(prefix="dicto_insert_", suffix=".txt")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            
+            escaped_path = path.translate(_APPLESCRIPT_ESCAPE)
+            if self._osa_eval(f'set the clipboard to (read POSIX file "{escaped_path}" as «class utf8»)', timeout=5) is None:
+                return False
+            if self._simulate_paste_via_subprocess():
+                self.logger.info("Text inserted via AppleScript paste")
+                return True
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"Error in AppleScript paste insertion: {e}")
+            return False
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    
     def _backup_clipboard(self):
         """Backup current clipboard content."""
         try:
             if self.clipboard_available:
-                pasteboard = NSPasteboard.generalPasteboard()
-                self.original_clipboard = pasteboard.stringForType_(NSStringPboardType)
+                self.original_clipboard = self._get_string(NSPasteboardTypeString)
         except Exception as e:
             self.logger.warning(f"Failed to backup clipboard: {e}")
             self.original_clipboard = None
     
-    def _restore_clipboard(self):
-        """Restore original clipboard content."""
+    def _schedule_restore(self, expected_change_count: int):
+        """Restore the original clipboard after _CLIPBOARD_RESTORE_DELAY on a timer thread."""
+        with self._restore_lock:
+            timer = threading.Timer(_CLIPBOARD_RESTORE_DELAY, self._run_scheduled_restore,
+                                    args=(expected_change_count,))
+            timer.daemon = True
+            self._restore_timer = timer
+            timer.start()
+    
+    def _run_scheduled_restore(self, expected_change_count: int):
+        """Timer callback: restore the clipboard unless the restore was cancelled meanwhile."""
+        with self._restore_lock:
+            if self._restore_timer is not threading.current_thread():
+                return
+            self._restore_timer = None
+            self._restore_clipboard(expected_change_count)
+    
+    def _cancel_pending_restore(self) -> bool:
+        """Cancel a scheduled clipboard restore; return whether one was pending."""
+        with self._restore_lock:
+            timer, self._restore_timer = self._restore_timer, None
+        if timer is None:
+            return False
+        timer.cancel()
+        return True
+    
+    def _finish_pending_restore(self):
+        """Wait for a scheduled clipboard restore to run."""
+        with self._restore_lock:
+            timer = self._restore_timer
+        if timer is not None:
+            timer.join()
+    
+    def _restore_clipboard(self, expected_change_count: Optional[int] = None):
+        """
+        Restore original clipboard content.
+        
+        Args:
+            expected_change_count: Pasteboard change count after our write; if the
+                clipboard has changed since, it belongs to someone else and is left alone
+        """
         try:
             if self.clipboard_available and self.original_clipboard:
-                pasteboard = NSPasteboard.generalPasteboard()
-                pasteboard.clearContents()
-                pasteboard.setString_forType_(self.original_clipboard, NSStringPboardType)
+                if expected_change_count is not None and self._change_count() != expected_change_count:
+                    self.logger.debug("Clipboard changed during insertion; not restoring")
+                    return
+                self._clear()
+                self._set_string(self.original_clipboard, NSPasteboardTypeString)
                 self.logger.debug("Original clipboard content restored")
         except Exception as e:
             self.logger.warning(f"Failed to restore clipboard: {e}")
@@ -242,24 +674,7 @@ class AutoTextInserter:
     def get_focused_app_info(self) -> Dict[str, Any]:
         """Get information about the currently focused application."""
         try:
-            if self.applescript_available:
-                script = '''
-                tell application "System Events"
-                    set frontApp to name of first application process whose frontmost is true
-                    return frontApp
-                end tell
-                '''
-                result = subprocess.run(['osascript', '-e', script], 
-                                      capture_output=True, text=True, timeout=2)
-                
-                if result.returncode == 0:
-                    app_name = result.stdout.strip()
-                    return {
-                        "app_name": app_name,
-                        "method": "applescript"
-                    }
-            
-            # Fallback to NSWorkspace
+            # NSWorkspace is an in-process call; try it first
             if self.clipboard_available:
                 workspace = NSWorkspace.sharedWorkspace()
                 active_app = workspace.activeApplication()
@@ -270,6 +685,17 @@ class AutoTextInserter:
                         "method": "nsworkspace"
                     }
             
+            # Fallback to AppleScript
+            if self.applescript_available:
+                script = 'tell application "System Events" to get name of first application process whose frontmost is true'
+                app_name = self._osa_eval(script, timeout=2)
+                
+                if app_name is not None:
+                    return {
+                        "app_name": app_name,
+                        "method": "applescript"
+                    }
+            
             return {"app_name": "Unknown", "method": "none"}
             
         except Exception as e:
@@ -297,6 +723,18 @@ class AutoTextInserter:
         return success
 
 
+# Interactive test menu
+_MENU = (
+    "\n📝 Test Options:\n"
+    "1. Test clipboard insertion (CMD+V)\n"
+    "2. Test direct typing\n"
+    "3. Test AppleScript insertion\n"
+    "4. Test auto method (tries all)\n"
+    "5. Get focused app info\n"
+    "6. Exit\n"
+)
+
+
 def test_auto_text_inserter():
     """Test function for the AutoTextInserter."""
     logging.basicConfig(level=logging.INFO)
@@ -310,13 +748,7 @@ def test_auto_text_inserter():
     test_text = "Hello from Dicto! This is a test of automatic text insertion."
     
     while True:
-        print("\n📝 Test Options:")
-        print("1. Test clipboard insertion (CMD+V)")
-        print("2. Test direct typing")
-        print("3. Test AppleScript insertion")
-        print("4. Test auto method (tries all)")
-        print("5. Get focused app info")
-        print("6. Exit")
+        sys.stdout.write(_MENU)
         
         try:
             choice = input("\nEnter your choice (1-6): ").strip()
@@ -7,18 +7,100 @@ hotkey response times, transcription speed, and memory usage.
 
 import os
 import sys
+import mmap
 import time
 import threading
 import logging
 import psutil
 import tempfile
 import statistics
+import textwrap
+from array import array
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 import json
-import subprocess
-from datetime import datetime
+
+__all__ = [
+    "BenchmarkResult",
+    "SystemBenchmark",
+    "AudioBenchmark",
+    "HotkeyBenchmark",
+    "PerformanceBenchmarkSuite",
+]
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in so jitted kernels still run as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+# Elements per CPU stress buffer (4 MiB of float32, roughly L2/L3 sized)
+_STRESS_ELEMENTS = 1 << 20
+
+
+# Compiled lazily on first call (and cached on disk), so importing this module
+# never waits on numba
+@njit(nogil=True, fastmath=True, cache=True)
+def _stress_kernel(a, out):
+    """Fused multiply-add over a buffer; releases the GIL so threads run on all cores."""
+    for i in range(a.shape[0]):
+        out[i] = a[i] * a[i] + a[i]
+
+
+@dataclass
+class _RunningStats:
+    """Count, sum and maximum of a stream of samples, updated in O(1) per sample."""
+    n: int = 0
+    s: float = 0.0
+    mx: float = 0.0
+    
+    def add(self, x: float) -> None:
+        self.n += 1
+        self.s += x
+        if self.n == 1 or x > self.mx:
+            self.mx = x
+    
+    @property
+    def mean(self) -> float:
+        return self.s / self.n if self.n else 0.0
+    
+    @classmethod
+    def of(cls, values) -> "_RunningStats":
+        """Build stats from an already collected sequence of samples."""
+        stats = cls()
+        for x in values:
+            stats.add(x)
+        return stats
 
 
 @dataclass
@@ -32,6 +114,203 @@ class BenchmarkResult:
     error_count: int
     latency_stats: Dict[str, float]  # min, max, avg, p95, p99
     additional_metrics: Dict[str, Any]
+    # Running reductions of cpu_usage/memory_usage, kept by the sampler as samples arrive
+    cpu_stats: Optional[_RunningStats] = None
+    memory_stats: Optional[_RunningStats] = None
+
+
+def _sample_buffer(size: int) -> array:
+    """Preallocate a zeroed array of `size` doubles for fixed-count samples."""
+    return array('d', bytes(8 * size))
+
+
+def _latency_summary(latencies) -> Dict[str, float]:
+    """
+    Summarize latency samples as min/max/avg/p95/p99, sorting at most once.
+    
+    Percentiles are linearly interpolated. Returns an empty dict for no samples.
+    """
+    if len(latencies) == 0:
+        return {}
+    
+    if NUMPY_AVAILABLE:
+        values = np.asarray(latencies, dtype=np.float64)
+        p95, p99 = np.percentile(values, [95, 99])
+        return {
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "avg": float(values.mean()),
+            "p95": float(p95),
+            "p99": float(p99)
+        }
+    
+    ordered = sorted(latencies)
+    last = len(ordered) - 1
+    
+    def percentile(q: float) -> float:
+        pos = q / 100 * last
+        lower = int(pos)
+        upper = min(lower + 1, last)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+    
+    return {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "avg": statistics.mean(ordered),
+        "p95": percentile(95),
+        "p99": percentile(99)
+    }
+
+
+# Source for each metric a sampler tick can read; the tick is generated from
+# only the enabled entries, so a sampler never pays for reads it doesn't use
+_SAMPLER_METRICS = {
+    "rss": "rss = process.memory_info().rss\n",
+    "cpu": "cpu = psutil.cpu_percent(interval=None)\n",
+    "percpu": (
+        "per_core = psutil.cpu_percent(interval=None, percpu=True)\n"
+        "cpu = sum(per_core) / len(per_core)\n"
+    ),
+    "mem": "memory = psutil.virtual_memory().percent\n",
+}
+
+
+def _build_sampler_tick(metrics: Tuple[str, ...], process: psutil.Process) -> Callable[[], Tuple]:
+    """
+    Compile a tick function reading just `metrics` (keys of _SAMPLER_METRICS).
+    
+    The tick returns (rss, cpu, per_core, memory); metrics that are not enabled
+    read as 0, or None for per_core.
+    """
+    unknown = set(metrics) - _SAMPLER_METRICS.keys()
+    if unknown:
+        raise ValueError(f"Unknown sampler metrics: {sorted(unknown)}")
+    
+    reads = "".join(_SAMPLER_METRICS[name] for name in _SAMPLER_METRICS if name in metrics)
+    if "rss" in metrics:
+        # One oneshot() scope per tick so process stats share a single kernel read
+        reads = "with process.oneshot():\n" + textwrap.indent(reads, "    ")
+    source = (
+        "def _tick():\n"
+        "    rss = cpu = memory = 0\n"
+        "    per_core = None\n"
+        + textwrap.indent(reads, "    ")
+        + "    return rss, cpu, per_core, memory\n"
+    )
+    
+    namespace = {"psutil": psutil, "process": process}
+    exec(compile(source, "<sampler tick>", "exec"), namespace)
+    return namespace["_tick"]
+
+
+class _ResourceSampler(threading.Thread):
+    """
+    Samples system CPU and memory usage on its own thread at a fixed cadence,
+    so benchmark loops never block on psutil while they are being timed.
+    """
+    
+    def __init__(self, period: float = 0.1, keep_samples: bool = True,
+                 metrics: Tuple[str, ...] = ("rss", "cpu", "mem")):
+        """
+        Args:
+            period: Seconds between samples
+            keep_samples: Keep every sample as well as the running stats
+            metrics: Which of _SAMPLER_METRICS to read each tick; "percpu"
+                records per-core CPU usage instead of "cpu" (requires NumPy)
+        """
+        super().__init__(name="ResourceSampler", daemon=True)
+        self.period = period
+        self.keep_samples = keep_samples
+        if "percpu" in metrics and not NUMPY_AVAILABLE:
+            metrics = tuple("cpu" if name == "percpu" else name for name in metrics)
+        self.percpu = "percpu" in metrics
+        self._percpu_samples = None  # (samples, cores) float32, sized on the first read
+        self._percpu_count = 0
+        self._cpu: List[float] = []
+        self._memory: List[float] = []
+        self.cpu_stats = _RunningStats()
+        self.memory_stats = _RunningStats()
+        self._latest_cpu = 0.0
+        self._lock = threading.Lock()
+        self._sampled = threading.Condition(self._lock)  # Notified after every sample
+        self._stop_event = threading.Event()
+        self._process = psutil.Process()
+        self._tick = _build_sampler_tick(metrics, self._process)
+        self.peak_rss_mb = 0.0  # Peak resident memory of this process
+    
+    def start(self) -> "_ResourceSampler":
+        super().start()
+        return self
+    
+    def run(self):
+        # psutil keeps the non-blocking CPU baseline per thread, so prime and
+        # read it only from this thread; concurrent samplers then stay independent
+        if self.percpu:
+            cores = len(psutil.cpu_percent(interval=None, percpu=True))
+            self._percpu_samples = np.empty((64, cores), dtype=np.float32)
+        else:
+            psutil.cpu_percent(interval=None)
+        while not self._stop_event.wait(self.period):
+            self._sample()
+        self._sample()
+    
+    def _sample(self):
+        rss, cpu, per_core, memory = self._tick()
+        with self._lock:
+            if per_core is not None:
+                self._store_per_core(per_core)
+            self._latest_cpu = cpu
+            self.peak_rss_mb = max(self.peak_rss_mb, rss / (1024 * 1024))
+            self.cpu_stats.add(cpu)
+            self.memory_stats.add(memory)
+            if self.keep_samples:
+                self._cpu.append(cpu)
+                self._memory.append(memory)
+            self._sampled.notify_all()
+    
+    def _store_per_core(self, per_core: List[float]) -> None:
+        """Append one row of per-core readings, doubling the array when full."""
+        samples = self._percpu_samples
+        if self._percpu_count == len(samples):
+            grown = np.empty((2 * len(samples), samples.shape[1]), dtype=np.float32)
+            grown[:self._percpu_count] = samples
+            self._percpu_samples = samples = grown
+        samples[self._percpu_count] = per_core
+        self._percpu_count += 1
+    
+    def per_core_summary(self) -> Dict[str, List[float]]:
+        """Mean and max usage of each core, or an empty dict without per-core samples."""
+        with self._lock:
+            if not self._percpu_count:
+                return {}
+            samples = self._percpu_samples[:self._percpu_count]
+            return {
+                "avg": samples.mean(axis=0).tolist(),
+                "max": samples.max(axis=0).tolist()
+            }
+    
+    def wait_for_samples(self, count: int, timeout: float) -> bool:
+        """
+        Block until `count` more samples have been taken, or `timeout` seconds pass.
+        
+        Returns:
+            True if the samples arrived before the timeout
+        """
+        with self._sampled:
+            target = self.cpu_stats.n + count
+            return self._sampled.wait_for(lambda: self.cpu_stats.n >= target, timeout)
+    
+    @property
+    def latest_cpu(self) -> float:
+        """Most recent CPU reading, or 0 before the first sample."""
+        with self._lock:
+            return self._latest_cpu
+    
+    def stop(self) -> Tuple[List[float], List[float]]:
+        """Stop sampling and return the (cpu, memory) readings, with a final sample."""
+        self._stop_event.set()
+        self.join()
+        return self._cpu, self._memory
 
 
 class SystemBenchmark:
@@ -44,44 +323,66 @@ class SystemBenchmark:
         """Run CPU stress test to measure performance under load."""
         self.logger.info(f"Running CPU stress test for {duration} seconds")
         
+        # CPU stress function: floating-point work that releases the GIL when NumPy
+        # is available, so one thread per core actually loads every core
+        if NUMBA_AVAILABLE:
+            kernel = "numba"
+            # Compile before the clock starts, not inside the measured window
+            _stress_kernel(np.zeros(1, dtype=np.float32), np.empty(1, dtype=np.float32))
+        elif NUMPY_AVAILABLE:
+            kernel = "numpy"
+        else:
+            kernel = "python"
+        
         start_time = time.time()
-        cpu_readings = []
-        memory_readings = []
+        end_time = start_time + duration
         
-        # CPU stress function
         def cpu_stress():
-            end_time = time.time() + duration
+            if kernel == "python":
+                while time.time() < end_time:
+                    [x**2 for x in range(10000)]
+                return
+            
+            a = np.random.rand(_STRESS_ELEMENTS).astype(np.float32)
+            out = np.empty_like(a)
             while time.time() < end_time:
-                # Perform CPU-intensive operations
-                [x**2 for x in range(10000)]
-        
-        # Start stress test
-        stress_thread = threading.Thread(target=cpu_stress)
-        stress_thread.start()
+                if kernel == "numba":
+                    _stress_kernel(a, out)
+                else:
+                    np.multiply(a, a, out=out)
+                    np.add(out, a, out=out)
         
-        # Monitor system resources
-        monitor_end = time.time() + duration
-        while time.time() < monitor_end:
-            cpu_readings.append(psutil.cpu_percent(interval=0.1))
-            memory_readings.append(psutil.virtual_memory().percent)
-            time.sleep(0.5)
+        thread_count = (os.cpu_count() or 1) if kernel != "python" else 1
         
-        stress_thread.join()
+        # Start stress test, monitoring system resources in the background
+        sampler = _ResourceSampler(period=0.5, metrics=("rss", "percpu", "mem")).start()
+        stress_threads = [threading.Thread(target=cpu_stress) for _ in range(thread_count)]
+        for thread in stress_threads:
+            thread.start()
+        for thread in stress_threads:
+            thread.join()
+        cpu_readings, memory_readings = sampler.stop()
         
         return BenchmarkResult(
             test_name="CPU Stress Test",
             duration=time.time() - start_time,
             cpu_usage=cpu_readings,
             memory_usage=memory_readings,
+            cpu_stats=sampler.cpu_stats,
+            memory_stats=sampler.memory_stats,
             success_rate=1.0,
             error_count=0,
             latency_stats={
-                "avg_cpu": statistics.mean(cpu_readings),
-                "max_cpu": max(cpu_readings),
-                "avg_memory": statistics.mean(memory_readings),
-                "max_memory": max(memory_readings)
+                "avg_cpu": sampler.cpu_stats.mean,
+                "max_cpu": sampler.cpu_stats.mx,
+                "avg_memory": sampler.memory_stats.mean,
+                "max_memory": sampler.memory_stats.mx
             },
-            additional_metrics={}
+            additional_metrics={
+                "kernel": kernel,
+                "threads": thread_count,
+                "per_core_cpu": sampler.per_core_summary()
+            }
         )
     
     def run_memory_stress_test(self, target_mb: int = 500) -> BenchmarkResult:
@@ -89,52 +390,54 @@ class SystemBenchmark:
         self.logger.info(f"Running memory stress test with {target_mb}MB allocation")
         
         start_time = time.time()
-        cpu_readings = []
-        memory_readings = []
+        sampler = _ResourceSampler(period=0.1).start()
+        
+        # Allocate memory in chunks of anonymous pages straight from the OS,
+        # so the test measures real page pressure and releases it on close()
+        memory_chunks = []
+        chunk_size = 10 * 1024 * 1024  # 10MB chunks
+        chunks_needed = target_mb // 10
+        pages_per_chunk = chunk_size // mmap.PAGESIZE
+        touch = b'\x01' * pages_per_chunk
         
         try:
-            # Allocate memory in chunks
-            memory_chunks = []
-            chunk_size = 10 * 1024 * 1024  # 10MB chunks
-            chunks_needed = target_mb // 10
-            
             for i in range(chunks_needed):
-                memory_chunks.append(bytearray(chunk_size))
-                
-                # Monitor during allocation
-                cpu_readings.append(psutil.cpu_percent(interval=0.1))
-                memory_readings.append(psutil.virtual_memory().percent)
-                
-                # Small delay between allocations
-                time.sleep(0.1)
+                chunk = mmap.mmap(-1, chunk_size, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+                memory_chunks.append(chunk)
+                # Write one byte per page so every page is actually committed
+                chunk[::mmap.PAGESIZE] = touch
             
-            # Hold memory for a few seconds while monitoring
-            for _ in range(20):
-                cpu_readings.append(psutil.cpu_percent(interval=0.1))
-                memory_readings.append(psutil.virtual_memory().percent)
-                time.sleep(0.1)
+            # Hold memory until the sampler has seen the full allocation a few times
+            sampler.wait_for_samples(5, timeout=2.0)
             
             success_rate = 1.0
             error_count = 0
             
-        except MemoryError:
+        except (MemoryError, OSError):
             success_rate = 0.0
             error_count = 1
             self.logger.error("Memory allocation failed")
+        finally:
+            for chunk in memory_chunks:
+                chunk.close()
+        
+        cpu_readings, memory_readings = sampler.stop()
         
         return BenchmarkResult(
             test_name="Memory Stress Test",
             duration=time.time() - start_time,
             cpu_usage=cpu_readings,
             memory_usage=memory_readings,
+            cpu_stats=sampler.cpu_stats,
+            memory_stats=sampler.memory_stats,
             success_rate=success_rate,
             error_count=error_count,
             latency_stats={
-                "avg_cpu": statistics.mean(cpu_readings) if cpu_readings else 0,
-                "avg_memory": statistics.mean(memory_readings) if memory_readings else 0,
-                "peak_memory": max(memory_readings) if memory_readings else 0
+                "avg_cpu": sampler.cpu_stats.mean,
+                "avg_memory": sampler.memory_stats.mean,
+                "peak_memory": sampler.memory_stats.mx
             },
-            additional_metrics={"target_mb": target_mb}
+            additional_metrics={"target_mb": target_mb, "peak_rss_mb": sampler.peak_rss_mb}
         )
 
 
@@ -163,64 +466,62 @@ class AudioBenchmark:
             )
         
         start_time = time.time()
-        latencies = []
-        cpu_readings = []
-        memory_readings = []
+        latencies = _sample_buffer(iterations)
+        count = 0
         errors = 0
+        created_files: List[Path] = []
+        sampler = _ResourceSampler(period=0.1).start()
+        _pc = time.perf_counter_ns
         
         for i in range(iterations):
             try:
                 # Measure recording start latency
-                start_latency_time = time.time()
+                start_latency_time = _pc()
                 recording_file = self.audio_recorder.start_recording(duration=1.0)
-                start_latency = (time.time() - start_latency_time) * 1000  # ms
+                start_latency = (_pc() - start_latency_time) / 1_000_000  # ms
                 
                 if recording_file:
                     # Wait for recording to complete
                     time.sleep(1.1)
                     
                     # Measure stop latency
-                    stop_latency_time = time.time()
+                    stop_latency_time = _pc()
                     result_file = self.audio_recorder.stop_recording()
-                    stop_latency = (time.time() - stop_latency_time) * 1000  # ms
+                    stop_latency = (_pc() - stop_latency_time) / 1_000_000  # ms
                     
                     total_latency = start_latency + stop_latency
-                    latencies.append(total_latency)
+                    latencies[count] = total_latency
+                    count += 1
                     
-                    # Clean up
-                    if result_file and os.path.exists(result_file):
-                        os.remove(result_file)
+                    # Clean up after the loop so file I/O stays out of the timed window
+                    if result_file:
+                        created_files.append(Path(result_file))
                 else:
                     errors += 1
                 
-                # Monitor system resources
-                cpu_readings.append(psutil.cpu_percent(interval=0.1))
-                memory_readings.append(psutil.virtual_memory().percent)
-                
             except Exception as e:
                 self.logger.error(f"Recording test iteration {i} failed: {e}")
                 errors += 1
             
-            # Small delay between iterations
-            time.sleep(0.5)
+            # Let the sampler record at least one reading between iterations
+            sampler.wait_for_samples(1, timeout=0.5)
+        
+        cpu_readings, memory_readings = sampler.stop()
+        
+        for created_file in created_files:
+            created_file.unlink(missing_ok=True)
         
         success_rate = (iterations - errors) / iterations if iterations > 0 else 0
         
-        latency_stats = {}
-        if latencies:
-            latency_stats = {
-                "min": min(latencies),
-                "max": max(latencies),
-                "avg": statistics.mean(latencies),
-                "p95": statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 20 else max(latencies),
-                "p99": statistics.quantiles(latencies, n=100)[98] if len(latencies) >= 100 else max(latencies)
-            }
+        latency_stats = _latency_summary(latencies[:count])
         
         return BenchmarkResult(
             test_name="Recording Latency Test",
             duration=time.time() - start_time,
             cpu_usage=cpu_readings,
             memory_usage=memory_readings,
+            cpu_stats=sampler.cpu_stats,
+            memory_stats=sampler.memory_stats,
             success_rate=success_rate,
             error_count=errors,
             latency_stats=latency_stats,
@@ -248,58 +549,45 @@ class AudioBenchmark:
             test_files = self._create_test_audio_files()
         
         start_time = time.time()
-        transcription_times = []
-        cpu_readings = []
-        memory_readings = []
+        transcription_times = _sample_buffer(len(test_files))
+        count = 0
         errors = 0
+        sampler = _ResourceSampler(period=0.1).start()
+        _pc = time.perf_counter_ns
         
         for test_file in test_files:
             try:
                 if not os.path.exists(test_file):
                     continue
                 
-                # Monitor resources before transcription
-                cpu_before = psutil.cpu_percent(interval=0.1)
-                memory_before = psutil.virtual_memory().percent
-                
                 # Perform transcription
-                transcription_start = time.time()
+                transcription_start = _pc()
                 result = self.transcription_engine.transcribe_file(test_file)
-                transcription_time = time.time() - transcription_start
+                transcription_time = (_pc() - transcription_start) / 1_000_000_000  # s
                 
                 if result.get("success", False):
-                    transcription_times.append(transcription_time)
+                    transcription_times[count] = transcription_time
+                    count += 1
                 else:
                     errors += 1
                 
-                # Monitor resources after transcription
-                cpu_after = psutil.cpu_percent(interval=0.1)
-                memory_after = psutil.virtual_memory().percent
-                
-                cpu_readings.extend([cpu_before, cpu_after])
-                memory_readings.extend([memory_before, memory_after])
-                
             except Exception as e:
                 self.logger.error(f"Transcription test failed for {test_file}: {e}")
                 errors += 1
         
+        cpu_readings, memory_readings = sampler.stop()
+        
         success_rate = (len(test_files) - errors) / len(test_files) if test_files else 0
         
-        latency_stats = {}
-        if transcription_times:
-            latency_stats = {
-                "min": min(transcription_times),
-                "max": max(transcription_times),
-                "avg": statistics.mean(transcription_times),
-                "p95": statistics.quantiles(transcription_times, n=20)[18] if len(transcription_times) >= 20 else max(transcription_times),
-                "p99": statistics.quantiles(transcription_times, n=100)[98] if len(transcription_times) >= 100 else max(transcription_times)
-            }
+        latency_stats = _latency_summary(transcription_times[:count])
         
         return BenchmarkResult(
             test_name="Transcription Speed Test",
             duration=time.time() - start_time,
             cpu_usage=cpu_readings,
             memory_usage=memory_readings,
+            cpu_stats=sampler.cpu_stats,
+            memory_stats=sampler.memory_stats,
             success_rate=success_rate,
             error_count=errors,
             latency_stats=latency_stats,
@@ -313,7 +601,6 @@ class AudioBenchmark:
         try:
             # Create a simple silent WAV file for testing
             import wave
-            import struct
             
             temp_dir = Path(tempfile.gettempdir()) / "dicto_benchmark"
             temp_dir.mkdir(exist_ok=True)
@@ -321,6 +608,10 @@ class AudioBenchmark:
             # Create different duration test files
             durations = [1, 5, 10]  # seconds
             
+            # One buffer of 16-bit zero samples for the longest file; shorter
+            # files write a prefix of it instead of allocating their own
+            silence = memoryview(bytes(16000 * 2 * max(durations)))
+            
             for duration in durations:
                 filename = temp_dir / f"test_{duration}s.wav"
                 
@@ -329,10 +620,9 @@ class AudioBenchmark:
                     wav_file.setsampwidth(2)  # 16-bit
                     wav_file.setframerate(16000)  # 16kHz
                     
-                    # Generate silence
+                    # Write the silence in one call
                     frames = 16000 * duration
-                    for _ in range(frames):
-                        wav_file.writeframes(struct.pack('<h', 0))
+                    wav_file.writeframes(silence[:frames * 2])
                 
                 test_files.append(str(filename))
                 self.logger.info(f"Created test file: {filename}")
@@ -354,45 +644,39 @@ class HotkeyBenchmark:
         self.logger.info(f"Running hotkey latency test with {iterations} iterations")
         
         start_time = time.time()
-        latencies = []
-        cpu_readings = []
-        memory_readings = []
+        latencies = _sample_buffer(iterations)
+        sampler = _ResourceSampler(period=0.1).start()
+        _pc = time.perf_counter_ns
         
         for i in range(iterations):
             # Simulate hotkey processing time
-            hotkey_start = time.time()
+            hotkey_start = _pc()
             
             # Simulate hotkey handler work
             time.sleep(0.001)  # 1ms base processing time
             
             # Simulate variable system load impact
-            cpu_load = psutil.cpu_percent(interval=0.01)
+            cpu_load = sampler.latest_cpu
             if cpu_load > 50:
                 time.sleep(0.002)  # Additional delay under high CPU load
             
-            hotkey_latency = (time.time() - hotkey_start) * 1000  # ms
-            latencies.append(hotkey_latency)
-            
-            # Monitor system resources
-            cpu_readings.append(psutil.cpu_percent(interval=0.01))
-            memory_readings.append(psutil.virtual_memory().percent)
+            hotkey_latency = (_pc() - hotkey_start) / 1_000_000  # ms
+            latencies[i] = hotkey_latency
             
             # Small delay between iterations
             time.sleep(0.01)
         
-        latency_stats = {
-            "min": min(latencies),
-            "max": max(latencies),
-            "avg": statistics.mean(latencies),
-            "p95": statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 20 else max(latencies),
-            "p99": statistics.quantiles(latencies, n=100)[98] if len(latencies) >= 100 else max(latencies)
-        }
+        cpu_readings, memory_readings = sampler.stop()
+        
+        latency_stats = _latency_summary(latencies)
         
         return BenchmarkResult(
             test_name="Hotkey Latency Test",
             duration=time.time() - start_time,
             cpu_usage=cpu_readings,
             memory_usage=memory_readings,
+            cpu_stats=sampler.cpu_stats,
+            memory_stats=sampler.memory_stats,
             success_rate=1.0,
             error_count=0,
             latency_stats=latency_stats,
@@ -403,7 +687,8 @@ class HotkeyBenchmark:
 class PerformanceBenchmarkSuite:
     """Main benchmark suite coordinator."""
     
-    def __init__(self, audio_recorder=None, transcription_engine=None, log_dir: Optional[str] = None):
+    def __init__(self, audio_recorder=None, transcription_engine=None, log_dir: Optional[str] = None,
+                 pretty: bool = False, compress: bool = False):
         """
         Initialize the benchmark suite.
         
@@ -411,8 +696,12 @@ class PerformanceBenchmarkSuite:
             audio_recorder: AudioRecorder instance for audio tests
             transcription_engine: TranscriptionEngine instance for transcription tests
             log_dir: Directory for benchmark logs
+            pretty: Write indented JSON instead of compact JSON
+            compress: Gzip the timestamped results file (saved as .json.gz)
         """
         self.logger = logging.getLogger("Dicto.BenchmarkSuite")
+        self.pretty = pretty
+        self.compress = compress
         
         # Set up logging directory
         self.log_dir = Path(log_dir) if log_dir else Path.home() / "Library" / "Application Support" / "Dicto" / "benchmarks"
@@ -425,6 +714,10 @@ class PerformanceBenchmarkSuite:
         
         # Results storage
         self.results: List[BenchmarkResult] = []
+        
+        # Host invariants, read once rather than on every summary
+        self._cpu_count = psutil.cpu_count()
+        self._mem_total = psutil.virtual_memory().total
     
     def run_full_benchmark_suite(self, quick_mode: bool = False) -> Dict[str, Any]:
         """
@@ -456,42 +749,52 @@ class PerformanceBenchmarkSuite:
         except Exception as e:
             self.logger.error(f"System benchmark failed: {e}")
         
-        # Audio benchmarks
+        # Latency benchmarks run one after another: transcription loads the CPU,
+        # and the hotkey test's timings depend on CPU load, so overlapping them
+        # would skew both
+        self.results.extend(self._run_audio_benchmarks(quick_mode))
+        self.results.extend(self._run_hotkey_benchmarks(quick_mode))
+        
+        total_duration = time.time() - start_time
+        
+        # Generate summary
+        summary = self._generate_summary(total_duration)
+        
+        # Save results
+        self._save_results(summary)
+        
+        self.logger.info(f"Benchmark suite completed in {total_duration:.2f} seconds")
+        
+        return summary
+    
+    def _run_audio_benchmarks(self, quick_mode: bool) -> List[BenchmarkResult]:
+        """Run the audio benchmarks, returning whichever results completed."""
+        results = []
         try:
             self.logger.info("Running audio benchmarks...")
             
             recording_iterations = 5 if quick_mode else 10
-            recording_result = self.audio_benchmark.run_recording_latency_test(iterations=recording_iterations)
-            self.results.append(recording_result)
-            
-            transcription_result = self.audio_benchmark.run_transcription_speed_test()
-            self.results.append(transcription_result)
+            results.append(self.audio_benchmark.run_recording_latency_test(iterations=recording_iterations))
+            results.append(self.audio_benchmark.run_transcription_speed_test())
             
         except Exception as e:
             self.logger.error(f"Audio benchmark failed: {e}")
         
-        # Hotkey benchmarks
+        return results
+    
+    def _run_hotkey_benchmarks(self, quick_mode: bool) -> List[BenchmarkResult]:
+        """Run the hotkey benchmarks, returning whichever results completed."""
+        results = []
         try:
             self.logger.info("Running hotkey benchmarks...")
             
             hotkey_iterations = 25 if quick_mode else 50
-            hotkey_result = self.hotkey_benchmark.run_hotkey_latency_test(iterations=hotkey_iterations)
-            self.results.append(hotkey_result)
+            results.append(self.hotkey_benchmark.run_hotkey_latency_test(iterations=hotkey_iterations))
             
         except Exception as e:
             self.logger.error(f"Hotkey benchmark failed: {e}")
         
-        total_duration = time.time() - start_time
-        
-        # Generate summary
-        summary = self._generate_summary(total_duration)
-        
-        # Save results
-        self._save_results(summary)
-        
-        self.logger.info(f"Benchmark suite completed in {total_duration:.2f} seconds")
-        
-        return summary
+        return results
     
     def run_performance_regression_test(self, baseline_file: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -512,8 +815,13 @@ class PerformanceBenchmarkSuite:
         baseline_results = None
         if baseline_file and os.path.exists(baseline_file):
             try:
-                with open(baseline_file, 'r') as f:
-                    baseline_results = json.load(f)
+                if baseline_file.endswith(".gz"):
+                    import gzip
+                    with gzip.open(baseline_file, 'rb') as f:
+                        baseline_results = _json_loads(f.read())
+                else:
+                    with open(baseline_file, 'rb') as f:
+                        baseline_results = _json_loads(f.read())
             except Exception as e:
                 self.logger.error(f"Failed to load baseline file: {e}")
         
@@ -524,13 +832,15 @@ class PerformanceBenchmarkSuite:
     
     def _generate_summary(self, total_duration: float) -> Dict[str, Any]:
         """Generate benchmark summary."""
+        from datetime import datetime
+        
         summary = {
             "timestamp": datetime.now().isoformat(),
             "total_duration": total_duration,
             "total_tests": len(self.results),
             "system_info": {
-                "cpu_count": psutil.cpu_count(),
-                "memory_total_gb": psutil.virtual_memory().total / (1024**3),
+                "cpu_count": self._cpu_count,
+                "memory_total_gb": self._mem_total / (1024**3),
                 "platform": sys.platform
             },
             "results": {},
@@ -542,15 +852,17 @@ class PerformanceBenchmarkSuite:
         avg_success_rate = 0
         
         for result in self.results:
+            cpu_stats = result.cpu_stats or _RunningStats.of(result.cpu_usage)
+            memory_stats = result.memory_stats or _RunningStats.of(result.memory_usage)
             summary["results"][result.test_name] = {
                 "duration": result.duration,
                 "success_rate": result.success_rate,
                 "error_count": result.error_count,
                 "latency_stats": result.latency_stats,
-                "avg_cpu": statistics.mean(result.cpu_usage) if result.cpu_usage else 0,
-                "max_cpu": max(result.cpu_usage) if result.cpu_usage else 0,
-                "avg_memory": statistics.mean(result.memory_usage) if result.memory_usage else 0,
-                "max_memory": max(result.memory_usage) if result.memory_usage else 0,
+                "avg_cpu": cpu_stats.mean,
+                "max_cpu": cpu_stats.mx,
+                "avg_memory": memory_stats.mean,
+                "max_memory": memory_stats.mx,
                 "additional_metrics": result.additional_metrics
             }
             
@@ -573,6 +885,8 @@ class PerformanceBenchmarkSuite:
         if not baseline:
             return {"status": "no_baseline", "message": "No baseline provided for comparison"}
         
+        from datetime import datetime
+        
         comparison = {
             "status": "completed",
             "timestamp": datetime.now().isoformat(),
@@ -582,15 +896,17 @@ class PerformanceBenchmarkSuite:
         }
         
         try:
+            baseline_results = baseline.get("results") or {}
             for test_name, current_result in current["results"].items():
-                if test_name not in baseline.get("results", {}):
+                baseline_result = baseline_results.get(test_name)
+                if baseline_result is None:
                     continue
                 
-                baseline_result = baseline["results"][test_name]
-                
-                # Compare key metrics
-                current_latency = current_result.get("latency_stats", {}).get("avg", 0)
-                baseline_latency = baseline_result.get("latency_stats", {}).get("avg", 0)
+                # Compare key metrics; _generate_summary always includes latency_stats,
+                # while older baseline files may not
+                current_latency = current_result["latency_stats"].get("avg", 0)
+                baseline_stats = baseline_result.get("latency_stats")
+                baseline_latency = baseline_stats.get("avg", 0) if baseline_stats else 0
                 
                 if baseline_latency > 0:
                     latency_change = ((current_latency - baseline_latency) / baseline_latency) * 100
@@ -640,17 +956,27 @@ class PerformanceBenchmarkSuite:
     
     def _save_results(self, summary: Dict[str, Any]) -> None:
         """Save benchmark results to file."""
+        from datetime import datetime
+        
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            results_file = self.log_dir / f"benchmark_results_{timestamp}.json"
             
-            with open(results_file, 'w') as f:
-                json.dump(summary, f, indent=2)
+            # Serialize once and write the same bytes to both files
+            payload = _json_dumps(summary, pretty=self.pretty)
+            if self.compress:
+                import gzip
+                results_file = self.log_dir / f"benchmark_results_{timestamp}.json.gz"
+                results_file.write_bytes(gzip.compress(payload))
+            else:
+                results_file = self.log_dir / f"benchmark_results_{timestamp}.json"
+                results_file.write_bytes(payload)
             
-            # Also save as latest
+            # Also save as latest (always plain JSON), swapped in atomically so
+            # readers never see a partial file
             latest_file = self.log_dir / "latest_benchmark_results.json"
-            with open(latest_file, 'w') as f:
-                json.dump(summary, f, indent=2)
+            tmp_file = latest_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, latest_file)
             
             self.logger.info(f"Benchmark results saved to {results_file}")
             
@@ -662,11 +988,13 @@ class PerformanceBenchmarkSuite:
         # Clean up any temporary test files
         try:
             temp_dir = Path(tempfile.gettempdir()) / "dicto_benchmark"
-            if temp_dir.exists():
-                for file in temp_dir.glob("*"):
-                    file.unlink()
-                temp_dir.rmdir()
-                self.logger.info("Cleaned up benchmark temp files")
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            temp_dir.rmdir()
+            self.logger.info("Cleaned up benchmark temp files")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.warning(f"Failed to clean up temp files: {e}")
 
@@ -679,6 +1007,8 @@ def main():
     parser.add_argument("--quick", action="store_true", help="Run quick benchmarks")
     parser.add_argument("--baseline", type=str, help="Path to baseline results for regression testing")
     parser.add_argument("--output", type=str, help="Output directory for results")
+    parser.add_argument("--pretty", action="store_true", help="Write indented, human-readable JSON results")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the timestamped results file")
     
     args = parser.parse_args()
     
@@ -689,7 +1019,7 @@ def main():
     )
     
     # Initialize benchmark suite
-    suite = PerformanceBenchmarkSuite(log_dir=args.output)
+    suite = PerformanceBenchmarkSuite(log_dir=args.output, pretty=args.pretty, compress=args.gzip)
     
     try:
         if args.baseline:
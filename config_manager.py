@@ -7,22 +7,145 @@ user profiles, and import/export functionality.
 
 import os
 import json
+import atexit
+import hashlib
+import threading
 import logging
 import shutil
+import sys
 import time
+import weakref
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Union
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Set, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
+    from jsonschema import Draft7Validator, ValidationError
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
     print("Warning: jsonschema not available. Schema validation disabled.")
 
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _read_json(path: Union[str, Path]) -> Any:
+        """Parse a JSON file."""
+        return orjson.loads(Path(path).read_bytes())
+    
+    def _dumps(obj: Any) -> bytes:
+        """Serialize `obj` as indented UTF-8 JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        """Parse UTF-8 JSON bytes."""
+        return json.loads(data.decode('utf-8'))
+    
+    def _read_json(path: Union[str, Path]) -> Any:
+        """Parse a JSON file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _dumps(obj: Any) -> bytes:
+        """Serialize `obj` as indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Write `data` to a file atomically.
+    
+    The bytes go to a sibling temp file that is fsync'd and then renamed over
+    `path`, so a crash leaves either the old or the new file, never a truncated
+    one. Replacing rather than rewriting in place also keeps hardlinked backups
+    of the previous version intact.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_json(path: Union[str, Path], obj: Any) -> None:
+    """Write `obj` to a file as indented UTF-8 JSON."""
+    _atomic_write_bytes(path, _dumps(obj))
+
+
+def _digest(payload: bytes) -> bytes:
+    """Short content hash used to detect unchanged writes."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Snapshot `src` at `dst` with a hardlink, copying when linking isn't possible."""
+    try:
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # e.g. EXDEV across devices, or a filesystem without hardlinks
+        shutil.copy2(src, dst)
+
+
+# slots=True needs Python 3.10; older interpreters get plain frozen dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _FlatDataclass:
+    """Shallow dict conversion for dataclasses whose fields are all plain values."""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a new dict, without asdict()'s recursive deep copy."""
+        return {name: getattr(self, name) for name, f in self.__dataclass_fields__.items() if f.init}
+
+
+# Key combination vocabulary accepted by _validate_key_combination
+_VALID_MODIFIERS = frozenset({"cmd", "ctrl", "alt", "shift", "option"})
+_VALID_KEYS = frozenset({
+    "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m",
+    "n", "o", "p", "q", "r", "s", "t", "u", "v", "w", "x", "y", "z",
+    "0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
+    "space", "enter", "tab", "esc", "delete", "backspace",
+    "up", "down", "left", "right", "home", "end", "pageup", "pagedown",
+    "f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10", "f11", "f12"
+})
+
+# Quiet period after the last edit before pending changes are written out
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# Delay before a debounced save that failed is tried again
+SAVE_RETRY_SECONDS = 5.0
+
+# Managers with possibly pending saves; held weakly so registering for the
+# exit-time flush does not keep a manager alive
+_OPEN_MANAGERS: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers() -> None:
+    """Write out pending changes of every manager still alive at exit."""
+    for manager in list(_OPEN_MANAGERS):
+        manager.flush()
+
 
 class HotkeyConflictLevel(Enum):
     """Conflict severity levels for hotkey validation."""
@@ -31,18 +154,27 @@ class HotkeyConflictLevel(Enum):
     ERROR = "error"      # Same app, will definitely conflict
 
 
-@dataclass
-class HotkeyBinding:
+@dataclass(frozen=True, **_SLOTS)
+class HotkeyBinding(_FlatDataclass):
     """Represents a hotkey binding configuration."""
     action: str
     keys: str  # e.g., "cmd+shift+v"
     description: str
     enabled: bool = True
     global_scope: bool = True
+    # Lowercased keys, computed once for conflict checks; not serialized
+    keys_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Action names and combos repeat across every profile; intern them so
+        # loaded profiles share one copy and comparisons hit the identity check
+        object.__setattr__(self, "action", sys.intern(self.action))
+        object.__setattr__(self, "keys", sys.intern(self.keys))
+        object.__setattr__(self, "keys_lower", sys.intern(self.keys.lower()))
 
 
-@dataclass
-class AudioSettings:
+@dataclass(frozen=True, **_SLOTS)
+class AudioSettings(_FlatDataclass):
     """Audio processing configuration."""
     input_device: Optional[str] = None
     noise_reduction_level: str = "medium"  # low, medium, high
@@ -54,8 +186,8 @@ class AudioSettings:
     speech_threshold: float = 0.05
 
 
-@dataclass
-class TranscriptionSettings:
+@dataclass(frozen=True, **_SLOTS)
+class TranscriptionSettings(_FlatDataclass):
     """Transcription processing configuration."""
     model_name: str = "base.en"
     confidence_threshold: float = 0.6
@@ -66,8 +198,8 @@ class TranscriptionSettings:
     speaker_diarization: bool = False
 
 
-@dataclass
-class UISettings:
+@dataclass(frozen=True, **_SLOTS)
+class UISettings(_FlatDataclass):
     """User interface configuration."""
     menu_bar_behavior: str = "always_visible"  # always_visible, auto_hide, minimal
     notification_style: str = "native"  # native, minimal, disabled
@@ -77,8 +209,8 @@ class UISettings:
     dark_mode: Optional[bool] = None  # None = system default
 
 
-@dataclass
-class AdvancedSettings:
+@dataclass(frozen=True, **_SLOTS)
+class AdvancedSettings(_FlatDataclass):
     """Advanced system configuration."""
     temp_file_location: str = ""  # Empty means system default
     cleanup_policy: str = "auto"  # auto, manual, never
@@ -103,6 +235,247 @@ class UserProfile:
     is_default: bool = False
 
 
+# Default settings sections, built once; copy before handing them out since
+# config sections are edited in place
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Dict[str, Any]] = {
+    "audio_settings": AudioSettings().to_dict(),
+    "transcription_settings": TranscriptionSettings().to_dict(),
+    "ui_settings": UISettings().to_dict(),
+    "advanced_settings": AdvancedSettings().to_dict()
+}
+
+
+def _profile_from_dict(profile_dict: Dict[str, Any]) -> UserProfile:
+    """Build a UserProfile from its serialized form."""
+    audio_settings = AudioSettings(**profile_dict['audio_settings'])
+    transcription_settings = TranscriptionSettings(**profile_dict['transcription_settings'])
+    ui_settings = UISettings(**profile_dict['ui_settings'])
+    
+    hotkeys = {}
+    for action, hotkey_dict in profile_dict.get('hotkeys', {}).items():
+        hotkeys[sys.intern(action)] = HotkeyBinding(**hotkey_dict)
+    
+    return UserProfile(
+        name=profile_dict['name'],
+        description=profile_dict['description'],
+        audio_settings=audio_settings,
+        transcription_settings=transcription_settings,
+        ui_settings=ui_settings,
+        hotkeys=hotkeys,
+        created_at=profile_dict['created_at'],
+        last_used=profile_dict['last_used'],
+        is_default=profile_dict.get('is_default', False)
+    )
+
+
+
+def _profile_to_dict(profile: UserProfile) -> Dict[str, Any]:
+    """Serialize a UserProfile; the inverse of _profile_from_dict."""
+    return {
+        "name": profile.name,
+        "description": profile.description,
+        "audio_settings": profile.audio_settings.to_dict(),
+        "transcription_settings": profile.transcription_settings.to_dict(),
+        "ui_settings": profile.ui_settings.to_dict(),
+        "hotkeys": {action: hotkey.to_dict() for action, hotkey in profile.hotkeys.items()},
+        "created_at": profile.created_at,
+        "last_used": profile.last_used,
+        "is_default": profile.is_default
+    }
+
+# JSON schema for configuration validation, built and compiled once at import
+_CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "version": {"type": "string"},
+        "current_profile": {"type": ["string", "null"]},
+        "audio_settings": {
+            "type": "object",
+            "properties": {
+                "input_device": {"type": ["string", "null"]},
+                "noise_reduction_level": {"type": "string", "enum": ["low", "medium", "high"]},
+                "gain_adjustment": {"type": "number", "minimum": 0.1, "maximum": 5.0},
+                "sample_rate": {"type": "integer", "enum": [8000, 16000, 22050, 44100, 48000]},
+                "auto_gain_control": {"type": "boolean"},
+                "voice_activity_detection": {"type": "boolean"},
+                "silence_threshold": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "speech_threshold": {"type": "number", "minimum": 0.0, "maximum": 1.0}
+            }
+        },
+        "transcription_settings": {
+            "type": "object",
+            "properties": {
+                "model_name": {"type": "string"},
+                "confidence_threshold": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "language": {"type": "string"},
+                "auto_language_detection": {"type": "boolean"},
+                "custom_vocabulary_enabled": {"type": "boolean"},
+                "timestamping_enabled": {"type": "boolean"},
+                "speaker_diarization": {"type": "boolean"}
+            }
+        },
+        "ui_settings": {
+            "type": "object",
+            "properties": {
+                "menu_bar_behavior": {"type": "string", "enum": ["always_visible", "auto_hide", "minimal"]},
+                "notification_style": {"type": "string", "enum": ["native", "minimal", "disabled"]},
+                "show_transcription_preview": {"type": "boolean"},
+                "auto_copy_to_clipboard": {"type": "boolean"},
+                "show_confidence_scores": {"type": "boolean"},
+                "dark_mode": {"type": ["boolean", "null"]}
+            }
+        },
+        "advanced_settings": {
+            "type": "object",
+            "properties": {
+                "temp_file_location": {"type": "string"},
+                "cleanup_policy": {"type": "string", "enum": ["auto", "manual", "never"]},
+                "max_session_duration": {"type": "integer", "minimum": 60},
+                "auto_save_interval": {"type": "integer", "minimum": 5},
+                "log_level": {"type": "string", "enum": ["DEBUG", "INFO", "WARNING", "ERROR"]},
+                "enable_crash_recovery": {"type": "boolean"},
+                "diagnostic_mode": {"type": "boolean"}
+            }
+        }
+    },
+    "required": ["version"]
+}
+
+_CONFIG_VALIDATOR = None
+if JSONSCHEMA_AVAILABLE:
+    Draft7Validator.check_schema(_CONFIG_SCHEMA)
+    _CONFIG_VALIDATOR = Draft7Validator(_CONFIG_SCHEMA)
+
+
+_UNLOADED = object()  # Placeholder for a profile still held as raw JSON
+
+
+class _LazyProfiles(dict):
+    """
+    Profile name to UserProfile mapping that keeps each loaded profile as raw
+    JSON until it is first read, so startup only pays for the profiles used.
+    
+    Every read goes through __getitem__, which builds the profile; overriding
+    __iter__ also makes dict(), ** and update() take the key-by-key path, so
+    the placeholder never escapes. A profile that fails to build is logged
+    and left out of reads, but its raw JSON is kept so saving writes it back.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._broken: set = set()
+        self._logger = logging.getLogger(__name__ + ".ConfigManager")
+    
+    def add_raw(self, name: str, profile_dict: Dict[str, Any]) -> None:
+        """Register a serialized profile without building it."""
+        self._raw[name] = profile_dict
+        super().__setitem__(name, _UNLOADED)
+    
+    def raw(self, name: str) -> Optional[Dict[str, Any]]:
+        """Serialized form of a profile that has not been built yet, else None."""
+        return self._raw.get(name)
+    
+    def is_default(self, name: str) -> bool:
+        """Whether a profile is marked default, without building it."""
+        if name in self._raw:
+            raw = self._raw[name]
+            return isinstance(raw, dict) and bool(raw.get('is_default', False))
+        return self[name].is_default
+    
+    def __getitem__(self, name: str) -> UserProfile:
+        profile = super().__getitem__(name)
+        if profile is _UNLOADED:
+            if name in self._broken:
+                raise KeyError(name)
+            # Drop the raw JSON only once it built, so a malformed profile
+            # keeps its data and is still written back on save
+            try:
+                profile = _profile_from_dict(self._raw[name])
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                self._broken.add(name)
+                self._logger.error("Skipping malformed profile '%s': %s", name, e)
+                raise KeyError(name) from e
+            super().__setitem__(name, profile)
+            del self._raw[name]
+        return profile
+    
+    def __iter__(self):
+        return super().__iter__()
+    
+    def __setitem__(self, name: str, profile: UserProfile) -> None:
+        self._raw.pop(name, None)
+        self._broken.discard(name)
+        super().__setitem__(name, profile)
+    
+    def __delitem__(self, name: str) -> None:
+        self._raw.pop(name, None)
+        self._broken.discard(name)
+        super().__delitem__(name)
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+    
+    def values(self) -> List[UserProfile]:
+        return [profile for _, profile in self.items()]
+    
+    def items(self) -> List[tuple]:
+        items = []
+        for name in self:
+            try:
+                items.append((name, self[name]))
+            except KeyError:
+                pass  # Malformed; logged when it failed to build
+        return items
+    
+    def copy(self) -> Dict[str, UserProfile]:
+        return dict(self.items())
+    
+    def pop(self, name: str, *default: Any) -> Any:
+        if name not in self:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        profile = self.get(name)
+        del self[name]
+        return profile
+    
+    def popitem(self) -> tuple:
+        name = next(reversed(self.keys()))
+        return name, self.pop(name)
+    
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        if name not in self:
+            self[name] = default
+        return self[name]
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for name, profile in dict(*args, **kwargs).items():
+            self[name] = profile
+    
+    def clear(self) -> None:
+        self._raw.clear()
+        self._broken.clear()
+        super().clear()
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _LazyProfiles):
+            other = other.copy()
+        return self.copy() == other if isinstance(other, dict) else NotImplemented
+    
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
 class ConfigManager:
     """
     Comprehensive configuration manager for Dicto.
@@ -111,6 +484,12 @@ class ConfigManager:
     and import/export functionality with backup and versioning.
     """
     
+    # macOS shortcuts a custom hotkey should not shadow
+    _SYSTEM_HOTKEYS = frozenset({
+        "cmd+c", "cmd+v", "cmd+x", "cmd+z", "cmd+a", "cmd+s", "cmd+w", "cmd+q",
+        "cmd+tab", "cmd+space", "cmd+shift+3", "cmd+shift+4", "cmd+shift+5"
+    })
+    
     def __init__(self, config_dir: Optional[str] = None):
         """
         Initialize ConfigManager.
@@ -136,79 +515,41 @@ class ConfigManager:
         self.hotkeys_file = self.config_dir / "hotkeys.json"
         self.backup_dir = self.config_dir / "backups"
         self.backup_dir.mkdir(exist_ok=True)
+        self._backup_cache: Optional[List[Path]] = None  # Sorted backup dirs, scanned once
+        self._last_hashes: Dict[str, bytes] = {}  # Digest of the last payload written per file
         
         # Configuration state
         self.config: Dict[str, Any] = {}
-        self.profiles: Dict[str, UserProfile] = {}
+        self.profiles: Dict[str, UserProfile] = _LazyProfiles()
         self.hotkeys: Dict[str, HotkeyBinding] = {}
         self.current_profile: Optional[str] = None
         
-        # Schema validation
+        # Reverse index of enabled global + current-profile hotkeys: combo ->
+        # owners ("global:<action>" / "profile:<action>"), kept up to date by
+        # update_hotkey and rebuilt when the bindings or current profile change
+        self._combo_index: Dict[str, List[str]] = {}
+        self._combo_index_profile: Optional[str] = None
+        
+        # Deferred saving: mutators mark the config dirty and a short timer
+        # coalesces a burst of edits into one save_config()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
+        _OPEN_MANAGERS.add(self)
+        
+        # Schema validation; the module-level validator is shared by every
+        # instance and reused by every load, save and import
         self.config_schema = self._load_config_schema()
+        self._validator = _CONFIG_VALIDATOR
         
         # Load existing configuration
         self.load_config()
         
-        self.logger.info(f"ConfigManager initialized with {len(self.profiles)} profiles")
+        self.logger.info("ConfigManager initialized with %s profiles", len(self.profiles))
     
     def _load_config_schema(self) -> Dict[str, Any]:
         """Load JSON schema for configuration validation."""
-        return {
-            "type": "object",
-            "properties": {
-                "version": {"type": "string"},
-                "current_profile": {"type": ["string", "null"]},
-                "audio_settings": {
-                    "type": "object",
-                    "properties": {
-                        "input_device": {"type": ["string", "null"]},
-                        "noise_reduction_level": {"type": "string", "enum": ["low", "medium", "high"]},
-                        "gain_adjustment": {"type": "number", "minimum": 0.1, "maximum": 5.0},
-                        "sample_rate": {"type": "integer", "enum": [8000, 16000, 22050, 44100, 48000]},
-                        "auto_gain_control": {"type": "boolean"},
-                        "voice_activity_detection": {"type": "boolean"},
-                        "silence_threshold": {"type": "number", "minimum": 0.0, "maximum": 1.0},
-                        "speech_threshold": {"type": "number", "minimum": 0.0, "maximum": 1.0}
-                    }
-                },
-                "transcription_settings": {
-                    "type": "object",
-                    "properties": {
-                        "model_name": {"type": "string"},
-                        "confidence_threshold": {"type": "number", "minimum": 0.0, "maximum": 1.0},
-                        "language": {"type": "string"},
-                        "auto_language_detection": {"type": "boolean"},
-                        "custom_vocabulary_enabled": {"type": "boolean"},
-                        "timestamping_enabled": {"type": "boolean"},
-                        "speaker_diarization": {"type": "boolean"}
-                    }
-                },
-                "ui_settings": {
-                    "type": "object",
-                    "properties": {
-                        "menu_bar_behavior": {"type": "string", "enum": ["always_visible", "auto_hide", "minimal"]},
-                        "notification_style": {"type": "string", "enum": ["native", "minimal", "disabled"]},
-                        "show_transcription_preview": {"type": "boolean"},
-                        "auto_copy_to_clipboard": {"type": "boolean"},
-                        "show_confidence_scores": {"type": "boolean"},
-                        "dark_mode": {"type": ["boolean", "null"]}
-                    }
-                },
-                "advanced_settings": {
-                    "type": "object",
-                    "properties": {
-                        "temp_file_location": {"type": "string"},
-                        "cleanup_policy": {"type": "string", "enum": ["auto", "manual", "never"]},
-                        "max_session_duration": {"type": "integer", "minimum": 60},
-                        "auto_save_interval": {"type": "integer", "minimum": 5},
-                        "log_level": {"type": "string", "enum": ["DEBUG", "INFO", "WARNING", "ERROR"]},
-                        "enable_crash_recovery": {"type": "boolean"},
-                        "diagnostic_mode": {"type": "boolean"}
-                    }
-                }
-            },
-            "required": ["version"]
-        }
+        return _CONFIG_SCHEMA
     
     def load_config(self) -> bool:
         """
@@ -220,16 +561,15 @@ class ConfigManager:
         try:
             # Load main configuration
             if self.main_config_file.exists():
-                with open(self.main_config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
+                self.config = self._read_tracked("config", self.main_config_file)
                 
                 # Validate against schema if jsonschema is available
                 if JSONSCHEMA_AVAILABLE:
                     try:
-                        validate(instance=self.config, schema=self.config_schema)
+                        self._validator.validate(self.config)
                         self.logger.info("Configuration validation successful")
                     except ValidationError as e:
-                        self.logger.warning(f"Configuration validation failed: {e.message}")
+                        self.logger.warning("Configuration validation failed: %s", e.message)
                         # Continue with potentially invalid config, but log the issue
             else:
                 # Create default configuration
@@ -248,17 +588,17 @@ class ConfigManager:
                 self.current_profile = profile_name
             else:
                 # Set default profile
-                default_profiles = [name for name, profile in self.profiles.items() if profile.is_default]
+                default_profiles = [name for name in self.profiles if self.profiles.is_default(name)]
                 if default_profiles:
                     self.current_profile = default_profiles[0]
                 elif self.profiles:
                     self.current_profile = list(self.profiles.keys())[0]
             
-            self.logger.info(f"Configuration loaded successfully. Current profile: {self.current_profile}")
+            self.logger.info("Configuration loaded successfully. Current profile: %s", self.current_profile)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
+            self.logger.error("Failed to load configuration: %s", e)
             # Create minimal default configuration
             self.config = self._create_default_config()
             return False
@@ -270,86 +610,145 @@ class ConfigManager:
         Returns:
             bool: True if saved successfully, False otherwise.
         """
-        try:
-            # Create backup before saving
-            self._create_backup()
-            
-            # Update version and timestamp
-            self.config['version'] = "1.0"
-            self.config['last_modified'] = time.time()
-            self.config['current_profile'] = self.current_profile
-            
-            # Validate before saving if jsonschema is available
-            if JSONSCHEMA_AVAILABLE:
-                try:
-                    validate(instance=self.config, schema=self.config_schema)
-                except ValidationError as e:
-                    self.logger.error(f"Configuration validation failed before save: {e.message}")
-                    return False
-            
-            # Save main configuration
-            with open(self.main_config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+        with self._save_lock:
+            try:
+                # Update version and profile
+                self.config['version'] = "1.0"
+                self.config['current_profile'] = self.current_profile
+                
+                # Validate before saving if jsonschema is available
+                if JSONSCHEMA_AVAILABLE:
+                    try:
+                        self._validator.validate(self.config)
+                    except ValidationError as e:
+                        self.logger.error("Configuration validation failed before save: %s", e.message)
+                        return False
+                
+                # Serialize main configuration; last_modified only moves when the
+                # rest of it changed, so an unchanged config is not rewritten
+                payload = _dumps(self.config)
+                if _digest(payload) != self._last_hashes.get("config"):
+                    self.config['last_modified'] = time.time()
+                    payload = _dumps(self.config)
+                
+                # Serialize everything before touching disk, then back up and
+                # replace only the files that changed, as one snapshot
+                written = self._write_changed({
+                    "config": (self.main_config_file, payload),
+                    "profiles": (self.profiles_file, self._profiles_payload()),
+                    "hotkeys": (self.hotkeys_file, self._hotkeys_payload())
+                })
+                
+                self.logger.info("Configuration saved successfully (%s files written)", len(written))
+                return True
             
-            # Save profiles and hotkeys
-            self._save_profiles()
-            self._save_hotkeys()
+            except Exception as e:
+                self.logger.error("Failed to save configuration: %s", e)
+                return False
+    
+    def _read_tracked(self, key: str, path: Path) -> Any:
+        """Parse a config file, remembering its digest so an unchanged save skips it."""
+        data = path.read_bytes()
+        self._last_hashes[key] = _digest(data)
+        return _loads(data)
+    
+    def _write_changed(self, files: Dict[str, tuple]) -> List[str]:
+        """
+        Back up and replace each file whose payload differs from what was last
+        read from or written to it.
+        
+        Args:
+            files: Digest key to (path, serialized payload).
             
-            self.logger.info("Configuration saved successfully")
+        Returns:
+            List[str]: Keys of the files that were written.
+        """
+        changed = {}
+        for key, (path, payload) in files.items():
+            digest = _digest(payload)
+            if self._last_hashes.get(key) != digest or not path.exists():
+                changed[key] = (path, payload, digest)
+        
+        if changed:
+            # One backup holds the previous versions of every file about to change
+            self._create_backup([path for path, _, _ in changed.values()])
+        
+        for key, (path, payload, digest) in changed.items():
+            _atomic_write_bytes(path, payload)
+            self._last_hashes[key] = digest
+        return list(changed)
+    
+    def _mark_dirty(self) -> None:
+        """Schedule a save, restarting the debounce window on every call."""
+        with self._save_lock:
+            self._dirty = True
+            self._schedule_save(SAVE_DEBOUNCE_SECONDS)
+    
+    def _schedule_save(self, delay: float) -> None:
+        """(Re)start the save timer. Must be called with _save_lock held."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(delay, self._flush_on_timer)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def _flush_on_timer(self) -> None:
+        """Save timer callback: flush, and retry later if the save failed."""
+        with self._save_lock:
+            # A newer edit may have scheduled its own save meanwhile
+            if not self.flush() and self._save_timer is None:
+                self._schedule_save(SAVE_RETRY_SECONDS)
+    
+    def flush(self) -> bool:
+        """
+        Save pending changes now, if there are any.
+        
+        Returns:
+            bool: True if nothing was pending or the save succeeded, False otherwise.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            # Stay dirty on failure so the next flush retries the save
+            if not self.save_config():
+                return False
+            self._dirty = False
             return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save configuration: {e}")
-            return False
+    
+    def close(self) -> bool:
+        """
+        Save pending changes and stop tracking this manager for the exit-time flush.
+        
+        Returns:
+            bool: True if nothing was pending or the save succeeded, False otherwise.
+        """
+        saved = self.flush()
+        _OPEN_MANAGERS.discard(self)
+        return saved
     
     def _create_default_config(self) -> Dict[str, Any]:
         """Create default configuration."""
-        audio_settings = AudioSettings()
-        transcription_settings = TranscriptionSettings()
-        ui_settings = UISettings()
-        advanced_settings = AdvancedSettings()
-        
+        now = time.time()
         return {
             "version": "1.0",
             "current_profile": "default",
-            "audio_settings": asdict(audio_settings),
-            "transcription_settings": asdict(transcription_settings),
-            "ui_settings": asdict(ui_settings),
-            "advanced_settings": asdict(advanced_settings),
-            "created_at": time.time(),
-            "last_modified": time.time()
+            **{section: dict(values) for section, values in _DEFAULT_CONFIG_TEMPLATE.items()},
+            "created_at": now,
+            "last_modified": now
         }
     
     def _load_profiles(self) -> bool:
         """Load user profiles from file."""
         try:
             if self.profiles_file.exists():
-                with open(self.profiles_file, 'r', encoding='utf-8') as f:
-                    profiles_data = json.load(f)
+                profiles_data = self._read_tracked("profiles", self.profiles_file)
                 
+                # Profiles are built from their raw JSON on first access
                 for name, profile_dict in profiles_data.items():
-                    # Convert dict to UserProfile
-                    audio_settings = AudioSettings(**profile_dict['audio_settings'])
-                    transcription_settings = TranscriptionSettings(**profile_dict['transcription_settings'])
-                    ui_settings = UISettings(**profile_dict['ui_settings'])
-                    
-                    hotkeys = {}
-                    for action, hotkey_dict in profile_dict.get('hotkeys', {}).items():
-                        hotkeys[action] = HotkeyBinding(**hotkey_dict)
-                    
-                    profile = UserProfile(
-                        name=profile_dict['name'],
-                        description=profile_dict['description'],
-                        audio_settings=audio_settings,
-                        transcription_settings=transcription_settings,
-                        ui_settings=ui_settings,
-                        hotkeys=hotkeys,
-                        created_at=profile_dict['created_at'],
-                        last_used=profile_dict['last_used'],
-                        is_default=profile_dict.get('is_default', False)
-                    )
-                    
-                    self.profiles[name] = profile
+                    self.profiles.add_raw(name, profile_dict)
             else:
                 # Create default profile
                 self._create_default_profile()
@@ -357,7 +756,7 @@ class ConfigManager:
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to load profiles: {e}")
+            self.logger.error("Failed to load profiles: %s", e)
             self._create_default_profile()
             return False
     
@@ -383,104 +782,91 @@ class ConfigManager:
         
         self.profiles["default"] = profile
     
-    def _save_profiles(self) -> bool:
-        """Save user profiles to file."""
-        try:
-            profiles_data = {}
-            for name, profile in self.profiles.items():
-                # Convert UserProfile to dict
-                hotkeys_dict = {}
-                for action, hotkey in profile.hotkeys.items():
-                    hotkeys_dict[action] = asdict(hotkey)
-                
-                profiles_data[name] = {
-                    "name": profile.name,
-                    "description": profile.description,
-                    "audio_settings": asdict(profile.audio_settings),
-                    "transcription_settings": asdict(profile.transcription_settings),
-                    "ui_settings": asdict(profile.ui_settings),
-                    "hotkeys": hotkeys_dict,
-                    "created_at": profile.created_at,
-                    "last_used": profile.last_used,
-                    "is_default": profile.is_default
-                }
-            
-            with open(self.profiles_file, 'w', encoding='utf-8') as f:
-                json.dump(profiles_data, f, indent=2, ensure_ascii=False)
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save profiles: {e}")
-            return False
+    def _profiles_payload(self) -> bytes:
+        """Serialize user profiles for profiles.json."""
+        # Profiles never built since loading, including any that fail to
+        # build, are written back as loaded
+        raw = self.profiles.raw
+        profiles_data = {
+            name: raw(name) if raw(name) is not None else _profile_to_dict(self.profiles[name])
+            for name in self.profiles
+        }
+        return _dumps(profiles_data)
     
     def _load_hotkeys(self) -> bool:
         """Load global hotkeys configuration."""
         try:
             if self.hotkeys_file.exists():
-                with open(self.hotkeys_file, 'r', encoding='utf-8') as f:
-                    hotkeys_data = json.load(f)
+                hotkeys_data = self._read_tracked("hotkeys", self.hotkeys_file)
                 
                 for action, hotkey_dict in hotkeys_data.items():
-                    self.hotkeys[action] = HotkeyBinding(**hotkey_dict)
+                    self.hotkeys[sys.intern(action)] = HotkeyBinding(**hotkey_dict)
             
+            self._rebuild_combo_index()
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to load hotkeys: {e}")
+            self.logger.error("Failed to load hotkeys: %s", e)
             return False
     
-    def _save_hotkeys(self) -> bool:
-        """Save global hotkeys configuration."""
-        try:
-            hotkeys_data = {}
-            for action, hotkey in self.hotkeys.items():
-                hotkeys_data[action] = asdict(hotkey)
-            
-            with open(self.hotkeys_file, 'w', encoding='utf-8') as f:
-                json.dump(hotkeys_data, f, indent=2, ensure_ascii=False)
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save hotkeys: {e}")
-            return False
+    def _hotkeys_payload(self) -> bytes:
+        """Serialize global hotkeys for hotkeys.json."""
+        return _dumps({action: hotkey.to_dict() for action, hotkey in self.hotkeys.items()})
     
-    def _create_backup(self):
-        """Create backup of current configuration."""
+    def _create_backup(self, files: Optional[List[Path]] = None):
+        """
+        Create backup of current configuration.
+        
+        Args:
+            files: Config files to snapshot. If None, backs up all of them.
+        """
         try:
             timestamp = int(time.time())
             backup_name = f"config_backup_{timestamp}"
             backup_path = self.backup_dir / backup_name
             backup_path.mkdir(exist_ok=True)
             
-            # Backup main config
-            if self.main_config_file.exists():
-                shutil.copy2(self.main_config_file, backup_path / "config.json")
+            # Files are always replaced, never rewritten in place, so a hardlink
+            # is a stable snapshot that costs no copying
             
-            # Backup profiles
-            if self.profiles_file.exists():
-                shutil.copy2(self.profiles_file, backup_path / "profiles.json")
+            if files is None:
+                files = [self.main_config_file, self.profiles_file, self.hotkeys_file]
             
-            # Backup hotkeys
-            if self.hotkeys_file.exists():
-                shutil.copy2(self.hotkeys_file, backup_path / "hotkeys.json")
+            # Backup config, profiles and hotkeys files
+            for config_file in files:
+                if config_file.exists():
+                    _link_or_copy(config_file, backup_path / config_file.name)
+            
+            # Track backups incrementally after the first scan
+            if self._backup_cache is None:
+                # DirEntry.is_dir() uses the d_type from the listing, no stat per entry
+                with os.scandir(self.backup_dir) as entries:
+                    self._backup_cache = sorted(Path(e.path) for e in entries if e.is_dir())
+            elif not self._backup_cache or self._backup_cache[-1] != backup_path:
+                self._backup_cache.append(backup_path)
             
             # Clean old backups (keep last 10)
-            backups = sorted([d for d in self.backup_dir.iterdir() if d.is_dir()])
-            if len(backups) > 10:
-                for old_backup in backups[:-10]:
-                    shutil.rmtree(old_backup)
+            while len(self._backup_cache) > 10:
+                shutil.rmtree(self._backup_cache.pop(0), ignore_errors=True)
             
-            self.logger.info(f"Configuration backup created: {backup_name}")
+            self.logger.info("Configuration backup created: %s", backup_name)
             
         except Exception as e:
-            self.logger.error(f"Failed to create backup: {e}")
+            self.logger.error("Failed to create backup: %s", e)
     
-    def get_user_profiles(self) -> Dict[str, UserProfile]:
+    def get_user_profiles(self) -> Mapping[str, UserProfile]:
         """
         Get all user profiles.
         
+        Returns:
+            Mapping[str, UserProfile]: Read-only live view of profile names to UserProfile objects.
+        """
+        return MappingProxyType(self.profiles)
+    
+    def get_user_profiles_copy(self) -> Dict[str, UserProfile]:
+        """
+        Get a snapshot of all user profiles that the caller may modify.
+        
         Returns:
             Dict[str, UserProfile]: Dictionary of profile names to UserProfile objects.
         """
@@ -498,48 +884,51 @@ class ConfigManager:
         Returns:
             bool: True if created successfully, False otherwise.
         """
-        try:
-            if name in self.profiles:
-                self.logger.error(f"Profile '{name}' already exists")
+        with self._save_lock:
+            try:
+                if name in self.profiles:
+                    self.logger.error("Profile '%s' already exists", name)
+                    return False
+                
+                if copy_from and copy_from in self.profiles:
+                    # Copy from existing profile
+                    source_profile = self.profiles[copy_from]
+                    profile = UserProfile(
+                        name=name,
+                        description=description,
+                        # Settings and bindings are frozen, so the copy can share them;
+                        # only the hotkeys dict itself needs to be new
+                        audio_settings=source_profile.audio_settings,
+                        transcription_settings=source_profile.transcription_settings,
+                        ui_settings=source_profile.ui_settings,
+                        hotkeys=dict(source_profile.hotkeys),
+                        created_at=time.time(),
+                        last_used=time.time(),
+                        is_default=False
+                    )
+                else:
+                    # Create default profile
+                    profile = UserProfile(
+                        name=name,
+                        description=description,
+                        audio_settings=AudioSettings(),
+                        transcription_settings=TranscriptionSettings(),
+                        ui_settings=UISettings(),
+                        hotkeys={},
+                        created_at=time.time(),
+                        last_used=time.time(),
+                        is_default=False
+                    )
+                
+                self.profiles[name] = profile
+                self._mark_dirty()
+                
+                self.logger.info("Profile '%s' created successfully", name)
+                return True
+                
+            except Exception as e:
+                self.logger.error("Failed to create profile '%s': %s", name, e)
                 return False
-            
-            if copy_from and copy_from in self.profiles:
-                # Copy from existing profile
-                source_profile = self.profiles[copy_from]
-                profile = UserProfile(
-                    name=name,
-                    description=description,
-                    audio_settings=AudioSettings(**asdict(source_profile.audio_settings)),
-                    transcription_settings=TranscriptionSettings(**asdict(source_profile.transcription_settings)),
-                    ui_settings=UISettings(**asdict(source_profile.ui_settings)),
-                    hotkeys=source_profile.hotkeys.copy(),
-                    created_at=time.time(),
-                    last_used=time.time(),
-                    is_default=False
-                )
-            else:
-                # Create default profile
-                profile = UserProfile(
-                    name=name,
-                    description=description,
-                    audio_settings=AudioSettings(),
-                    transcription_settings=TranscriptionSettings(),
-                    ui_settings=UISettings(),
-                    hotkeys={},
-                    created_at=time.time(),
-                    last_used=time.time(),
-                    is_default=False
-                )
-            
-            self.profiles[name] = profile
-            self.save_config()
-            
-            self.logger.info(f"Profile '{name}' created successfully")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create profile '{name}': {e}")
-            return False
     
     def delete_profile(self, name: str) -> bool:
         """
@@ -551,36 +940,37 @@ class ConfigManager:
         Returns:
             bool: True if deleted successfully, False otherwise.
         """
-        try:
-            if name not in self.profiles:
-                self.logger.error(f"Profile '{name}' does not exist")
-                return False
-            
-            if self.profiles[name].is_default:
-                self.logger.error(f"Cannot delete default profile '{name}'")
-                return False
-            
-            # Switch to default profile if deleting current profile
-            if self.current_profile == name:
-                default_profiles = [n for n, p in self.profiles.items() if p.is_default and n != name]
-                if default_profiles:
-                    self.current_profile = default_profiles[0]
-                else:
-                    remaining = [n for n in self.profiles.keys() if n != name]
-                    if remaining:
-                        self.current_profile = remaining[0]
+        with self._save_lock:
+            try:
+                if name not in self.profiles:
+                    self.logger.error("Profile '%s' does not exist", name)
+                    return False
+                
+                if self.profiles.is_default(name):
+                    self.logger.error("Cannot delete default profile '%s'", name)
+                    return False
+                
+                # Switch to default profile if deleting current profile
+                if self.current_profile == name:
+                    default_profiles = [n for n, p in self.profiles.items() if p.is_default and n != name]
+                    if default_profiles:
+                        self.current_profile = default_profiles[0]
                     else:
-                        self.current_profile = None
-            
-            del self.profiles[name]
-            self.save_config()
-            
-            self.logger.info(f"Profile '{name}' deleted successfully")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to delete profile '{name}': {e}")
-            return False
+                        remaining = [n for n in self.profiles.keys() if n != name]
+                        if remaining:
+                            self.current_profile = remaining[0]
+                        else:
+                            self.current_profile = None
+                
+                del self.profiles[name]
+                self._mark_dirty()
+                
+                self.logger.info("Profile '%s' deleted successfully", name)
+                return True
+                
+            except Exception as e:
+                self.logger.error("Failed to delete profile '%s': %s", name, e)
+                return False
     
     def switch_profile(self, name: str) -> bool:
         """
@@ -592,23 +982,24 @@ class ConfigManager:
         Returns:
             bool: True if switched successfully, False otherwise.
         """
-        try:
-            if name not in self.profiles:
-                self.logger.error(f"Profile '{name}' does not exist")
+        with self._save_lock:
+            try:
+                if name not in self.profiles:
+                    self.logger.error("Profile '%s' does not exist", name)
+                    return False
+                
+                # Update last used timestamp for new profile
+                self.profiles[name].last_used = time.time()
+                
+                self.current_profile = name
+                self._mark_dirty()
+                
+                self.logger.info("Switched to profile '%s'", name)
+                return True
+                
+            except Exception as e:
+                self.logger.error("Failed to switch to profile '%s': %s", name, e)
                 return False
-            
-            # Update last used timestamp for new profile
-            self.profiles[name].last_used = time.time()
-            
-            self.current_profile = name
-            self.save_config()
-            
-            self.logger.info(f"Switched to profile '{name}'")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to switch to profile '{name}': {e}")
-            return False
     
     def validate_hotkeys(self) -> Dict[str, List[str]]:
         """
@@ -620,46 +1011,61 @@ class ConfigManager:
         conflicts = {"error": [], "warning": []}
         
         try:
-            # Collect all hotkeys from current profile and global hotkeys
-            all_hotkeys = {}
-            
-            # Add global hotkeys
-            for action, hotkey in self.hotkeys.items():
-                if hotkey.enabled:
-                    key_combo = hotkey.keys.lower()
-                    if key_combo in all_hotkeys:
-                        conflicts["error"].append(f"Duplicate global hotkey '{key_combo}': {all_hotkeys[key_combo]} vs {action}")
+            # The index covers the current profile only; rebuild after a switch
+            if self._combo_index_profile != self.current_profile:
+                self._rebuild_combo_index()
+            
+            for key_combo, owners in self._combo_index.items():
+                first = owners[0]
+                for owner in owners[1:]:
+                    if owner.startswith("global:"):
+                        conflicts["error"].append(f"Duplicate global hotkey '{key_combo}': {first} vs {owner[7:]}")
                     else:
-                        all_hotkeys[key_combo] = f"global:{action}"
-            
-            # Add current profile hotkeys
-            if self.current_profile and self.current_profile in self.profiles:
-                profile = self.profiles[self.current_profile]
-                for action, hotkey in profile.hotkeys.items():
-                    if hotkey.enabled:
-                        key_combo = hotkey.keys.lower()
-                        if key_combo in all_hotkeys:
-                            conflicts["error"].append(f"Duplicate hotkey '{key_combo}': {all_hotkeys[key_combo]} vs profile:{action}")
-                        else:
-                            all_hotkeys[key_combo] = f"profile:{action}"
-            
-            # Check for system hotkey conflicts (basic check)
-            system_hotkeys = [
-                "cmd+c", "cmd+v", "cmd+x", "cmd+z", "cmd+a", "cmd+s", "cmd+w", "cmd+q",
-                "cmd+tab", "cmd+space", "cmd+shift+3", "cmd+shift+4", "cmd+shift+5"
-            ]
-            
-            for key_combo in all_hotkeys:
-                if key_combo in system_hotkeys:
+                        conflicts["error"].append(f"Duplicate hotkey '{key_combo}': {first} vs {owner}")
+                
+                # Check for system hotkey conflicts (basic check)
+                if key_combo in self._SYSTEM_HOTKEYS:
                     conflicts["warning"].append(f"Hotkey '{key_combo}' conflicts with system shortcut")
             
-            self.logger.info(f"Hotkey validation complete. Found {len(conflicts['error'])} errors, {len(conflicts['warning'])} warnings")
+            self.logger.info("Hotkey validation complete. Found %s errors, %s warnings", len(conflicts['error']), len(conflicts['warning']))
             
         except Exception as e:
-            self.logger.error(f"Failed to validate hotkeys: {e}")
+            self.logger.error("Failed to validate hotkeys: %s", e)
         
         return conflicts
     
+    def _rebuild_combo_index(self):
+        """Rebuild the combo index from global hotkeys and the current profile's hotkeys."""
+        self._combo_index = {}
+        self._combo_index_profile = self.current_profile
+        
+        for action, hotkey in self.hotkeys.items():
+            self._index_binding(hotkey, f"global:{action}")
+        
+        if self.current_profile and self.current_profile in self.profiles:
+            for action, hotkey in self.profiles[self.current_profile].hotkeys.items():
+                self._index_binding(hotkey, f"profile:{action}")
+    
+    def _index_binding(self, hotkey: HotkeyBinding, owner: str):
+        """Add an enabled binding to the combo index, keeping global owners ahead of profile ones."""
+        if not hotkey.enabled:
+            return
+        
+        owners = self._combo_index.setdefault(hotkey.keys_lower, [])
+        if owner.startswith("global:"):
+            pos = next((i for i, o in enumerate(owners) if not o.startswith("global:")), len(owners))
+            owners.insert(pos, owner)
+        else:
+            owners.append(owner)
+    
+    def _unindex_binding(self, hotkey: HotkeyBinding, owner: str):
+        """Remove a binding from the combo index, dropping the combo once it has no owners."""
+        owners = self._combo_index.get(hotkey.keys_lower)
+        if owners and owner in owners:
+            owners.remove(owner)
+            if not owners:
+                del self._combo_index[hotkey.keys_lower]
+    
     def update_hotkey(self, action: str, keys: str, profile_name: Optional[str] = None) -> bool:
         """
         Update a hotkey binding.
@@ -672,48 +1078,60 @@ class ConfigManager:
         Returns:
             bool: True if updated successfully, False otherwise.
         """
-        try:
-            # Validate key combination format
-            if not self._validate_key_combination(keys):
-                self.logger.error(f"Invalid key combination: {keys}")
-                return False
-            
-            if profile_name:
-                # Update profile-specific hotkey
-                if profile_name not in self.profiles:
-                    self.logger.error(f"Profile '{profile_name}' does not exist")
+        with self._save_lock:
+            try:
+                # Validate key combination format
+                if not self._validate_key_combination(keys):
+                    self.logger.error("Invalid key combination: %s", keys)
                     return False
                 
-                if action in self.profiles[profile_name].hotkeys:
-                    self.profiles[profile_name].hotkeys[action].keys = keys
-                else:
-                    self.profiles[profile_name].hotkeys[action] = HotkeyBinding(
-                        action=action,
-                        keys=keys,
-                        description=f"Custom hotkey for {action}",
-                        enabled=True,
-                        global_scope=True
-                    )
-            else:
-                # Update global hotkey
-                if action in self.hotkeys:
-                    self.hotkeys[action].keys = keys
+                if profile_name:
+                    # Update profile-specific hotkey
+                    if profile_name not in self.profiles:
+                        self.logger.error("Profile '%s' does not exist", profile_name)
+                        return False
+                    
+                    profile_hotkeys = self.profiles[profile_name].hotkeys
+                    old = profile_hotkeys.get(action)
+                    if old is not None:
+                        new = profile_hotkeys[action] = replace(old, keys=keys)
+                    else:
+                        new = profile_hotkeys[action] = HotkeyBinding(
+                            action=action,
+                            keys=keys,
+                            description=f"Custom hotkey for {action}",
+                            enabled=True,
+                            global_scope=True
+                        )
+                    owner = f"profile:{action}" if profile_name == self._combo_index_profile else None
                 else:
-                    self.hotkeys[action] = HotkeyBinding(
-                        action=action,
-                        keys=keys,
-                        description=f"Global hotkey for {action}",
-                        enabled=True,
-                        global_scope=True
-                    )
-            
-            self.save_config()
-            self.logger.info(f"Hotkey updated: {action} -> {keys}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to update hotkey: {e}")
-            return False
+                    # Update global hotkey
+                    old = self.hotkeys.get(action)
+                    if old is not None:
+                        new = self.hotkeys[action] = replace(old, keys=keys)
+                    else:
+                        new = self.hotkeys[action] = HotkeyBinding(
+                            action=action,
+                            keys=keys,
+                            description=f"Global hotkey for {action}",
+                            enabled=True,
+                            global_scope=True
+                        )
+                    owner = f"global:{action}"
+                
+                # Move the binding from its old combo to the new one in the index
+                if owner is not None:
+                    if old is not None:
+                        self._unindex_binding(old, owner)
+                    self._index_binding(new, owner)
+                
+                self._mark_dirty()
+                self.logger.info("Hotkey updated: %s -> %s", action, keys)
+                return True
+                
+            except Exception as e:
+                self.logger.error("Failed to update hotkey: %s", e)
+                return False
     
     def _validate_key_combination(self, keys: str) -> bool:
         """
@@ -725,35 +1143,10 @@ class ConfigManager:
         Returns:
             bool: True if valid, False otherwise.
         """
-        try:
-            # Basic validation - should contain valid modifiers and keys
-            valid_modifiers = {"cmd", "ctrl", "alt", "shift", "option"}
-            valid_keys = {
-                "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m",
-                "n", "o", "p", "q", "r", "s", "t", "u", "v", "w", "x", "y", "z",
-                "0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
-                "space", "enter", "tab", "esc", "delete", "backspace",
-                "up", "down", "left", "right", "home", "end", "pageup", "pagedown",
-                "f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10", "f11", "f12"
-            }
-            
-            parts = keys.lower().split("+")
-            if len(parts) < 1:
-                return False
-            
-            # Last part should be a valid key
-            if parts[-1] not in valid_keys:
-                return False
-            
-            # All other parts should be valid modifiers
-            for modifier in parts[:-1]:
-                if modifier not in valid_modifiers:
-                    return False
-            
-            return True
-            
-        except Exception:
-            return False
+        # Basic validation - the last part should be a valid key and all
+        # other parts valid modifiers
+        parts = keys.lower().split("+")
+        return parts[-1] in _VALID_KEYS and all(part in _VALID_MODIFIERS for part in parts[:-1])
     
     def export_settings(self, file_path: str, include_profiles: bool = True) -> bool:
         """
@@ -771,34 +1164,20 @@ class ConfigManager:
                 "version": "1.0",
                 "export_timestamp": time.time(),
                 "config": self.config,
-                "hotkeys": {action: asdict(hotkey) for action, hotkey in self.hotkeys.items()}
+                "hotkeys": {action: hotkey.to_dict() for action, hotkey in self.hotkeys.items()}
             }
             
             if include_profiles:
-                profiles_data = {}
-                for name, profile in self.profiles.items():
-                    hotkeys_dict = {action: asdict(hotkey) for action, hotkey in profile.hotkeys.items()}
-                    profiles_data[name] = {
-                        "name": profile.name,
-                        "description": profile.description,
-                        "audio_settings": asdict(profile.audio_settings),
-                        "transcription_settings": asdict(profile.transcription_settings),
-                        "ui_settings": asdict(profile.ui_settings),
-                        "hotkeys": hotkeys_dict,
-                        "created_at": profile.created_at,
-                        "last_used": profile.last_used,
-                        "is_default": profile.is_default
-                    }
+                profiles_data = {name: _profile_to_dict(profile) for name, profile in self.profiles.items()}
                 export_data["profiles"] = profiles_data
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            _write_json(file_path, export_data)
             
-            self.logger.info(f"Settings exported to {file_path}")
+            self.logger.info("Settings exported to %s", file_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to export settings: {e}")
+            self.logger.error("Failed to export settings: %s", e)
             return False
     
     def import_settings(self, file_path: str, merge_profiles: bool = True) -> bool:
@@ -812,73 +1191,60 @@ class ConfigManager:
         Returns:
             bool: True if imported successfully, False otherwise.
         """
-        try:
-            if not Path(file_path).exists():
-                self.logger.error(f"Import file not found: {file_path}")
-                return False
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
-            
-            # Create backup before import
-            self._create_backup()
-            
-            # Import main config
-            if "config" in import_data:
-                # Validate imported config if jsonschema is available
-                if JSONSCHEMA_AVAILABLE:
-                    try:
-                        validate(instance=import_data["config"], schema=self.config_schema)
+        with self._save_lock:
+            try:
+                if not Path(file_path).exists():
+                    self.logger.error("Import file not found: %s", file_path)
+                    return False
+                
+                import_data = _read_json(file_path)
+                
+                # Create backup before import
+                self._create_backup()
+                
+                # Import main config
+                if "config" in import_data:
+                    # Validate imported config if jsonschema is available
+                    if JSONSCHEMA_AVAILABLE:
+                        try:
+                            self._validator.validate(import_data["config"])
+                            self.config.update(import_data["config"])
+                        except ValidationError as e:
+                            self.logger.warning("Imported config validation failed: %s", e.message)
+                            # Continue with merge but log validation issues
+                    else:
                         self.config.update(import_data["config"])
-                    except ValidationError as e:
-                        self.logger.warning(f"Imported config validation failed: {e.message}")
-                        # Continue with merge but log validation issues
-                else:
-                    self.config.update(import_data["config"])
-            
-            # Import hotkeys
-            if "hotkeys" in import_data:
-                for action, hotkey_dict in import_data["hotkeys"].items():
-                    self.hotkeys[action] = HotkeyBinding(**hotkey_dict)
-            
-            # Import profiles
-            if "profiles" in import_data:
-                for name, profile_dict in import_data["profiles"].items():
-                    if not merge_profiles and name in self.profiles:
-                        continue  # Skip existing profiles if not merging
-                    
-                    # Convert dict to UserProfile
-                    audio_settings = AudioSettings(**profile_dict['audio_settings'])
-                    transcription_settings = TranscriptionSettings(**profile_dict['transcription_settings'])
-                    ui_settings = UISettings(**profile_dict['ui_settings'])
-                    
-                    hotkeys = {}
-                    for action, hotkey_dict in profile_dict.get('hotkeys', {}).items():
-                        hotkeys[action] = HotkeyBinding(**hotkey_dict)
-                    
-                    profile = UserProfile(
-                        name=profile_dict['name'],
-                        description=profile_dict['description'],
-                        audio_settings=audio_settings,
-                        transcription_settings=transcription_settings,
-                        ui_settings=ui_settings,
-                        hotkeys=hotkeys,
-                        created_at=profile_dict['created_at'],
-                        last_used=profile_dict['last_used'],
-                        is_default=profile_dict.get('is_default', False)
-                    )
-                    
-                    self.profiles[name] = profile
-            
-            # Save imported configuration
-            self.save_config()
-            
-            self.logger.info(f"Settings imported from {file_path}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to import settings: {e}")
-            return False
+                
+                # Import hotkeys
+                if "hotkeys" in import_data:
+                    for action, hotkey_dict in import_data["hotkeys"].items():
+                        self.hotkeys[action] = HotkeyBinding(**hotkey_dict)
+                
+                # Import profiles
+                if "profiles" in import_data:
+                    for name, profile_dict in import_data["profiles"].items():
+                        if not merge_profiles and name in self.profiles:
+                            continue  # Skip existing profiles if not merging
+                        
+                        self.profiles[name] = _profile_from_dict(profile_dict)
+                
+                self._rebuild_combo_index()
+                
+                # Save imported configuration
+                self.save_config()
+                
+                self.logger.info("Settings imported from %s", file_path)
+                return True
+                
+            except Exception as e:
+                self.logger.error("Failed to import settings: %s", e)
+                return False
+    
+    def _config_section(self, section: str) -> Dict[str, Any]:
+        """Return a global config section, or a fresh copy of its defaults if it is missing."""
+        if section in self.config:
+            return self.config[section]
+        return dict(_DEFAULT_CONFIG_TEMPLATE[section])
     
     def get_current_settings(self) -> Dict[str, Any]:
         """
@@ -892,26 +1258,26 @@ class ConfigManager:
                 profile = self.profiles[self.current_profile]
                 return {
                     "profile_name": profile.name,
-                    "audio_settings": asdict(profile.audio_settings),
-                    "transcription_settings": asdict(profile.transcription_settings),
-                    "ui_settings": asdict(profile.ui_settings),
-                    "hotkeys": {action: asdict(hotkey) for action, hotkey in profile.hotkeys.items()},
-                    "global_hotkeys": {action: asdict(hotkey) for action, hotkey in self.hotkeys.items()},
-                    "advanced_settings": self.config.get("advanced_settings", asdict(AdvancedSettings()))
+                    "audio_settings": profile.audio_settings.to_dict(),
+                    "transcription_settings": profile.transcription_settings.to_dict(),
+                    "ui_settings": profile.ui_settings.to_dict(),
+                    "hotkeys": {action: hotkey.to_dict() for action, hotkey in profile.hotkeys.items()},
+                    "global_hotkeys": {action: hotkey.to_dict() for action, hotkey in self.hotkeys.items()},
+                    "advanced_settings": self._config_section("advanced_settings")
                 }
             else:
                 return {
                     "profile_name": None,
-                    "audio_settings": self.config.get("audio_settings", asdict(AudioSettings())),
-                    "transcription_settings": self.config.get("transcription_settings", asdict(TranscriptionSettings())),
-                    "ui_settings": self.config.get("ui_settings", asdict(UISettings())),
+                    "audio_settings": self._config_section("audio_settings"),
+                    "transcription_settings": self._config_section("transcription_settings"),
+                    "ui_settings": self._config_section("ui_settings"),
                     "hotkeys": {},
-                    "global_hotkeys": {action: asdict(hotkey) for action, hotkey in self.hotkeys.items()},
-                    "advanced_settings": self.config.get("advanced_settings", asdict(AdvancedSettings()))
+                    "global_hotkeys": {action: hotkey.to_dict() for action, hotkey in self.hotkeys.items()},
+                    "advanced_settings": self._config_section("advanced_settings")
                 }
                 
         except Exception as e:
-            self.logger.error(f"Failed to get current settings: {e}")
+            self.logger.error("Failed to get current settings: %s", e)
             return {}
     
     def update_setting(self, setting_path: str, value: Any, profile_name: Optional[str] = None) -> bool:
@@ -926,52 +1292,48 @@ class ConfigManager:
         Returns:
             bool: True if updated successfully, False otherwise.
         """
-        try:
-            path_parts = setting_path.split(".")
-            
-            if profile_name:
-                # Update profile-specific setting
-                if profile_name not in self.profiles:
-                    self.logger.error(f"Profile '{profile_name}' does not exist")
-                    return False
+        with self._save_lock:
+            try:
+                path_parts = setting_path.split(".")
                 
-                target = self.profiles[profile_name]
-                # Navigate to the correct settings object
-                if path_parts[0] == "audio_settings":
-                    target = target.audio_settings
-                elif path_parts[0] == "transcription_settings":
-                    target = target.transcription_settings
-                elif path_parts[0] == "ui_settings":
-                    target = target.ui_settings
+                if profile_name:
+                    # Update profile-specific setting
+                    if profile_name not in self.profiles:
+                        self.logger.error("Profile '%s' does not exist", profile_name)
+                        return False
+                    
+                    profile = self.profiles[profile_name]
+                    # Navigate to the correct settings object
+                    if path_parts[0] not in ("audio_settings", "transcription_settings", "ui_settings"):
+                        self.logger.error("Invalid setting path: %s", setting_path)
+                        return False
+                    target = getattr(profile, path_parts[0])
+                    
+                    # Update the value; settings are frozen, so swap in an updated copy
+                    if len(path_parts) == 2 and path_parts[1] in target.__dataclass_fields__:
+                        setattr(profile, path_parts[0], replace(target, **{path_parts[1]: value}))
+                    else:
+                        self.logger.error("Invalid setting path: %s", setting_path)
+                        return False
                 else:
-                    self.logger.error(f"Invalid setting path: {setting_path}")
-                    return False
+                    # Update global setting
+                    if path_parts[0] not in self.config:
+                        self.config[path_parts[0]] = {}
+                    
+                    target = self.config[path_parts[0]]
+                    if len(path_parts) == 2:
+                        target[path_parts[1]] = value
+                    else:
+                        self.logger.error("Invalid setting path: %s", setting_path)
+                        return False
                 
-                # Update the value
-                if len(path_parts) == 2 and hasattr(target, path_parts[1]):
-                    setattr(target, path_parts[1], value)
-                else:
-                    self.logger.error(f"Invalid setting path: {setting_path}")
-                    return False
-            else:
-                # Update global setting
-                if path_parts[0] not in self.config:
-                    self.config[path_parts[0]] = {}
+                self._mark_dirty()
+                self.logger.info("Setting updated: %s = %s", setting_path, value)
+                return True
                 
-                target = self.config[path_parts[0]]
-                if len(path_parts) == 2:
-                    target[path_parts[1]] = value
-                else:
-                    self.logger.error(f"Invalid setting path: {setting_path}")
-                    return False
-            
-            self.save_config()
-            self.logger.info(f"Setting updated: {setting_path} = {value}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to update setting '{setting_path}': {e}")
-            return False
+            except Exception as e:
+                self.logger.error("Failed to update setting '%s': %s", setting_path, e)
+                return False
     
     def reset_to_defaults(self, profile_name: Optional[str] = None) -> bool:
         """
@@ -983,32 +1345,34 @@ class ConfigManager:
         Returns:
             bool: True if reset successfully, False otherwise.
         """
-        try:
-            # Create backup before reset
-            self._create_backup()
-            
-            if profile_name:
-                # Reset specific profile
-                if profile_name not in self.profiles:
-                    self.logger.error(f"Profile '{profile_name}' does not exist")
-                    return False
+        with self._save_lock:
+            try:
+                # Create backup before reset
+                self._create_backup()
                 
-                self.profiles[profile_name].audio_settings = AudioSettings()
-                self.profiles[profile_name].transcription_settings = TranscriptionSettings()
-                self.profiles[profile_name].ui_settings = UISettings()
+                if profile_name:
+                    # Reset specific profile
+                    if profile_name not in self.profiles:
+                        self.logger.error("Profile '%s' does not exist", profile_name)
+                        return False
+                    
+                    self.profiles[profile_name].audio_settings = AudioSettings()
+                    self.profiles[profile_name].transcription_settings = TranscriptionSettings()
+                    self.profiles[profile_name].ui_settings = UISettings()
+                    
+                else:
+                    # Reset global configuration
+                    self.config = self._create_default_config()
+                    self.hotkeys.clear()
+                    self._rebuild_combo_index()
                 
-            else:
-                # Reset global configuration
-                self.config = self._create_default_config()
-                self.hotkeys.clear()
-            
-            self.save_config()
-            self.logger.info(f"Configuration reset to defaults: {'profile ' + profile_name if profile_name else 'global'}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to reset configuration: {e}")
-            return False
+                self.save_config()
+                self.logger.info("Configuration reset to defaults: %s", 'profile ' + profile_name if profile_name else 'global')
+                return True
+                
+            except Exception as e:
+                self.logger.error("Failed to reset configuration: %s", e)
+                return False
 
 
 # Example usage and testing
@@ -1039,4 +1403,7 @@ if __name__ == "__main__":
         config_manager.export_settings(str(export_path))
         print(f"✅ Settings exported to {export_path}")
         
+        # Write out debounced edits before the temp directory goes away
+        config_manager.close()
+        
         print("🎉 All configuration tests passed!") 
\ No newline at end of file
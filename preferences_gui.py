@@ -846,7 +846,8 @@ class PreferencesGUI:
         """Refresh the profiles dropdown."""
         try:
             profiles = self.config_manager.get_user_profiles()
-            profile_names = list(profiles.keys())
+            # items() leaves out profiles that fail to load
+            profile_names = [name for name, _ in profiles.items()]
             
             self.profile_combo['values'] = profile_names
             
@@ -862,9 +863,8 @@ class PreferencesGUI:
         """Update profile details display."""
         try:
             profiles = self.config_manager.get_user_profiles()
-            if profile_name in profiles:
-                profile = profiles[profile_name]
-                
+            profile = profiles.get(profile_name)
+            if profile is not None:
                 details = f"Name: {profile.name}\n"
                 details += f"Description: {profile.description}\n"
                 details += f"Created: {profile.created_at}\n"
@@ -872,15 +872,15 @@ class PreferencesGUI:
                 details += f"Is Default: {profile.is_default}\n\n"
                 
                 details += "Audio Settings:\n"
-                for key, value in profile.audio_settings.__dict__.items():
+                for key, value in profile.audio_settings.to_dict().items():
                     details += f"  {key}: {value}\n"
                 
                 details += "\nTranscription Settings:\n"
-                for key, value in profile.transcription_settings.__dict__.items():
+                for key, value in profile.transcription_settings.to_dict().items():
                     details += f"  {key}: {value}\n"
                 
                 details += "\nUI Settings:\n"
-                for key, value in profile.ui_settings.__dict__.items():
+                for key, value in profile.ui_settings.to_dict().items():
                     details += f"  {key}: {value}\n"
                 
                 details += f"\nHotkeys: {len(profile.hotkeys)} configured\n"
@@ -1188,6 +1188,7 @@ def main():
         config_manager = ConfigManager(temp_dir)
         preferences_gui = PreferencesGUI(config_manager)
         preferences_gui.show()
+        config_manager.close()
 
 
 if __name__ == "__main__":
@@ -81,6 +81,9 @@ def main():
             print(f"   Audio noise reduction: {current_settings.get('audio_settings', {}).get('noise_reduction_level')}")
             print(f"   Transcription confidence: {current_settings.get('transcription_settings', {}).get('confidence_threshold')}")
             
+            # Write out pending edits before the temp directory goes away
+            config_manager.close()
+            
         print("\n🎉 ConfigManager tests completed successfully!")
         
     except ImportError as e:
@@ -11,10 +11,12 @@ import os
 import shutil
 import logging
 from pathlib import Path
+from unittest import mock
 from typing import Dict, Any
 
 # Import the modules to test
 try:
+    import config_manager as config_manager_module
     from config_manager import (
         ConfigManager, AudioSettings, TranscriptionSettings, 
         UISettings, AdvancedSettings, UserProfile, HotkeyBinding
@@ -37,6 +39,7 @@ class TestConfigManager(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
+        self.config_manager.close()
         shutil.rmtree(self.test_dir)
     
     def test_initialization(self):
@@ -133,6 +136,36 @@ class TestConfigManager(unittest.TestCase):
         conflicts = self.config_manager.validate_hotkeys()
         self.assertGreater(len(conflicts['error']), 0)
     
+    def test_combo_index_tracks_updates(self):
+        """Test that rebinding a hotkey moves it in the conflict index."""
+        self.config_manager.update_hotkey("action1", "ctrl+shift+7")
+        self.config_manager.update_hotkey("action2", "ctrl+shift+7")
+        
+        errors = self.config_manager.validate_hotkeys()['error']
+        self.assertTrue(any("ctrl+shift+7" in e for e in errors))
+        
+        # Moving action2 away clears the duplicate without a rebuild
+        self.config_manager.update_hotkey("action2", "ctrl+shift+8")
+        errors = self.config_manager.validate_hotkeys()['error']
+        self.assertFalse(any("ctrl+shift+7" in e or "ctrl+shift+8" in e for e in errors))
+        
+        # The incrementally maintained index matches a full rebuild
+        index = {combo: list(owners) for combo, owners in self.config_manager._combo_index.items()}
+        self.config_manager._rebuild_combo_index()
+        self.assertEqual(index, self.config_manager._combo_index)
+    
+    def test_combo_index_follows_profile_switch(self):
+        """Test that profile hotkeys only conflict while their profile is current."""
+        self.assertTrue(self.config_manager.create_profile("home", "Home profile"))
+        self.assertTrue(self.config_manager.create_profile("work", "Work profile"))
+        self.config_manager.update_hotkey("global_action", "ctrl+shift+9")
+        self.config_manager.update_hotkey("profile_action", "ctrl+shift+9", "work")
+        
+        for profile, conflicting in (("home", False), ("work", True), ("home", False)):
+            self.assertTrue(self.config_manager.switch_profile(profile))
+            errors = self.config_manager.validate_hotkeys()['error']
+            self.assertEqual(any("ctrl+shift+9" in e for e in errors), conflicting, profile)
+    
     def test_key_validation(self):
         """Test key combination validation."""
         # Valid key combinations
@@ -172,6 +205,133 @@ class TestConfigManager(unittest.TestCase):
         # Verify import
         imported_profiles = new_config_manager.get_user_profiles()
         self.assertIn('export_test', imported_profiles)
+    
+    def test_unchanged_save_skips_write(self):
+        """Test that saving an unchanged configuration after a reload writes nothing."""
+        self.config_manager.create_profile("unchanged", "Unchanged profile")
+        self.config_manager.switch_profile("unchanged")
+        self.assertTrue(self.config_manager.flush())
+        
+        new_config_manager = ConfigManager(self.test_dir)
+        files = [new_config_manager.main_config_file, new_config_manager.profiles_file, new_config_manager.hotkeys_file]
+        inodes = [os.stat(path).st_ino for path in files if path.exists()]
+        
+        with mock.patch.object(new_config_manager, '_create_backup') as create_backup:
+            self.assertTrue(new_config_manager.save_config())
+        create_backup.assert_not_called()
+        self.assertEqual([os.stat(path).st_ino for path in files if path.exists()], inodes)
+    
+    def test_changed_files_backed_up_together(self):
+        """Test that every file changed by one save goes into a single backup."""
+        self.config_manager.flush()
+        self.config_manager.create_profile("snapshot", "Snapshot profile")
+        self.config_manager.update_hotkey("snapshot_action", "ctrl+k")
+        
+        with mock.patch.object(self.config_manager, '_create_backup') as create_backup:
+            self.assertTrue(self.config_manager.flush())
+        create_backup.assert_called_once()
+        backed_up = set(create_backup.call_args.args[0])
+        self.assertIn(self.config_manager.profiles_file, backed_up)
+        self.assertIn(self.config_manager.hotkeys_file, backed_up)
+    
+    def test_debounced_save(self):
+        """Test that mutators defer saving until flush and that close unregisters the manager."""
+        self.config_manager.flush()
+        self.config_manager.create_profile("debounced", "Debounced profile")
+        self.assertTrue(self.config_manager._dirty)
+        
+        with open(self.config_manager.profiles_file, 'r') as f:
+            self.assertNotIn("debounced", json.load(f))
+        
+        self.assertTrue(self.config_manager.flush())
+        self.assertFalse(self.config_manager._dirty)
+        with open(self.config_manager.profiles_file, 'r') as f:
+            self.assertIn("debounced", json.load(f))
+        
+        self.assertIn(self.config_manager, config_manager_module._OPEN_MANAGERS)
+        self.config_manager.close()
+        self.assertNotIn(self.config_manager, config_manager_module._OPEN_MANAGERS)
+    
+    def test_failed_save_stays_dirty(self):
+        """Test that a save which fails part way keeps the changes pending."""
+        self.config_manager.create_profile("retry", "Retry profile")
+        profiles_file = self.config_manager.profiles_file
+        self.config_manager.profiles_file = Path(self.test_dir) / "missing" / "profiles.json"
+        
+        self.assertFalse(self.config_manager.flush())
+        self.assertTrue(self.config_manager._dirty)
+        
+        self.config_manager.profiles_file = profiles_file
+        self.assertTrue(self.config_manager.flush())
+        with open(profiles_file, 'r') as f:
+            self.assertIn("retry", json.load(f))
+    
+    def test_failed_timed_save_is_retried(self):
+        """Test that a debounced save which fails is scheduled again."""
+        self.config_manager.create_profile("timed", "Timed profile")
+        
+        with mock.patch.object(config_manager_module, 'SAVE_RETRY_SECONDS', 0.05), \
+             mock.patch.object(self.config_manager, 'save_config', side_effect=[False, True]) as save_config:
+            self.config_manager._flush_on_timer()
+            self.assertTrue(self.config_manager._dirty)
+            self.assertIsNotNone(self.config_manager._save_timer)
+            
+            self.config_manager._save_timer.join(timeout=2)
+            self.assertEqual(save_config.call_count, 2)
+            self.assertFalse(self.config_manager._dirty)
+    
+    def test_lazy_profiles_save_unread(self):
+        """Test that profiles never read since loading are saved back unchanged."""
+        self.config_manager.create_profile("lazy_profile", "Lazy profile")
+        self.assertTrue(self.config_manager.flush())
+        
+        new_config_manager = ConfigManager(self.test_dir)
+        self.assertIsNotNone(new_config_manager.profiles.raw("lazy_profile"))
+        self.assertTrue(new_config_manager.save_config())
+        
+        with open(new_config_manager.profiles_file, 'r') as f:
+            saved = json.load(f)
+        self.assertEqual(saved["lazy_profile"]["description"], "Lazy profile")
+        
+        # Copies go through __getitem__ and so never expose unbuilt entries
+        for profile in dict(new_config_manager.profiles).values():
+            self.assertIsInstance(profile, UserProfile)
+        self.assertIsNone(new_config_manager.profiles.raw("lazy_profile"))
+    
+    def test_malformed_profile_is_kept(self):
+        """Test that a profile that fails to build is skipped by reads but kept on save."""
+        self.config_manager.flush()
+        with open(self.config_manager.profiles_file, 'r') as f:
+            profiles_data = json.load(f)
+        profiles_data["broken"] = {"name": "broken", "description": "No settings"}
+        with open(self.config_manager.profiles_file, 'w') as f:
+            json.dump(profiles_data, f)
+        
+        new_config_manager = ConfigManager(self.test_dir)
+        with self.assertRaises(KeyError):
+            new_config_manager.profiles["broken"]
+        self.assertIsNotNone(new_config_manager.profiles.raw("broken"))
+        
+        # Full reads skip the malformed entry instead of failing
+        self.assertIsNone(new_config_manager.profiles.get("broken"))
+        self.assertNotIn("broken", dict(new_config_manager.profiles.items()))
+        self.assertNotIn("broken", new_config_manager.get_user_profiles_copy())
+        self.assertEqual(len(new_config_manager.profiles.values()), len(profiles_data) - 1)
+        
+        export_file = Path(self.test_dir) / "export.json"
+        self.assertTrue(new_config_manager.export_settings(str(export_file)))
+        with open(export_file, 'r') as f:
+            self.assertNotIn("broken", json.load(f)["profiles"])
+        
+        self.assertTrue(new_config_manager.create_profile("after_broken", "Created after"))
+        self.assertTrue(new_config_manager.create_profile("deleted", "Deleted again"))
+        self.assertTrue(new_config_manager.delete_profile("deleted"))
+        self.assertTrue(new_config_manager.flush())
+        
+        with open(new_config_manager.profiles_file, 'r') as f:
+            saved = json.load(f)
+        self.assertEqual(saved["broken"], profiles_data["broken"])
+        self.assertIn("after_broken", saved)
 
 
 def main():
@@ -11,6 +11,7 @@ import time
 import threading
 import os
 import json
+import gzip
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -18,6 +19,9 @@ from unittest.mock import Mock, patch, MagicMock
 try:
     from performance_monitor import PerformanceMonitor, CacheManager, PerformanceMetrics, OptimizationSettings
     from benchmark_suite import PerformanceBenchmarkSuite, SystemBenchmark, AudioBenchmark, HotkeyBenchmark
+    import benchmark_suite
+    import audio_processor
+    import audio_recorder
 except ImportError as e:
     print(f"Warning: Could not import performance modules: {e}")
 
@@ -272,7 +276,10 @@ class TestHotkeyBenchmark(unittest.TestCase):
         
         self.assertEqual(result.test_name, "Hotkey Latency Test")
         self.assertGreater(result.duration, 0)
-        self.assertEqual(len(result.cpu_usage), 5)  # One reading per iteration
+        # Sampled in the background, with a final sample on stop
+        self.assertGreater(len(result.cpu_usage), 0)
+        self.assertEqual(len(result.cpu_usage), len(result.memory_usage))
+        self.assertEqual(len(result.cpu_usage), result.cpu_stats.n)
         self.assertEqual(result.success_rate, 1.0)
         self.assertEqual(result.error_count, 0)
         self.assertIn("avg", result.latency_stats)
@@ -305,8 +312,7 @@ class TestAudioBenchmark(unittest.TestCase):
         self.mock_recorder.start_recording.return_value = "/tmp/test.wav"
         self.mock_recorder.stop_recording.return_value = "/tmp/test.wav"
         
-        with patch('os.path.exists', return_value=True), \
-             patch('os.remove'):
+        with patch('pathlib.Path.unlink'):
             
             result = self.benchmark.run_recording_latency_test(iterations=2)
             
@@ -426,6 +432,198 @@ class TestPerformanceBenchmarkSuite(unittest.TestCase):
             saved_data = json.load(f)
         
         self.assertEqual(saved_data["total_duration"], 10.0)
+    
+    def test_compressed_baseline_round_trip(self):
+        """Test that a gzipped results file loads back as a regression baseline."""
+        summary = {
+            "timestamp": "2023-01-01T00:00:00",
+            "total_duration": 10.0,
+            "results": {"Test": {"latency_stats": {"avg": 25.0}, "success_rate": 1.0}}
+        }
+        
+        suite = PerformanceBenchmarkSuite(log_dir=self.temp_dir, compress=True)
+        suite._save_results(summary)
+        
+        compressed = list(Path(self.temp_dir).glob("benchmark_results_*.json.gz"))
+        self.assertEqual(len(compressed), 1)
+        with gzip.open(compressed[0], 'rb') as f:
+            self.assertEqual(json.loads(f.read()), summary)
+        
+        # The gzipped file is accepted as a baseline as-is
+        with patch.object(suite, 'run_full_benchmark_suite', return_value=summary), \
+             patch.object(suite, '_compare_with_baseline', side_effect=lambda current, baseline: baseline):
+            baseline = suite.run_performance_regression_test(str(compressed[0]))
+        
+        self.assertEqual(baseline, summary)
+
+
+class TestLatencySummary(unittest.TestCase):
+    """Test cases for benchmark latency summaries."""
+    
+    def test_empty_latencies(self):
+        """Test that no samples give an empty summary."""
+        self.assertEqual(benchmark_suite._latency_summary([]), {})
+    
+    def test_summary_values(self):
+        """Test min/max/avg and interpolated percentiles on both code paths."""
+        latencies = [float(100 - i) for i in range(100)]  # Unsorted input
+        expected = {"min": 1.0, "max": 100.0, "avg": 50.5, "p95": 95.05, "p99": 99.01}
+        
+        for numpy_available in sorted({False, benchmark_suite.NUMPY_AVAILABLE}):
+            with patch.object(benchmark_suite, 'NUMPY_AVAILABLE', numpy_available):
+                stats = benchmark_suite._latency_summary(latencies)
+            
+            self.assertEqual(set(stats), set(expected))
+            for key, value in expected.items():
+                self.assertAlmostEqual(stats[key], value, places=6, msg=key)
+    
+    def test_single_sample(self):
+        """Test that one sample is every statistic."""
+        stats = benchmark_suite._latency_summary([4.0])
+        self.assertEqual(set(stats.values()), {4.0})
+
+
+class TestVoiceActivityKernel(unittest.TestCase):
+    """Test cases for whole-buffer voice activity detection."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Skip here rather than in a decorator, which would need the module at import
+        if not audio_processor.NUMPY_AVAILABLE:
+            self.skipTest("NumPy not available")
+        import numpy as np
+        self.np = np
+        self.rate = 16000
+        self.vad = audio_processor.VoiceActivityDetector("sox")
+    
+    def _buffer(self, *segments):
+        """Build int16 audio from (seconds, amplitude) segments of a 440 Hz tone."""
+        np = self.np
+        parts = []
+        for seconds, amplitude in segments:
+            t = np.arange(int(seconds * self.rate)) / self.rate
+            parts.append(amplitude * np.sin(2 * np.pi * 440 * t))
+        return (np.concatenate(parts) * 32767).astype(np.int16)
+    
+    def test_stop_after_speech_and_silence(self):
+        """Test that speech followed by enough silence stops recording."""
+        x = self._buffer((1.0, 0.3), (2.0, 0.0))
+        self.assertTrue(self.vad.should_stop_buffer(x, self.rate))
+        self.assertTrue(self.vad.is_speech_detected)
+    
+    def test_no_stop_without_enough_silence(self):
+        """Test that silence shorter than max_silence_duration keeps recording."""
+        x = self._buffer((1.0, 0.3), (1.0, 0.0))
+        self.assertFalse(self.vad.should_stop_buffer(x, self.rate))
+        self.assertTrue(self.vad.is_speech_detected)
+    
+    def test_no_stop_on_silence_only(self):
+        """Test that silence without speech never stops recording."""
+        x = self._buffer((3.0, 0.001))
+        self.assertFalse(self.vad.should_stop_buffer(x, self.rate))
+        self.assertFalse(self.vad.is_speech_detected)
+    
+    def test_float_samples(self):
+        """Test that float buffers are classified like their int16 equivalent."""
+        x = self._buffer((1.0, 0.3), (2.0, 0.0))
+        self.assertTrue(self.vad.should_stop_buffer(x.astype(self.np.float32) / 32768.0, self.rate))
+    
+    def test_compiled_kernel_matches_python(self):
+        """Test that the compiled kernel agrees with the same code run as Python."""
+        if not audio_processor.NUMBA_AVAILABLE:
+            self.skipTest("Numba not available")
+        rng = self.np.random.default_rng(0)
+        win = self.rate // 20
+        buffers = [
+            self._buffer((1.0, 0.3), (2.0, 0.0)),
+            self._buffer((0.5, 0.0), (1.0, 0.2), (1.0, 0.002), (1.0, 0.2)),
+            self._buffer((3.0, 0.001)),
+            (rng.standard_normal(3 * self.rate) * 2000).astype(self.np.int16),
+        ]
+        
+        for x in buffers:
+            args = (x, win, win, 0.01, self.rate // 2, int(1.5 * self.rate))
+            self.assertEqual(audio_processor._vad_segment(*args),
+                             audio_processor._vad_segment.py_func(*args))
+
+
+class TestRecorderBackend(unittest.TestCase):
+    """Test cases for AudioRecorder capture backend selection."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _fake_sounddevice(self, delivers=True):
+        """Build a stand-in sounddevice module whose input stream calls back once on entry."""
+        class FakeInputStream:
+            def __init__(self, callback=None, **kwargs):
+                self.callback = callback
+                self.active = False
+            
+            def __enter__(self):
+                if delivers:
+                    self.callback(None, 1600, None, None)
+                return self
+            
+            def __exit__(self, *exc_info):
+                return False
+        
+        sd = MagicMock()
+        sd.PortAudioError = type("PortAudioError", (Exception,), {})
+        sd.InputStream = FakeInputStream
+        return sd
+    
+    def test_sox_fallback_without_sounddevice(self):
+        """Test that SoX is used when sounddevice is unavailable."""
+        with patch.object(audio_recorder, 'SOUNDDEVICE_AVAILABLE', False), \
+             patch.object(audio_recorder.AudioRecorder, 'check_dependencies', return_value=True) as check, \
+             patch.object(audio_recorder.AudioRecorder, 'test_microphone_access', return_value=True) as probe:
+            recorder = audio_recorder.AudioRecorder(temp_dir=self.temp_dir)
+            recorder._mic_probe_thread.join(timeout=5)
+        
+        self.assertIs(recorder.backend, audio_recorder._Backend.SOX)
+        check.assert_called_once()
+        probe.assert_called_once()
+    
+    def test_sounddevice_backend_skips_sox(self):
+        """Test that the sounddevice backend needs neither SoX nor an open stream."""
+        sd = self._fake_sounddevice()
+        with patch.object(audio_recorder, 'SOUNDDEVICE_AVAILABLE', True), \
+             patch.object(audio_recorder, 'sd', sd, create=True), \
+             patch.object(audio_recorder.AudioRecorder, 'check_dependencies') as check:
+            recorder = audio_recorder.AudioRecorder(temp_dir=self.temp_dir, prewarm=True)
+            
+            self.assertIs(recorder.backend, audio_recorder._Backend.SOUNDDEVICE)
+            self.assertIsNone(recorder.sox_path)
+            self.assertIsNone(recorder.stream)  # Opened by the first recording, not here
+            check.assert_not_called()
+            
+            # The microphone probe goes through PortAudio, not SoX
+            self.assertTrue(recorder.test_microphone_access())
+            sd.check_input_settings.assert_called_once()
+    
+    def test_sounddevice_probe_failures(self):
+        """Test that a rejected or silent input device fails the probe."""
+        sd = self._fake_sounddevice()
+        sd.check_input_settings.side_effect = sd.PortAudioError("denied")
+        with patch.object(audio_recorder, 'SOUNDDEVICE_AVAILABLE', True), \
+             patch.object(audio_recorder, 'sd', sd, create=True):
+            recorder = audio_recorder.AudioRecorder(temp_dir=self.temp_dir)
+            self.assertFalse(recorder.test_microphone_access())
+            self.assertFalse(recorder._mic_access_ok)
+        
+        sd = self._fake_sounddevice(delivers=False)
+        with patch.object(audio_recorder, 'SOUNDDEVICE_AVAILABLE', True), \
+             patch.object(audio_recorder, 'sd', sd, create=True):
+            recorder = audio_recorder.AudioRecorder(temp_dir=self.temp_dir)
+            self.assertFalse(recorder._test_stream_access(timeout=0.05))
+            self.assertFalse(recorder._mic_access_ok)
 
 
 class TestPerformanceIntegration(unittest.TestCase):
@@ -504,6 +702,9 @@ def run_performance_tests():
         TestHotkeyBenchmark,
         TestAudioBenchmark,
         TestPerformanceBenchmarkSuite,
+        TestLatencySummary,
+        TestVoiceActivityKernel,
+        TestRecorderBackend,
         TestPerformanceIntegration
     ]
     